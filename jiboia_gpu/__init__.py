@@ -1,5 +1,6 @@
 
 from .boolean.boolean_utils import BooleanUtils
+from .utils.cardinality_utils import HyperLogLog
 from .utils.csv_utils import CsvUtils
 from .utils.chunk_utils import (
     chunk_df,
@@ -8,8 +9,10 @@ from .utils.chunk_utils import (
 )
 from .dataframe.df_utils import DfUtils
 from .datetime.datetime_utils import DateTimeUtils
+from .utils.memory_utils import MemoryManager
 from .null.null_utils import NullUtils
 from .number.number_utils import NumberUtils
+from .utils.profile_utils import NormalizeProfiler
 from .string.string_utils import StringUtils
 from .time.time_utils import TimeUtils
 from typing import Literal
@@ -75,6 +78,9 @@ time = TimeUtils()
 __all__ = [
     "jiboia_gpu",
     "JiboiaGPU",
+    "HyperLogLog",
+    "MemoryManager",
+    "NormalizeProfiler",
     "bool",
     "csv",
     "dt",
@@ -1,13 +1,13 @@
 import cudf
+import cupy as cp
 from .regex_pattern import (
-    regex_pattern_boolean,
-    regex_pattern_boolean_raw,
+    boolean_vocabulary,
     regex_pattern_boolean_numeric_raw
 )
 from ..utils.chunk_utils import chunk_iterate
 from ..utils.log_utils import print_log
-from ..string.string_utils import StringUtils
-from ..utils.str_utils import combine_regex
+from ..utils.profile_utils import record_scan
+from ..utils.translate_utils import ACCENT_FOLDING_TABLE
 from ..utils.validation_utils import (
     CudfSupportedDtypes,
     is_valid_to_normalize
@@ -21,6 +21,8 @@ class BooleanUtils:
         column_name: str,
         bool_number: bool=False,
         match_min_rate: int=50,
+        locales: None|list[str]=None,
+        vocabulary: None|dict[str, bool]=None,
         inplace: None|bool=False,
         show_log: None|bool=True,
         chunk_size: int=500_000
@@ -69,6 +71,8 @@ class BooleanUtils:
             dataframe=dataframe,
             column_name=column_name,
             match_min_rate=match_min_rate,
+            locales=locales,
+            vocabulary=vocabulary,
             inplace=True,
             show_log=show_log,
             chunk_size=chunk_size
@@ -153,11 +157,8 @@ class BooleanUtils:
         if not inplace:
             dataframe: cudf.DataFrame = dataframe.copy()
 
-        mapping_dict = {1: True, 0: False}
-
-        dataframe[column_name] = (
-            dataframe[column_name].astype("string").str.lower().map(mapping_dict)
-        )
+        # Conversão direta: 0 -> False, 1 -> True, nulos preservados pela máscara
+        dataframe[column_name] = dataframe[column_name].astype("bool")
 
         print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
         
@@ -172,10 +173,25 @@ class BooleanUtils:
         dataframe: cudf.DataFrame,
         column_name: str,
         match_min_rate: int=50,
+        locales: None|list[str]=None,
+        vocabulary: None|dict[str, bool]=None,
         inplace: None|bool=False,
         show_log: None|bool=True,
         chunk_size: int=500_000
     ) -> bool|cudf.DataFrame:
+        """
+        Converte strings booleanas ('true', 'No', 'SIM', 'não') para boolean.
+
+        A taxa de correspondência e a coluna convertida saem da mesma busca
+        no vocabulário (`lookup_bool`), interrompida assim que a taxa mínima
+        não pode mais ser atingida. Valores fora do vocabulário viram nulos.
+
+        Args:
+            locales (None|list[str]): Idiomas de `boolean_vocabulary`
+                (padrão: ["en"]).
+            vocabulary (None|dict[str, bool]): Termos adicionais, em minúsculas
+                e sem acentos. Ex.: {"ativo": True, "inativo": False}.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=dataframe[column_name],
             valid_types=CudfSupportedDtypes.str_types,
@@ -183,47 +199,157 @@ class BooleanUtils:
 
         if not is_valid:
             return False
-        
-        if not inplace:
-            dataframe: cudf.DataFrame = dataframe.copy()
 
-        is_bool: bool = BooleanUtils.is_bool(
+        values: None|cudf.Series = BooleanUtils.lookup_bool(
             series=dataframe[column_name],
+            vocabulary=BooleanUtils.get_vocabulary(locales, vocabulary),
             match_min_rate=match_min_rate,
             chunk_size=chunk_size
         )
 
+        if values is None:
+            return False
+
+        match_rate: int = BooleanUtils.get_match_rate(dataframe[column_name], values)
+
+        # Com match_min_rate=0 ainda é exigida ao menos uma correspondência
+        is_bool: bool = match_rate > 0 and match_rate >= match_min_rate
+
         if not is_bool:
             return False
 
-        mapping_dict: dict[str, str] = {}
-        for pattern in regex_pattern_boolean:
-            for fmt in pattern["format"]:
-                mapping_dict[fmt] = pattern["pattern"]
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
+
+        dataframe[column_name] = values
+
+        print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
 
-        total_rows: int = len(dataframe)
-        column_index: int = dataframe.columns.get_loc(column_name)
+        if not inplace:
+            return dataframe
+
+        return True
+
+
+    @staticmethod
+    def get_vocabulary(
+        locales: None|list[str]=None,
+        vocabulary: None|dict[str, bool]=None
+    ) -> dict[str, bool]:
+        """
+        Combina os vocabulários dos idiomas com os termos adicionais.
+
+        Lança ValueError para idiomas desconhecidos ou para um termo que
+        seria verdadeiro em um vocabulário e falso em outro.
+        """
+        if locales is None:
+            locales = ["en"]
+
+        vocabularies: list[dict[str, bool]] = []
+
+        for locale in locales:
+            if locale not in boolean_vocabulary:
+                raise ValueError(
+                    f"Unknown boolean locale {locale!r}: expected one of {list(boolean_vocabulary)}."
+                )
+            vocabularies.append(boolean_vocabulary[locale])
+
+        if vocabulary is not None:
+            vocabularies.append(vocabulary)
+
+        combined_vocabulary: dict[str, bool] = {}
+
+        for locale_vocabulary in vocabularies:
+            for term, value in locale_vocabulary.items():
+                if combined_vocabulary.get(term, value) != value:
+                    raise ValueError(f"Ambiguous boolean term {term!r}: mapped to both True and False.")
+
+                combined_vocabulary[term] = bool(value)
+
+        return combined_vocabulary
+
+
+    @staticmethod
+    def lookup_bool(
+        series: cudf.Series,
+        vocabulary: dict[str, bool],
+        match_min_rate: None|int=None,
+        chunk_size: int = 500_000
+    ) -> None|cudf.Series:
+        """
+        Converte strings em boolean por uma busca no vocabulário, após
+        converter para minúsculas e remover acentos, em uma única passada.
+        Valores fora do vocabulário (ou nulos) viram nulos.
+
+        Com `match_min_rate` definido, a busca é interrompida e retorna None
+        assim que, mesmo que todas as linhas não nulas restantes estejam no
+        vocabulário, a taxa de `get_match_rate` não pode mais ser atingida.
+
+        Returns:
+            None|cudf.Series: Série boolean com o mesmo índice de `series`.
+        """
+        total_rows: int = len(series)
+        total_not_null_rows: int = total_rows - series.null_count
+
+        values: cp.ndarray = cp.zeros(total_rows, dtype=cp.bool_)
+        valid: cp.ndarray = cp.zeros(total_rows, dtype=cp.bool_)
+
+        match_count: int = 0
+        scanned_not_null_rows: int = 0
+
+        record_scan(passes=1)
 
         for start_index in range(0, total_rows, chunk_size):
             end_index: int = min(start_index + chunk_size, total_rows)
 
-            series_chunk = dataframe.iloc[start_index:end_index, column_index]
+            chunk: cudf.Series = series.iloc[start_index:end_index]
 
-            series_chunk = series_chunk.astype("string").str.lower().map(mapping_dict)
+            chunk_values: cudf.Series = (
+                chunk
+                .str.lower()
+                .str.translate(ACCENT_FOLDING_TABLE)
+                .map(vocabulary)
+            )
 
-            dataframe.iloc[start_index:end_index, column_index] = series_chunk
+            values[start_index:end_index] = chunk_values.fillna(False).astype("bool").values
+            valid[start_index:end_index] = chunk_values.notna().values
 
-        del column_index
-        del total_rows
+            record_scan(rows=len(chunk))
 
-        dataframe[column_name] = dataframe[column_name].astype("boolean")
+            if match_min_rate is None or total_not_null_rows == 0:
+                continue
 
-        print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
+            match_count = match_count + int(valid[start_index:end_index].sum())
+            scanned_not_null_rows = scanned_not_null_rows + (len(chunk) - chunk.null_count)
 
-        if not inplace:
-            return dataframe
+            remaining_not_null_rows: int = total_not_null_rows - scanned_not_null_rows
+            best_match_rate: int = round(((match_count + remaining_not_null_rows) / total_not_null_rows) * 100)
 
-        return True
+            if best_match_rate < match_min_rate:
+                return None
+
+        return cudf.Series(values, index=series.index).where(
+            cudf.Series(valid, index=series.index),
+            None
+        )
+
+
+    @staticmethod
+    def get_match_rate(
+        series: cudf.Series,
+        values: cudf.Series
+    ) -> int:
+        """
+        Retorna a porcentagem (0–100) dos valores não nulos de `series` que
+        foram convertidos em `values`. Retorna 0 sem valores convertidos.
+        """
+        non_null_values: int = len(series) - series.null_count
+        match_count: int = int(values.notna().sum())
+
+        if match_count == 0:
+            return 0
+
+        return round((match_count / non_null_values) * 100)
 
 
     @staticmethod
@@ -257,6 +383,11 @@ class BooleanUtils:
         series: cudf.Series,
         chunk_size: int = 500_000,
     ) -> bool:
+        """
+        Verifica se a coluna numérica contém apenas 0, 1 e nulos, por uma
+        redução de mínimo e máximo (sem `isin` por chunk). Colunas float
+        também precisam ter apenas valores inteiros.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=series,
             valid_types=CudfSupportedDtypes.numeric_types,
@@ -265,17 +396,16 @@ class BooleanUtils:
         if not is_valid:
             return False
 
-        is_only_binary: bool = False
-
-        for chunk in chunk_iterate(series, chunk_size):
-            is_only_binary = chunk.dropna().isin([0, 1]).all()
-
-            if not is_only_binary:
-                return False
+        if series.null_count == len(series):
+            return False
 
-        if not is_only_binary:
+        if series.min() < 0 or series.max() > 1:
             return False
 
+        # Ex.: 0.5 está entre 0 e 1, mas não é binário
+        if series.dtype.kind == "f":
+            return bool(((series == 0) | (series == 1) | series.isna()).all())
+
         return True
 
 
@@ -283,6 +413,8 @@ class BooleanUtils:
     def is_bool(
         series: cudf.Series,
         match_min_rate: None|int=50,
+        locales: None|list[str]=None,
+        vocabulary: None|dict[str, bool]=None,
         chunk_size: int = 500_000,
     ) -> bool:
         is_valid: bool = is_valid_to_normalize(
@@ -291,17 +423,20 @@ class BooleanUtils:
         )
         if not is_valid:
             return False
-    
-        combined_regex = combine_regex(regex_pattern_boolean_raw)
 
-        has_match: bool = StringUtils.match(
+        values: None|cudf.Series = BooleanUtils.lookup_bool(
             series=series,
-            regex=combined_regex,
+            vocabulary=BooleanUtils.get_vocabulary(locales, vocabulary),
             match_min_rate=match_min_rate,
             chunk_size=chunk_size
         )
-        
-        if has_match:
+
+        if values is None:
+            return False
+
+        match_rate: int = BooleanUtils.get_match_rate(series, values)
+
+        if match_rate > 0 and match_rate >= (match_min_rate or 0):
             return True
 
         return False
@@ -93,3 +93,23 @@ regex_pattern_boolean: list[dict[str, any]] = [
         "format": ("false", "no", "n", "off", "f")
     }
 ]
+
+
+
+# Vocabulários booleanos por idioma, em minúsculas e sem acentos
+# (ver `ACCENT_FOLDING_TABLE`). Usados por BooleanUtils.lookup_bool.
+boolean_vocabulary: dict[str, dict[str, bool]] = {
+    "en": {
+        "true": True, "false": False,
+        "yes": True, "no": False,
+        "y": True, "n": False,
+        "on": True, "off": False,
+        "t": True, "f": False,
+    },
+    "pt": {
+        "verdadeiro": True, "falso": False,
+        "sim": True, "nao": False,
+        "s": True, "n": False,
+        "v": True, "f": False,
+    },
+}
@@ -1,11 +1,11 @@
 
 from ..boolean.boolean_utils import BooleanUtils
-from ..null.null_utils import NullUtils
 from ..number.number_utils import NumberUtils
 from ..string.string_utils import StringUtils
 from ..time.time_utils import TimeUtils
 from ..datetime.datetime_utils import DateTimeUtils
-from typing import Literal
+from ..null.null_utils import NullUtils
+from typing import Any, Literal
 import cudf
 import cupy as cp
 import pandas as pd
@@ -13,9 +13,16 @@ from ..utils.log_utils import (
     print_drop_column_log,
     print_text_green,
     print_text_yellow,
+    print_normalize_df_null_log,
     print_normalize_df_space_log,
     print_normalize_df_string_log
 )
+from ..utils.cardinality_utils import is_high_cardinality
+from ..utils.memory_utils import get_vram_use_rate
+from ..utils.metadata_utils import get_column_metadata, set_column_metadata
+from ..utils.profile_utils import NormalizeProfiler, profile_stage
+from ..utils.stream_utils import stream_map
+from ..utils.validation_utils import CudfSupportedDtypes
 
 
 class DfUtils:
@@ -27,11 +34,18 @@ class DfUtils:
         to_case: None|Literal['lower', 'upper']=None,
         to_ASCII: bool=False,
         bool_number: bool=False,
+        bool_locales: None|list[str]=None,
+        decimal: bool=False,
+        date_as_days: bool=False,
+        sentinel_values: None|list[Any]=None,
+        column_sentinel_values: None|dict[str, list[Any]]=None,
+        detect_sentinels: bool=False,
         create_category: bool=False,
         drop_columns: list[str]=[],
         inplace: None|bool=False,
         show_log: None|bool=True,
         chunk_size: int=500_000,
+        profiler: None|NormalizeProfiler=None,
     ) -> bool|cudf.DataFrame:
         """
         Normaliza todas as colunas de um DataFrame cuDF aplicando múltiplas
@@ -39,13 +53,13 @@ class DfUtils:
         temporais e categóricos.
 
         Operações aplicadas por coluna, nesta ordem:
-        1. StringUtils.normalize -> normalização de espaços múltiplos e strings (case e ASCII).
-        2. NullUtils.normalize -> padronização e substituição de valores nulos.
-        3. NumberUtils.normalize -> conversão de strings numéricas para menor tipo numérico possível.
-        4. BooleanUtils.normalize -> conversão de strings booleanas para tipo boolean.
-        5. TimeUtils.normalize -> normalização e parsing de valores de tempo (HH:MM:SS).
-        6. DateTimeUtils.normalize -> normalização e parsing de valores datetime.
-        7. StringUtils.to_category (opcional) -> conversão da coluna em categoria ordenada.
+        1. StringUtils.normalize -> normalização de espaços múltiplos, strings (case e ASCII)
+           e substituição de valores nulos, em uma única passada por chunk.
+        2. NumberUtils.normalize -> conversão de strings numéricas para menor tipo numérico possível.
+        3. BooleanUtils.normalize -> conversão de strings booleanas para tipo boolean.
+        4. TimeUtils.normalize -> normalização e parsing de valores de tempo (HH:MM:SS).
+        5. DateTimeUtils.normalize -> normalização e parsing de valores datetime.
+        6. StringUtils.to_category (opcional) -> conversão da coluna em categoria, quando ocupa menos memória.
 
         Parâmetros
         ----------
@@ -60,6 +74,24 @@ class DfUtils:
             Se definido, converte todos os textos para minúsculo ou maiúsculo.
         to_ASCII : bool, default=False
             Se True, converte caracteres acentuados para ASCII puro.
+        bool_locales : list[str] | None, default=None
+            Idiomas do vocabulário booleano (ex.: ["en", "pt"] para também
+            aceitar "sim"/"não"). Padrão: ["en"].
+        decimal : bool, default=False
+            Se True, colunas numéricas em ponto fixo (ex.: valores monetários) são
+            convertidas para o menor tipo decimal exato em vez de float64.
+        date_as_days : bool, default=False
+            Se True, colunas de datas sem hora são armazenadas como dias desde
+            1970-01-01 (int32). A resolução fica nos metadados da coluna.
+        sentinel_values : list | None, default=None
+            Valores sentinela de todas as colunas, convertidos em nulos antes da
+            escolha do tipo: números para colunas numéricas (ex.: [-999, 9999]) e
+            datas ISO para colunas de datas (ex.: ["1900-01-01"]), inclusive
+            colunas já tipadas como datetime.
+        column_sentinel_values : dict[str, list] | None, default=None
+            Valores sentinela por coluna, somados a `sentinel_values`.
+        detect_sentinels : bool, default=False
+            Se True, detecta sentinelas numéricas pelos picos de frequência nos extremos.
         create_category : bool, default=False
             Se True, converte colunas de texto em categorias ordenadas com base nos valores únicos.
         drop_columns : list[str], default=[]
@@ -70,6 +102,11 @@ class DfUtils:
             Se True, imprime logs de normalização para cada etapa.
         chunk_size : int, default=500_000
             Tamanho dos chunks usados para processar séries grandes sem estourar memória.
+        profiler : NormalizeProfiler | None, default=None
+            Se definido, registra o tempo, as linhas lidas, as passadas, os
+            bytes e o pico de memória de cada etapa por coluna (string, number,
+            boolean, time, datetime, category).
+            A etapa "string" inclui a substituição de nulos, feita na mesma passada.
 
         Retorna
         -------
@@ -98,23 +135,19 @@ class DfUtils:
         column_names: list[str] = dataframe.columns
 
         for column_name in column_names:
-            StringUtils.normalize(
-                dataframe=dataframe,
-                column_name=column_name,
-                to_case=to_case,
-                to_ASCII=to_ASCII,
-                inplace=True,
-                show_log=False
-            )
-   
-            NullUtils.normalize(
-                dataframe=dataframe,
-                column_name=column_name,
-                null_values=null_values,
-                inplace=True,
-                show_log=False,
-                chunk_size=chunk_size
-            )
+            # Espaços, case, ASCII e nulos em uma única passada por chunk
+            with profile_stage(profiler, column_name, "string", dataframe):
+                StringUtils.normalize(
+                    dataframe=dataframe,
+                    column_name=column_name,
+                    to_case=to_case,
+                    to_ASCII=to_ASCII,
+                    null_values=null_values,
+                    inplace=True,
+                    show_log=False,
+                    chunk_size=chunk_size
+                )
+
         print_normalize_df_space_log(
             show_log=show_log
         )
@@ -123,47 +156,77 @@ class DfUtils:
             to_ASCII=to_ASCII,
             show_log=show_log
         )
+        print_normalize_df_null_log(
+            show_log=show_log
+        )
 
 
         for column_name in column_names:
-
-            NumberUtils.normalize(
-                dataframe=dataframe,
+            column_sentinels: list[Any] = NullUtils.get_sentinel_values(
                 column_name=column_name,
-                match_min_rate=match_min_rate,
-                inplace=True,
-                chunk_size=chunk_size,
-                show_log=show_log
+                sentinel_values=sentinel_values,
+                column_sentinel_values=column_sentinel_values
             )
 
-            BooleanUtils.normalize(
-                dataframe=dataframe,
-                bool_number=bool_number,
-                column_name=column_name,
-                match_min_rate=match_min_rate,
-                inplace=True,
-                show_log=show_log
-            )
-
-            TimeUtils.normalize(
-                dataframe=dataframe,
-                column_name=column_name,
-                match_min_rate=match_min_rate,
-                inplace=True,
-                show_log=show_log
-            )
-
-            DateTimeUtils.normalize(
-                dataframe=dataframe,
-                column_name=column_name,
-                match_min_rate=match_min_rate,
-                inplace=True,
-                chunk_size=chunk_size,
-                show_log=show_log
-            )
+            with profile_stage(profiler, column_name, "number", dataframe):
+                NumberUtils.normalize(
+                    dataframe=dataframe,
+                    column_name=column_name,
+                    match_min_rate=match_min_rate,
+                    decimal=decimal,
+                    sentinel_values=column_sentinels,
+                    detect_sentinels=detect_sentinels,
+                    inplace=True,
+                    chunk_size=chunk_size,
+                    show_log=show_log
+                )
+
+            with profile_stage(profiler, column_name, "boolean", dataframe):
+                BooleanUtils.normalize(
+                    dataframe=dataframe,
+                    bool_number=bool_number,
+                    column_name=column_name,
+                    match_min_rate=match_min_rate,
+                    locales=bool_locales,
+                    inplace=True,
+                    show_log=show_log
+                )
+
+            with profile_stage(profiler, column_name, "time", dataframe):
+                TimeUtils.normalize(
+                    dataframe=dataframe,
+                    column_name=column_name,
+                    match_min_rate=match_min_rate,
+                    inplace=True,
+                    show_log=show_log
+                )
+
+            with profile_stage(profiler, column_name, "datetime", dataframe):
+                # Colunas já tipadas como datetime não passam pelo parsing de
+                # strings; apenas as sentinelas viram nulos
+                if str(dataframe[column_name].dtype) in CudfSupportedDtypes.datetime_types:
+                    if column_sentinels:
+                        NullUtils.normalize_sentinels(
+                            dataframe=dataframe,
+                            column_name=column_name,
+                            sentinel_values=column_sentinels,
+                            inplace=True,
+                            show_log=show_log
+                        )
+                else:
+                    DateTimeUtils.normalize(
+                        dataframe=dataframe,
+                        column_name=column_name,
+                        match_min_rate=match_min_rate,
+                        date_as_days=date_as_days,
+                        sentinel_values=column_sentinels,
+                        inplace=True,
+                        chunk_size=chunk_size,
+                        show_log=show_log
+                    )
 
             if create_category:
-                if create_category:
+                with profile_stage(profiler, column_name, "category", dataframe):
                     StringUtils.to_category(
                         dataframe=dataframe,
                         column_name=column_name,
@@ -178,6 +241,127 @@ class DfUtils:
         return True
 
 
+    @staticmethod
+    def normalize_host(
+        dataframe: pd.DataFrame,
+        match_min_rate: int=50,
+        null_values: list[str] = [],
+        to_case: None|Literal['lower', 'upper']=None,
+        to_ASCII: bool=False,
+        bool_number: bool=False,
+        bool_locales: None|list[str]=None,
+        decimal: bool=False,
+        date_as_days: bool=False,
+        sentinel_values: None|list[Any]=None,
+        column_sentinel_values: None|dict[str, list[Any]]=None,
+        detect_sentinels: bool=False,
+        create_category: bool=False,
+        drop_columns: list[str]=[],
+        inplace: None|bool=False,
+        show_log: None|bool=True,
+        chunk_size: int=500_000,
+        prefetch: bool=True,
+        profiler: None|NormalizeProfiler=None,
+    ) -> bool|pd.DataFrame:
+        """
+        Modo de baixo uso de VRAM: normaliza um DataFrame pandas mantido na
+        memória do host, enviando uma coluna por vez para a GPU.
+
+        Cada coluna é copiada para a VRAM, normalizada com `DfUtils.normalize`
+        e o resultado compacto é copiado de volta para o host. Com
+        `prefetch=True` as transferências usam buffer duplo, sobrepondo o envio
+        da próxima coluna e o retorno da anterior ao processamento da atual.
+        O pico de VRAM fica limitado a poucas colunas, permitindo normalizar
+        DataFrames maiores que a VRAM. Os metadados de cada coluna
+        (`get_column_metadata`) são copiados para o DataFrame retornado.
+
+        Parâmetros
+        ----------
+        dataframe : pd.DataFrame
+            DataFrame pandas de entrada.
+        prefetch : bool, default=True
+            Se True, sobrepõe as transferências host <-> device ao processamento.
+
+        Os demais parâmetros são os mesmos de `DfUtils.normalize`.
+
+        Retorna
+        -------
+        bool | pd.DataFrame
+            Se `inplace=True`, retorna True.
+            Se `inplace=False`, retorna um novo DataFrame pandas normalizado.
+        """
+        if not inplace:
+            dataframe: pd.DataFrame = dataframe.copy()
+
+        if drop_columns:
+            columns_to_delete: list[str] = [
+                column_name for column_name in drop_columns
+                if column_name in dataframe.columns
+            ]
+
+            if columns_to_delete:
+                dataframe.drop(columns=columns_to_delete, inplace=True)
+
+                print_drop_column_log(
+                    show_log=show_log,
+                    columns_to_delete=columns_to_delete
+                )
+
+        column_metadata: dict[str, dict[str, Any]] = {}
+
+        def load_column(column_name: str) -> cudf.DataFrame:
+            return cudf.DataFrame.from_pandas(dataframe[[column_name]])
+
+        def normalize_column(column_name: str, column_df: cudf.DataFrame) -> cudf.DataFrame:
+            DfUtils.normalize(
+                dataframe=column_df,
+                match_min_rate=match_min_rate,
+                null_values=null_values,
+                to_case=to_case,
+                to_ASCII=to_ASCII,
+                bool_number=bool_number,
+                bool_locales=bool_locales,
+                decimal=decimal,
+                date_as_days=date_as_days,
+                sentinel_values=sentinel_values,
+                column_sentinel_values=column_sentinel_values,
+                detect_sentinels=detect_sentinels,
+                create_category=create_category,
+                inplace=True,
+                show_log=show_log,
+                chunk_size=chunk_size,
+                profiler=profiler
+            )
+
+            # Os metadados ficam no DataFrame cuDF e não sobrevivem ao to_pandas
+            column_metadata[column_name] = get_column_metadata(column_df, column_name)
+
+            return column_df
+
+        def unload_column(column_df: cudf.DataFrame) -> pd.Series:
+            return column_df.iloc[:, 0].to_pandas()
+
+        # O DataFrame de origem só é alterado ao final, pois a thread de
+        # prefetch lê as colunas enquanto a atual é processada
+        normalized_columns: dict[str, pd.Series] = dict(stream_map(
+            items=list(dataframe.columns),
+            load=load_column,
+            process=normalize_column,
+            unload=unload_column,
+            prefetch=prefetch
+        ))
+
+        for column_name, series in normalized_columns.items():
+            dataframe[column_name] = series
+
+            if column_metadata.get(column_name):
+                set_column_metadata(dataframe, column_name, **column_metadata[column_name])
+
+        if not inplace:
+            return dataframe
+
+        return True
+
 
     @staticmethod
     def drop_columns(
@@ -252,11 +436,17 @@ class DfUtils:
         }
     
     @staticmethod
-    def is_vram_use_limit(device_id: int = 0) -> dict[str, int]:
-        free_bytes, total_bytes = cp.cuda.runtime.memGetInfo()
-        vram_percent_in_use: float = round(((total_bytes - free_bytes) / total_bytes) * 100, 1) >= 90
-        
-        if vram_percent_in_use >= 90:
+    def is_vram_use_limit(
+        device_id: int = 0,
+        vram_limit_rate: int = 90
+    ) -> bool:
+        """
+        Retorna True se o percentual de VRAM em uso for maior ou igual
+        a `vram_limit_rate` (0–100).
+        """
+        vram_percent_in_use: float = get_vram_use_rate(device_id=device_id)
+
+        if vram_percent_in_use >= vram_limit_rate:
             return True
         
         return False
@@ -289,20 +479,39 @@ class DfUtils:
 
 
     @staticmethod
-    def frequency(dataframe, column_name) -> cudf.DataFrame:
+    def frequency(
+        dataframe: cudf.DataFrame,
+        column_name: str,
+        max_unique: None|int=None,
+        chunk_size: int=500_000
+    ) -> bool|cudf.DataFrame:
         """
         Retorna um dataframe com a frequência de cada velor único em uma coluna.
 
         Args:
-            dataframe (pd.DataFrame): O DataFrame de entrada.
-            coluna (str): O nome da coluna para calcular a frequência.
+            dataframe (cudf.DataFrame): O DataFrame de entrada.
+            column_name (str): O nome da coluna para calcular a frequência.
+            max_unique (int | None): Se definido, a quantidade de valores únicos
+                é estimada antes (HyperLogLog) e a contagem não é feita quando a
+                coluna certamente possui mais de `max_unique` valores únicos.
+            chunk_size (int): Número máximo de linhas por chunk na estimativa.
 
         Returns:
-            pd.DataFrame: Um DataFrame com a frequência de cada valor na coluna
-                        em ordem do maior para o menor.
+            cudf.DataFrame: Um DataFrame com a frequência de cada valor na coluna
+                        em ordem do maior para o menor, ou False se a coluna
+                        exceder `max_unique`.
         """
+        if max_unique is not None and is_high_cardinality(
+            series=dataframe[column_name],
+            max_unique=max_unique,
+            chunk_size=chunk_size
+        ):
+            return False
+
         frequencia = dataframe[column_name].value_counts()
 
         df_frequencia = frequencia.reset_index()
 
-        df_frequencia.columns = [column_name, 'frequency']
\ No newline at end of file
+        df_frequencia.columns = [column_name, 'frequency']
+
+        return df_frequencia
\ No newline at end of file
@@ -1,16 +1,30 @@
 from .regex_pattern import (
     regex_pattern_date,
     regex_pattern_bad_date,
-    regex_pattern_datetime_all
+    regex_pattern_date_formats,
+    regex_pattern_datetime_all,
+    regex_pattern_month_name,
+    regex_date_first_fields,
+    month_number_by_name,
+    translate_table_date_delimiter
 )
+from ..utils.date_layout_utils import (
+    fields_to_seconds,
+    get_minimal_resolution,
+    parse_fixed_layout
+)
+from ..null.null_utils import NullUtils
 from ..utils.log_utils import print_log
+from ..utils.metadata_utils import set_column_metadata
 from ..string.string_utils import StringUtils
 from ..utils.str_utils import combine_regex
+from ..utils.translate_utils import ACCENT_FOLDING_TABLE
 from ..utils.validation_utils import (
     CudfSupportedDtypes,
     is_valid_to_normalize
 )
 import cudf
+import cupy as cp
 
 
 class DateTimeUtils:
@@ -19,6 +33,9 @@ class DateTimeUtils:
         dataframe: cudf.DataFrame,
         column_name: str,
         match_min_rate: int=50,
+        date_as_days: bool=False,
+        day_first: None|bool=None,
+        sentinel_values: None|list[str]=None,
         inplace: bool=False,
         chunk_size: int=500_000,
         show_log: bool=True,
@@ -28,6 +45,9 @@ class DateTimeUtils:
             dataframe=dataframe,
             column_name=column_name,
             match_min_rate=match_min_rate,
+            date_as_days=date_as_days,
+            day_first=day_first,
+            sentinel_values=sentinel_values,
             inplace=inplace,
             chunk_size=chunk_size,
             show_log=show_log
@@ -39,11 +59,41 @@ class DateTimeUtils:
         dataframe: cudf.DataFrame,
         column_name: str,
         match_min_rate: int=50,
+        offset_column_name: None|str=None,
+        date_as_days: bool=False,
+        day_first: None|bool=None,
+        sentinel_values: None|list[str]=None,
         inplace: bool=False,
         chunk_size: int=500_000,
         show_log: bool=True,
     ) -> bool|cudf.DataFrame:
-        
+        """
+        Converte uma coluna de strings de data/datetime para datetime.
+
+        Datas "dd?mm?yyyy" e "mm?dd?yyyy" são ambíguas. Com `day_first` None,
+        a ordem é decidida antes da conversão pelas estatísticas da coluna
+        (`infer_day_first`) e registrada nos metadados com a sua confiança.
+
+        A resolução é escolhida pelos dados (`get_minimal_resolution`):
+        datetime64[s] sem frações de segundo, [ms] ou [us] quando as frações
+        permitem e [ns] nos demais casos. Se todos os valores estiverem à
+        meia-noite e `date_as_days` for True, a coluna é armazenada como dias
+        desde 1970-01-01 (int32), com metade da memória de datetime64[s].
+        A resolução escolhida é registrada nos metadados da coluna.
+
+        Datas sentinela em `sentinel_values` (ex.: ['1900-01-01']) viram nulos
+        antes da escolha da resolução.
+
+        Valores com fuso horário ('2024-01-15T10:00:00-03:00') são convertidos
+        para UTC. Se `offset_column_name` for definido, o fuso horário original
+        de cada linha é mantido nessa coluna, em minutos (int16; nulo para
+        valores sem fuso horário).
+
+        O formato de cada linha é inferido em uma única passada de regex
+        (`classify_date_formats`), que também fornece a taxa de correspondência.
+        Quando há um único formato, a coluna é convertida com uma única chamada
+        de `to_datetime`; com formatos mistos, há uma conversão por formato.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=dataframe[column_name],
             valid_types=CudfSupportedDtypes.str_types,
@@ -51,72 +101,89 @@ class DateTimeUtils:
 
         if not is_valid:
             return False
-        
-        is_date: bool = DateTimeUtils.is_date(
+
+        labels: None|cudf.Series = DateTimeUtils.classify_date_formats(
             series=dataframe[column_name],
-            match_min_rate=match_min_rate
+            chunk_size=chunk_size
         )
 
-        if not is_date:
+        if labels is None:
             return False
 
-        is_unique_datetime_pattern: bool = DateTimeUtils.is_unique_datetime_pattern(
-            series=dataframe[column_name],
+        non_null_values: int = len(labels) - dataframe[column_name].null_count
+        match_count: int = int((labels >= 0).sum())
+
+        is_date: bool = (
+            match_count >= 1
+            and round((match_count / non_null_values) * 100) >= match_min_rate
         )
 
-        if is_unique_datetime_pattern:
-            
-            is_normalized: bool = DateTimeUtils.normalize_unique_pattern(
-                dataframe=dataframe,
-                column_name=column_name,
-                inplace=True,
-                chunk_size=chunk_size,
-            )
+        if not is_date:
+            return False
+
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
 
-            if not is_normalized:
-                return False
+        if offset_column_name is not None:
+            offset_labels: list[int] = [
+                label for label, pattern in enumerate(regex_pattern_date_formats)
+                if "%z" in pattern["format"]
+            ]
 
-            print_log(
-                column_name=column_name,
-                column_type=str(dataframe[column_name].dtype),
-                show_log=show_log
+            dataframe[offset_column_name] = DateTimeUtils.get_utc_offset_minutes(
+                dataframe[column_name].where(labels.isin(offset_labels), None)
             )
 
-            if not inplace:
-                return dataframe
-            return True
-        
-        DateTimeUtils.normalize_date_delimiters(
-            dataframe=dataframe,
-            column_name=column_name,
-            inplace=True,
-            chunk_size=chunk_size,
-        )
+        day_first_confidence: None|float = None
 
-        # Datas com um único dígito: 1/1/2010
-        has_bad_date_format: bool = StringUtils.match(
+        if day_first is None:
+            day_first, day_first_confidence = DateTimeUtils.infer_day_first(
+                series=dataframe[column_name],
+                labels=labels
+            )
+
+        dataframe[column_name] = DateTimeUtils.convert_date_formats(
             series=dataframe[column_name],
-            regex=combine_regex(regex_pattern_bad_date)
+            labels=labels,
+            day_first=day_first,
+            chunk_size=chunk_size
         )
 
-        if has_bad_date_format:
-            DateTimeUtils.fix_digit_shape(dataframe, column_name, inplace=True)
+        if sentinel_values:
+            sentinel_mask: cudf.Series = NullUtils.sentinel_mask(
+                series=dataframe[column_name],
+                sentinel_values=sentinel_values
+            )
 
-        is_normalized: bool = DateTimeUtils.normalize_mixed_dates(
-                dataframe=dataframe,
-                column_name=column_name,
-                inplace=True,
-                chunk_size=chunk_size,
+            dataframe[column_name] = dataframe[column_name].where(~sentinel_mask, None)
+
+        resolution: str = get_minimal_resolution(dataframe[column_name])
+        as_days: bool = date_as_days and resolution == "D"
+
+        if as_days:
+            dataframe[column_name] = (
+                dataframe[column_name].astype("datetime64[s]").astype("int64") // 86_400
+            ).astype("int32")
+        else:
+            dataframe[column_name] = dataframe[column_name].astype(
+                f"datetime64[{'s' if resolution == 'D' else resolution}]"
             )
 
-        if not is_normalized:
-            return False
+        set_column_metadata(
+            dataframe,
+            column_name,
+            resolution=resolution,
+            as_days=as_days,
+            day_first=day_first,
+            day_first_confidence=day_first_confidence
+        )
 
         print_log(
             column_name=column_name,
             column_type=str(dataframe[column_name].dtype),
             show_log=show_log
         )
+
         if not inplace:
             return dataframe
 
@@ -136,7 +203,12 @@ class DateTimeUtils:
         if not is_valid:
             return False
 
-        all_regex_valid_date: list[dict[str, str]] = regex_pattern_date + regex_pattern_bad_date + regex_pattern_datetime_all
+        all_regex_valid_date: list[dict[str, str]] = (
+            regex_pattern_date
+            + regex_pattern_bad_date
+            + regex_pattern_datetime_all
+            + regex_pattern_month_name
+        )
 
         combined_regex: str = combine_regex(all_regex_valid_date)
 
@@ -151,13 +223,102 @@ class DateTimeUtils:
             return True
 
         return False
-    
+
+
+    @staticmethod
+    def classify_date_formats(
+        series: cudf.Series,
+        chunk_size: int = 500_000,
+    ) -> None|cudf.Series:
+        """
+        Rotula cada linha com o índice do seu formato em
+        `regex_pattern_date_formats` (-1 se não for data), em uma única
+        passada de regex por chunk.
+
+        Retorna None se nenhuma linha da coluna tiver formato de data.
+        """
+        labels: cudf.Series = StringUtils.match_classify(
+            series=series,
+            regex_patterns=regex_pattern_date_formats,
+            chunk_size=chunk_size
+        )
+
+        if not bool((labels >= 0).any()):
+            return None
+
+        return labels
+
+
+    @staticmethod
+    def convert_date_formats(
+        series: cudf.Series,
+        labels: cudf.Series,
+        day_first: bool = True,
+        chunk_size: int = 500_000
+    ) -> cudf.Series:
+        """
+        Converte a série para datetime usando os rótulos de formato de
+        `classify_date_formats`. Valores sem formato de data viram nulos.
+
+        O tipo é datetime64[ns] se houver algum datetime (com hora) e
+        datetime64[s] se houver apenas datas.
+        """
+        frequencies: list[int] = StringUtils.match_frequency(
+            labels=labels,
+            total_patterns=len(regex_pattern_date_formats)
+        )
+
+        found_labels: list[int] = [
+            label for label, frequency in enumerate(frequencies) if frequency > 0
+        ]
+
+        has_datetime: bool = any(
+            label < len(regex_pattern_datetime_all) for label in found_labels
+        )
+
+        datetime_dtype: str = "datetime64[ns]" if has_datetime else "datetime64[s]"
+
+        # Formato único: uma só conversão sobre a coluna inteira
+        if len(found_labels) == 1:
+            label: int = found_labels[0]
+
+            return DateTimeUtils.parse_date_format(
+                series=series.where(labels == label, None),
+                pattern=regex_pattern_date_formats[label],
+                day_first=day_first,
+                chunk_size=chunk_size
+            ).astype(datetime_dtype)
+
+        datetime_series: cudf.Series = cudf.Series(
+            cp.zeros(len(series), dtype=cp.int64),
+            index=series.index
+        ).astype(datetime_dtype)
+
+        # Formatos mistos: uma conversão por grupo de formato
+        for label in found_labels:
+            mask_pattern: cudf.Series = labels == label
+
+            datetime_series.loc[mask_pattern] = DateTimeUtils.parse_date_format(
+                series=series.loc[mask_pattern],
+                pattern=regex_pattern_date_formats[label],
+                day_first=day_first,
+                chunk_size=chunk_size
+            ).astype(datetime_dtype)
+
+        return datetime_series.where(labels >= 0, None)
+
 
     @staticmethod
     def is_unique_datetime_pattern(
         series: cudf.Series,
         chunk_size: int = 500_000,
+        labels: None|cudf.Series = None,
     ) -> bool:
+        """
+        Verifica se a série possui exatamente um formato de datetime (com hora),
+        pelos rótulos de `classify_date_formats`. Rótulos já calculados podem
+        ser passados em `labels`, evitando uma nova passada de regex.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=series,
             valid_types=CudfSupportedDtypes.str_types,
@@ -165,31 +326,39 @@ class DateTimeUtils:
         if not is_valid:
             return False
 
-        datetime_types_found: int = 0
-
-        for pattern in regex_pattern_datetime_all:
-            has_datetime: bool = StringUtils.match(
+        if labels is None:
+            labels = DateTimeUtils.classify_date_formats(
                 series=series,
-                regex=pattern["regex"],
-                match_min_rate=0,
                 chunk_size=chunk_size
             )
-            if has_datetime:
-                datetime_types_found = datetime_types_found + 1
-        
-        if datetime_types_found == 1:
-            return True
 
-        return False
+        if labels is None:
+            return False
 
+        frequencies: list[int] = StringUtils.match_frequency(
+            labels=labels,
+            total_patterns=len(regex_pattern_date_formats)
+        )
+
+        datetime_types_found: int = sum(
+            1 for frequency in frequencies[:len(regex_pattern_datetime_all)] if frequency > 0
+        )
+
+        return datetime_types_found == 1
 
+
+    @staticmethod
     def normalize_unique_pattern(
         dataframe: cudf.DataFrame,
         column_name: str,
         inplace: bool=False,
         chunk_size: int=500_000
     ) -> bool|cudf.DataFrame:
-        
+        """
+        Converte a coluna para datetime se ela possuir um único formato de
+        datetime (`is_unique_datetime_pattern`). Valores sem formato de data
+        viram nulos. A coluna é classificada uma única vez.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=dataframe[column_name],
             valid_types=CudfSupportedDtypes.str_types,
@@ -198,40 +367,186 @@ class DateTimeUtils:
         if not is_valid:
             return False
 
+        labels: None|cudf.Series = DateTimeUtils.classify_date_formats(
+            series=dataframe[column_name],
+            chunk_size=chunk_size
+        )
+
         is_unique_datetime_pattern: bool = DateTimeUtils.is_unique_datetime_pattern(
             series=dataframe[column_name],
+            labels=labels
         )
-        if is_unique_datetime_pattern:
-            if not inplace:
-                dataframe: cudf.DataFrame = dataframe.copy()
 
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
+        if not is_unique_datetime_pattern:
+            return False
 
-            combined_regex: str = combine_regex(regex_pattern_datetime_all)
+        return DateTimeUtils.normalize_mixed_dates(
+            dataframe=dataframe,
+            column_name=column_name,
+            inplace=inplace,
+            chunk_size=chunk_size,
+            labels=labels
+        )
 
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
 
-                series_chunk = dataframe.iloc[start_index:end_index, column_index]
+    @staticmethod
+    def normalize_mixed_dates(
+        dataframe: cudf.DataFrame,
+        column_name: str,
+        inplace: bool=False,
+        chunk_size: int=500_000,
+        labels: None|cudf.Series=None
+    ) -> bool|cudf.DataFrame:
+        """
+        Converte a coluna para datetime com uma conversão por formato
+        (`classify_date_formats` e `convert_date_formats`). Valores sem formato
+        de data viram nulos. Rótulos já calculados podem ser passados em
+        `labels`, evitando uma nova passada de regex.
+        """
+        is_valid: bool = is_valid_to_normalize(
+            series=dataframe[column_name],
+            valid_types=CudfSupportedDtypes.str_types,
+        )
 
-                mask = series_chunk.str.match(combined_regex)
+        if not is_valid:
+            return False
 
-                series_chunk = series_chunk.where(mask, None)
+        if labels is None:
+            labels = DateTimeUtils.classify_date_formats(
+                series=dataframe[column_name],
+                chunk_size=chunk_size
+            )
 
-                dataframe.iloc[start_index:end_index, column_index] = series_chunk
+        if labels is None:
+            return False
 
-            dataframe[column_name] = cudf.to_datetime(dataframe[column_name])
-            dataframe[column_name] = dataframe[column_name].astype("datetime64[ns]")
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
 
-            del total_rows
-            del column_index
+        dataframe[column_name] = DateTimeUtils.convert_date_formats(
+            series=dataframe[column_name],
+            labels=labels,
+            chunk_size=chunk_size
+        )
 
-            if not inplace:
-                return dataframe
-            return True
+        if not inplace:
+            return dataframe
+        return True
 
-        return False
+
+    @staticmethod
+    def infer_day_first(
+        series: cudf.Series,
+        labels: cudf.Series
+    ) -> tuple[bool, float]:
+        """
+        Decide se as datas ambíguas ("01/02/2024") estão no formato dia
+        primeiro ou mês primeiro, em uma única passada sobre a coluna.
+
+        Conta os valores cujo primeiro campo é maior que 12 (só pode ser dia)
+        e os valores cujo segundo campo é maior que 12 (o primeiro é o mês).
+        Sem evidência, mantém dia primeiro.
+
+        Returns:
+            tuple[bool, float]: True para dia primeiro, e a confiança (0–1),
+                a fração de valores decisivos que apoia a escolha
+                (0.0 quando nenhum valor é decisivo).
+        """
+        ambiguous_labels: list[int] = [
+            label for label, pattern in enumerate(regex_pattern_date_formats)
+            if "layout_month_first" in pattern
+        ]
+
+        fields: cudf.DataFrame = series.where(
+            labels.isin(ambiguous_labels),
+            None
+        ).str.extract(regex_date_first_fields)
+
+        first_field: cudf.Series = fields[0].astype("float64")
+        second_field: cudf.Series = fields[1].astype("float64")
+
+        total_day_first: int = int((first_field > 12).sum())
+        total_month_first: int = int((second_field > 12).sum())
+        total_decisive: int = total_day_first + total_month_first
+
+        if total_decisive == 0:
+            return True, 0.0
+
+        day_first: bool = total_day_first >= total_month_first
+
+        return day_first, max(total_day_first, total_month_first) / total_decisive
+
+
+    @staticmethod
+    def parse_date_format(
+        series: cudf.Series,
+        pattern: dict[str, str],
+        day_first: bool = True,
+        chunk_size: int = 500_000
+    ) -> cudf.Series:
+        """
+        Converte para datetime uma série cujos valores seguem o formato de
+        `pattern` (um item de `regex_pattern_date_formats`).
+
+        Formatos com "layout" e valores de tamanho fixo são lidos pela posição
+        dos dígitos (`parse_fixed_layout`); os demais usam `cudf.to_datetime`.
+        Valores com fuso horário (±HH:MM) são convertidos para UTC. Com
+        `day_first` False, formatos ambíguos usam a variante mês primeiro.
+        """
+        is_date_pattern: bool = pattern in regex_pattern_date
+
+        if not day_first and "layout_month_first" in pattern:
+            pattern = {
+                **pattern,
+                "format": pattern["format_month_first"],
+                "layout": pattern["layout_month_first"]
+            }
+
+        # "2024-01-15 10:00:00-03:00": parte local convertida e deslocada para UTC
+        if "%z" in pattern["format"]:
+            local_pattern: dict[str, str] = {
+                key: value for key, value in pattern.items() if key != "regex"
+            }
+            local_pattern["format"] = pattern["format"].replace("%z", "")
+
+            local_datetime: cudf.Series = DateTimeUtils.parse_date_format(
+                series=series.str.slice(0, -6),
+                pattern=local_pattern,
+                day_first=day_first,
+                chunk_size=chunk_size
+            )
+
+            offset_seconds: cudf.Series = DateTimeUtils.get_utc_offset_minutes(series).astype("int64") * 60
+
+            return local_datetime - offset_seconds.astype("timedelta64[s]")
+
+        if pattern in regex_pattern_month_name:
+            return DateTimeUtils.parse_month_name_date(
+                series=series,
+                pattern=pattern
+            ).astype("datetime64[s]")
+
+        if is_date_pattern:
+            # "1/1/2010" -> "01-01-2010"
+            series = series.str.translate(translate_table_date_delimiter)
+            series = DateTimeUtils.pad_day_month(series)
+
+        # Layout fixo: leitura aritmética das posições dos dígitos
+        if "layout" in pattern and DateTimeUtils.is_fixed_width(series, len(pattern["layout"])):
+            return parse_fixed_layout(
+                series=series,
+                layout=pattern["layout"],
+                chunk_size=chunk_size
+            ).astype("datetime64[s]")
+
+        if is_date_pattern:
+            return cudf.to_datetime(series, format=pattern["format"])
+
+        # Fração de segundos com tamanho variável: o cuDF infere
+        if "%f" in pattern["format"]:
+            return cudf.to_datetime(series)
+
+        return cudf.to_datetime(series, format=pattern["format"])
 
 
     def normalize_date_delimiters(
@@ -257,13 +572,8 @@ class DateTimeUtils:
 
             series_chunk = dataframe.iloc[start_index:end_index, column_index]
 
-            series_chunk = (
-                series_chunk
-                .str.replace("/", "-", regex=False)
-                .str.replace(" ", "-", regex=False)
-                .str.replace("_", "-", regex=False)
-                .str.replace(".", "-", regex=False)
-            )
+            # "/", " ", "_" e "." -> "-" em uma única passada
+            series_chunk = series_chunk.str.translate(translate_table_date_delimiter)
 
             dataframe.iloc[start_index:end_index, column_index] = series_chunk
 
@@ -302,20 +612,7 @@ class DateTimeUtils:
 
             series_chunk = dataframe.iloc[start_index:end_index, column_index]
 
-            # Fix d/mm/yy and d/m/yy to 0d/mm/yy and 0d/m/yy
-            series_chunk = series_chunk.str.replace_with_backrefs(
-                r'^(?:\d{1}[^\w\d]\d{1,2}[^\w\d]\d{2,4})$',
-                '0\\0',
-            )
-
-            # Fix dd/m/yy to 0d/0m/yy
-            series_chunk = series_chunk.str.replace_with_backrefs(
-                r'^(\d{2}[^\w\d])(\d{1}[^\w\d]\d{2,4})$',
-                "\\1|\\2",
-            )
-            
-            # unfortunately it is necessary to use the "|" marker, because luffy understands "\\10" or "\\1'+0+\\2" as 10 or group 0
-            series_chunk = series_chunk.str.replace("|", "0", regex=False)
+            series_chunk = DateTimeUtils.pad_day_month(series_chunk)
 
             dataframe.iloc[start_index:end_index, column_index] = series_chunk
 
@@ -328,6 +625,98 @@ class DateTimeUtils:
         return True
 
 
+    @staticmethod
+    def get_utc_offset_minutes(series: cudf.Series) -> cudf.Series:
+        """
+        Retorna o fuso horário (±HH:MM no final do valor) em minutos (int16).
+
+        Ex.: "2024-01-15T10:00:00-03:00" -> -180
+        """
+        offset: cudf.Series = series.str.slice(-6)
+
+        sign: cudf.Series = (offset.str.slice(0, 1) == "-").astype("int16") * -2 + 1
+        hours: cudf.Series = offset.str.slice(1, 3).astype("int16")
+        minutes: cudf.Series = offset.str.slice(4, 6).astype("int16")
+
+        return (sign * (hours * 60 + minutes)).astype("int16")
+
+
+    @staticmethod
+    def parse_month_name_date(
+        series: cudf.Series,
+        pattern: dict[str, str]
+    ) -> cudf.Series:
+        """
+        Converte datas com o mês por nome ('12-Jan-2024', 'March 3, 2021',
+        '3 de março de 2021') em segundos desde 1970-01-01 (int64).
+
+        Os campos são separados em uma única busca por regex e o nome do mês
+        é convertido em número por uma junção com `month_number_by_name`
+        (inglês e português, sem acentos). Meses desconhecidos e datas
+        inválidas viram nulos.
+        """
+        groups: cudf.DataFrame = series.str.extract(pattern["regex"])
+
+        fields: dict[str, cudf.Series] = {
+            field: groups[index] for index, field in enumerate(pattern["groups"])
+        }
+
+        month_name: cudf.Series = fields["m"].str.lower().str.translate(ACCENT_FOLDING_TABLE)
+        month: cudf.Series = month_name.map(month_number_by_name)
+
+        is_valid: cudf.Series = (
+            fields["d"].notna()
+            & fields["y"].notna()
+            & month.notna()
+        )
+
+        def to_int(field_series: cudf.Series) -> cp.ndarray:
+            return field_series.fillna("0").astype("int64").values
+
+        seconds, is_valid_fields = fields_to_seconds(
+            year=to_int(fields["y"]),
+            month=month.fillna(0).astype("int64").values,
+            day=to_int(fields["d"]),
+            hour=to_int(fields["H"]),
+            minute=to_int(fields["M"]),
+            second=to_int(fields["S"])
+        )
+
+        return cudf.Series(seconds, index=series.index).where(
+            is_valid & cudf.Series(is_valid_fields, index=series.index),
+            None
+        )
+
+
+    @staticmethod
+    def is_fixed_width(series: cudf.Series, width: int) -> bool:
+        """
+        Verifica se todos os valores não nulos têm exatamente `width` caracteres.
+        """
+        return bool(((series.str.len() == width) | series.isna()).all())
+
+
+    @staticmethod
+    def pad_day_month(series: cudf.Series) -> cudf.Series:
+        """
+        Completa com zero o dia e o mês de um dígito: "1-1-10" -> "01-01-10".
+        """
+        # Fix d/mm/yy and d/m/yy to 0d/mm/yy and 0d/m/yy
+        series = series.str.replace_with_backrefs(
+            r'^(?:\d{1}[^\w\d]\d{1,2}[^\w\d]\d{2,4})$',
+            '0\\0',
+        )
+
+        # Fix dd/m/yy to 0d/0m/yy
+        series = series.str.replace_with_backrefs(
+            r'^(\d{2}[^\w\d])(\d{1}[^\w\d]\d{2,4})$',
+            "\\1|\\2",
+        )
+
+        # unfortunately it is necessary to use the "|" marker, because luffy understands "\\10" or "\\1'+0+\\2" as 10 or group 0
+        return series.str.replace("|", "0", regex=False)
+
+
     @staticmethod
     def combine_date_time(
         dataframe: cudf.DataFrame,
@@ -361,51 +750,3 @@ class DateTimeUtils:
             return dataframe
 
         return True
-
-
-    def normalize_mixed_dates(
-        dataframe: cudf.DataFrame,
-        column_name: str,
-        inplace: bool=False,
-        chunk_size: int=500_000
-    ) -> bool|cudf.DataFrame:
-        
-        is_valid: bool = is_valid_to_normalize(
-            series=dataframe[column_name],
-            valid_types=CudfSupportedDtypes.str_types,
-        )
-
-        if not is_valid:
-            return False
-
-        # aplicação de regex de data em chunks
-        combined_regex: str = combine_regex(regex_pattern_date)
-
-        total_rows: int = len(dataframe)
-        column_index: int = dataframe.columns.get_loc(column_name)
-
-        for start_index in range(0, total_rows, chunk_size):
-            end_index: int = min(start_index + chunk_size, total_rows)
-
-            series_chunk = dataframe.iloc[start_index:end_index, column_index]
-
-            mask = series_chunk.str.match(combined_regex)
-
-            # Converte valores inválidos para None
-            series_chunk = series_chunk.where(mask, None)
-
-            # Converte para cada padrão de data válido
-            for pattern in regex_pattern_date:
-                mask_pattern = series_chunk.str.match(pattern["regex"])
-                series_chunk.loc[mask_pattern] = cudf.to_datetime(series_chunk.loc[mask_pattern], format=pattern["format"])
-
-            dataframe.iloc[start_index:end_index, column_index] = series_chunk
-
-        del total_rows
-        del column_index
-
-        dataframe[column_name] = dataframe[column_name].astype("datetime64[s]")
-
-        if not inplace:
-            return dataframe
-        return True
@@ -1,27 +1,44 @@
+from ..utils.translate_utils import build_translate_table
+
+
 regex_pattern_date: list[dict[str, str]] = [
     {
         "regex": r'^(?:\d{1,2}[^\w\d]\d{1,2}[^\w\d]\d{4})$',
         "pattern": "dd?mm?yyyy",
-        "format": "%d-%m-%Y"
+        "format": "%d-%m-%Y",
+        "layout": "dd-mm-yyyy",
+        # Variante mês primeiro (US), escolhida por DateTimeUtils.infer_day_first
+        "format_month_first": "%m-%d-%Y",
+        "layout_month_first": "mm-dd-yyyy"
     },
     {
         "regex": r'^(?:\d{4}[^\w\d]\d{1,2}[^\w\d]\d{1,2})$',
         "pattern": "yyyy?mm?dd",
-        "format": "%Y-%m-%d"
+        "format": "%Y-%m-%d",
+        "layout": "yyyy-mm-dd"
     },
     {
         "regex": r'^(?:\d{1,2}[^\w\d]\d{1,2}[^\w\d]\d{2})$',
         "pattern": "dd?mm?yy",
-        "format": "%d-%m-%y"
+        "format": "%d-%m-%y",
+        "layout": "dd-mm-yy",
+        # Variante mês primeiro (US), escolhida por DateTimeUtils.infer_day_first
+        "format_month_first": "%m-%d-%y",
+        "layout_month_first": "mm-dd-yy"
     },
     {
         "regex": r'^(?:\d{4}(?:0[1-9]|1[0-2])(?:0[1-9]|[1-2][0-9]|3[0-1]))$',
         "pattern": "yyyymmdd",
-        "format": "%Y%m%d"
+        "format": "%Y%m%d",
+        "layout": "yyyymmdd"
     }
 ]
 
 
+# Dois primeiros campos de uma data "dd?mm?yyyy" ou "mm?dd?yyyy"
+regex_date_first_fields: str = r'^(\d{1,2})[^\w\d](\d{1,2})[^\w\d]\d{2,4}$'
+
+
 regex_pattern_bad_date: list[dict[str, str]] = [
     {
         "regex": r'^(?:\d{1}[^\w\d]\d{1}[^\w\d]\d{2})$',
@@ -69,7 +86,8 @@ regex_pattern_datetime_all: list[dict[str, str]] = [
     {
         "regex": r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$',
         "pattern": "YYYY-MM-DD HH:MM:SS",
-        "format": "%Y-%m-%d %H:%M:%S"
+        "format": "%Y-%m-%d %H:%M:%S",
+        "layout": "yyyy-mm-dd HH:MM:SS"
     },
     # T + fração de segundos
     {
@@ -81,19 +99,24 @@ regex_pattern_datetime_all: list[dict[str, str]] = [
     {
         "regex": r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$',
         "pattern": "YYYY-MM-DDTHH:MM:SS",
-        "format": "%Y-%m-%dT%H:%M:%S"
+        "format": "%Y-%m-%dT%H:%M:%S",
+        "layout": "yyyy-mm-ddTHH:MM:SS"
     },
     # Espaço + timezone
     {
         "regex": r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}$',
         "pattern": "YYYY-MM-DD HH:MM:SS±HH:MM",
-        "format": "%Y-%m-%d %H:%M:%S%z"
+        "format": "%Y-%m-%d %H:%M:%S%z",
+        # Layout da parte local, sem o fuso horário
+        "layout": "yyyy-mm-dd HH:MM:SS"
     },
     # T + timezone
     {
         "regex": r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}$',
         "pattern": "YYYY-MM-DDTHH:MM:SS±HH:MM",
-        "format": "%Y-%m-%dT%H:%M:%S%z"
+        "format": "%Y-%m-%dT%H:%M:%S%z",
+        # Layout da parte local, sem o fuso horário
+        "layout": "yyyy-mm-ddTHH:MM:SS"
     },
     # Espaço + fração + timezone
     {
@@ -109,66 +132,64 @@ regex_pattern_datetime_all: list[dict[str, str]] = [
     }
 ]
 
-# TODO: implement normalization with months in text
+# Mês por nome (inglês ou português), com hora opcional.
+# "groups" indica o campo de cada grupo de captura: d dia, m mês, y ano, H hora, M minuto, S segundo.
 regex_pattern_month_name: list[dict[str, str]] = [
-    # Mês abreviado, formato DD-MMM-YYYY
+    # Dia antes do mês: "12-Jan-2024", "3 March 2021", "3 de março de 2021", "12-jan-2024 10:30:00"
     {
-        "regex": r'^\d{1,2}-([A-Za-z]{3})-\d{4}$',
+        "regex": r'^(\d{1,2})[-\s/.]+(?:de\s+)?([^\d\s,./-]+)\.?[-\s/.]+(?:de\s+)?(\d{4})(?:[\sT]+(\d{2}):(\d{2})(?::(\d{2}))?)?$',
         "pattern": "DD-MMM-YYYY",
-        "format": "%d-%b-%Y"
+        "groups": "dmyHMS"
     },
-    # Mês abreviado, formato MMM DD, YYYY
+    # Mês antes do dia: "March 3, 2021", "Jan 12 2024"
     {
-        "regex": r'^([A-Za-z]{3}) \d{1,2}, \d{4}$',
+        "regex": r'^([^\d\s,./-]+)\.?\s+(\d{1,2}),?\s+(\d{4})(?:[\sT]+(\d{2}):(\d{2})(?::(\d{2}))?)?$',
         "pattern": "MMM DD, YYYY",
-        "format": "%b %d, %Y"
-    },
-    # Mês abreviado, formato DD MMM YYYY
-    {
-        "regex": r'^\d{1,2} ([A-Za-z]{3}) \d{4}$',
-        "pattern": "DD MMM YYYY",
-        "format": "%d %b %Y"
-    },
-    # Mês por extenso, formato DD-MMMM-YYYY
-    {
-        "regex": r'^\d{1,2}-([A-Za-z]+)-\d{4}$',
-        "pattern": "DD-MMMM-YYYY",
-        "format": "%d-%B-%Y"
-    },
-    # Mês por extenso, formato MMMM DD, YYYY
-    {
-        "regex": r'^([A-Za-z]+) \d{1,2}, \d{4}$',
-        "pattern": "MMMM DD, YYYY",
-        "format": "%B %d, %Y"
-    },
-    # Mês por extenso, formato DD MMMM YYYY
-    {
-        "regex": r'^\d{1,2} ([A-Za-z]+) \d{4}$',
-        "pattern": "DD MMMM YYYY",
-        "format": "%d %B %Y"
-    },
-    # Mês abreviado + hora, DD-MMM-YYYY HH:MM:SS
-    {
-        "regex": r'^\d{1,2}-([A-Za-z]{3})-\d{4} \d{2}:\d{2}:\d{2}$',
-        "pattern": "DD-MMM-YYYY HH:MM:SS",
-        "format": "%d-%b-%Y %H:%M:%S"
-    },
-    # Mês por extenso + hora, DD-MMMM-YYYY HH:MM:SS
-    {
-        "regex": r'^\d{1,2}-([A-Za-z]+)-\d{4} \d{2}:\d{2}:\d{2}$',
-        "pattern": "DD-MMMM-YYYY HH:MM:SS",
-        "format": "%d-%B-%Y %H:%M:%S"
-    },
-    # Mês abreviado + fração de segundos, DD-MMM-YYYY HH:MM:SS.sss
-    {
-        "regex": r'^\d{1,2}-([A-Za-z]{3})-\d{4} \d{2}:\d{2}:\d{2}\.\d+$',
-        "pattern": "DD-MMM-YYYY HH:MM:SS.sss",
-        "format": "%d-%b-%Y %H:%M:%S.%f"
+        "groups": "mdyHMS"
     },
-    # Mês por extenso + fração de segundos, DD-MMMM-YYYY HH:MM:SS.sss
-    {
-        "regex": r'^\d{1,2}-([A-Za-z]+)-\d{4} \d{2}:\d{2}:\d{2}\.\d+$',
-        "pattern": "DD-MMMM-YYYY HH:MM:SS.sss",
-        "format": "%d-%B-%Y %H:%M:%S.%f"
-    }
 ]
+
+# Número do mês pelo nome, em minúsculas e sem acentos (ver `ACCENT_FOLDING_TABLE`)
+month_number_by_name: dict[str, int] = {
+    # Inglês
+    "january": 1, "jan": 1,
+    "february": 2, "feb": 2,
+    "march": 3, "mar": 3,
+    "april": 4, "apr": 4,
+    "may": 5,
+    "june": 6, "jun": 6,
+    "july": 7, "jul": 7,
+    "august": 8, "aug": 8,
+    "september": 9, "sep": 9, "sept": 9,
+    "october": 10, "oct": 10,
+    "november": 11, "nov": 11,
+    "december": 12, "dec": 12,
+    # Português
+    "janeiro": 1,
+    "fevereiro": 2, "fev": 2,
+    "marco": 3,
+    "abril": 4, "abr": 4,
+    "maio": 5, "mai": 5,
+    "junho": 6,
+    "julho": 7,
+    "agosto": 8, "ago": 8,
+    "setembro": 9, "set": 9,
+    "outubro": 10, "out": 10,
+    "novembro": 11,
+    "dezembro": 12, "dez": 12,
+}
+
+# Todos os formatos convertidos por DateTimeUtils.to_datetime, em ordem de prioridade
+regex_pattern_date_formats: list[dict[str, str]] = (
+    regex_pattern_datetime_all
+    + regex_pattern_date
+    + regex_pattern_month_name
+)
+
+
+translate_table_date_delimiter: dict[int, str] = build_translate_table({
+    "/": "-",
+    " ": "-",
+    "_": "-",
+    ".": "-",
+})
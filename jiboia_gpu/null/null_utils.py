@@ -4,7 +4,13 @@ from ..utils.validation_utils import (
     CudfSupportedDtypes,
     is_valid_to_normalize
 )
+from typing import Any
 import cudf
+import cupy as cp
+
+
+# Séries de valores nulos já criadas na GPU, por conjunto de valores
+NULL_TOKENS_CACHE: dict[tuple[str, ...], cudf.Series] = {}
 
 
 class NullUtils:
@@ -26,11 +32,7 @@ class NullUtils:
         if not is_valid:
             return False
 
-        new_lower_values: list[str] = [v.lower() for v in null_values]
-
-        all_null_values: list[str] = set(new_lower_values + RAW_INVALID_LOWERCASE_VALUES)
-
-        total_rows: int = len(dataframe)
+        all_null_values: list[str] = NullUtils.get_null_values(null_values)
 
         if not inplace:
             dataframe = dataframe.copy()
@@ -43,7 +45,10 @@ class NullUtils:
 
             series_chunk = dataframe.iloc[start_index:end_index, column_index]
 
-            mask: cudf.Series = series_chunk.str.lower().isin(all_null_values)
+            mask: cudf.Series = NullUtils.null_mask(
+                series=series_chunk,
+                null_values=all_null_values
+            )
 
             dataframe.iloc[start_index:end_index, column_index] = series_chunk.where(~mask, None)
 
@@ -62,6 +67,244 @@ class NullUtils:
         
         return True
 
+    @staticmethod
+    def null_mask(
+        series: cudf.Series,
+        null_values: list[str],
+        is_lowercase: bool=False
+    ) -> cudf.Series:
+        """
+        Retorna uma máscara booleana com as linhas cujo valor, em minúsculas,
+        é um dos valores nulos de `null_values`.
+
+        As linhas são pré-filtradas pelo tamanho (diferença dos offsets da
+        coluna de strings): apenas valores com no máximo o tamanho do maior
+        valor nulo são convertidos para minúsculas e comparados com o
+        conjunto de valores nulos (`get_null_tokens`).
+
+        Args:
+            series (cudf.Series): Série de strings.
+            null_values (list[str]): Valores nulos em minúsculas (ver `get_null_values`).
+            is_lowercase (bool): Se True, a série já está em minúsculas e não é convertida.
+        """
+        mask: cp.ndarray = cp.zeros(len(series), dtype=cp.bool_)
+
+        if len(null_values) == 0:
+            return cudf.Series(mask, index=series.index)
+
+        max_length: int = max(len(value) for value in null_values)
+
+        is_candidate: cudf.Series = (series.str.len() <= max_length).fillna(False)
+
+        if not bool(is_candidate.any()):
+            return cudf.Series(mask, index=series.index)
+
+        candidates: cudf.Series = series[is_candidate]
+
+        if not is_lowercase:
+            candidates = candidates.str.lower()
+
+        mask[is_candidate.values] = candidates.isin(NullUtils.get_null_tokens(null_values)).values
+
+        return cudf.Series(mask, index=series.index)
+
+
+    @staticmethod
+    def get_null_tokens(null_values: list[str]) -> cudf.Series:
+        """
+        Retorna os valores nulos como uma série de strings na GPU, criada uma
+        única vez por conjunto de valores e reutilizada nas buscas seguintes.
+        """
+        key: tuple[str, ...] = tuple(sorted(set(null_values)))
+
+        if key not in NULL_TOKENS_CACHE:
+            NULL_TOKENS_CACHE[key] = cudf.Series(list(key), dtype="str")
+
+        return NULL_TOKENS_CACHE[key]
+
+
+    @staticmethod
+    def get_null_values(null_values: list[str] = []) -> list[str]:
+        """
+        Retorna os valores nulos padrão somados a `null_values`, em minúsculas e sem repetição.
+        """
+        new_lower_values: list[str] = [value.lower() for value in null_values]
+
+        return list(dict.fromkeys(RAW_INVALID_LOWERCASE_VALUES + new_lower_values))
+
+
     @staticmethod
     def get_default_nulls() -> list[str]:
         return RAW_INVALID_LOWERCASE_VALUES
+
+
+    @staticmethod
+    def normalize_sentinels(
+        dataframe: cudf.DataFrame,
+        column_name: str,
+        sentinel_values: None|list[Any]=None,
+        detect: bool=False,
+        min_spike_rate: float=0.01,
+        inplace: None|bool=False,
+        show_log: None|bool=True
+    ) -> bool|cudf.DataFrame:
+        """
+        Converte em nulos os valores sentinela de uma coluna tipada
+        (ex.: -999 ou 9999 em colunas numéricas, 1900-01-01 em datas).
+
+        Args:
+            sentinel_values (None|list): Valores sentinela. Números se aplicam a
+                colunas numéricas e strings ISO ('1900-01-01') a colunas datetime.
+            detect (bool): Se True, também detecta sentinelas numéricas pelos
+                picos de frequência nos extremos (ver `detect_sentinels`).
+            min_spike_rate (float): Fração mínima (0–1) de linhas do valor extremo
+                para ser considerado um pico.
+        """
+        valid_types: list[str] = (
+            CudfSupportedDtypes.numeric_types
+            + CudfSupportedDtypes.datetime_types
+            + CudfSupportedDtypes.str_types
+        )
+
+        is_valid: bool = is_valid_to_normalize(
+            series=dataframe[column_name],
+            valid_types=valid_types,
+        )
+
+        if not is_valid:
+            return False
+
+        mask: cudf.Series = NullUtils.sentinel_mask(
+            series=dataframe[column_name],
+            sentinel_values=sentinel_values,
+            detect=detect,
+            min_spike_rate=min_spike_rate
+        )
+
+        if not bool(mask.any()):
+            return False
+
+        if not inplace:
+            dataframe = dataframe.copy()
+
+        dataframe[column_name] = dataframe[column_name].where(~mask, None)
+
+        print_normalize_type_log(
+            column_name=column_name,
+            value_original="sentinel",
+            value_final="<NA>",
+            show_log=show_log
+        )
+
+        if not inplace:
+            return dataframe
+
+        return True
+
+
+    @staticmethod
+    def get_sentinel_values(
+        column_name: str,
+        sentinel_values: None|list[Any]=None,
+        column_sentinel_values: None|dict[str, list[Any]]=None
+    ) -> list[Any]:
+        """
+        Retorna as sentinelas globais somadas às sentinelas da coluna.
+        """
+        column_values: list[Any] = (column_sentinel_values or {}).get(column_name, [])
+
+        return list(sentinel_values or []) + list(column_values)
+
+
+    @staticmethod
+    def sentinel_mask(
+        series: cudf.Series,
+        sentinel_values: None|list[Any]=None,
+        detect: bool=False,
+        min_spike_rate: float=0.01
+    ) -> cudf.Series:
+        """
+        Retorna uma máscara booleana com as linhas cujo valor é uma sentinela,
+        por uma única comparação vetorizada (`isin`).
+
+        Apenas as sentinelas compatíveis com o tipo da série são usadas:
+        números para colunas numéricas, datas ISO para colunas datetime (datas
+        inválidas, como '0000-00-00', são ignoradas) e o texto do valor para
+        colunas de strings.
+        """
+        sentinel_values = list(sentinel_values or [])
+
+        if series.dtype.kind in "iuf":
+            values: list[Any] = [
+                value for value in sentinel_values
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            ]
+
+            if detect:
+                values = values + NullUtils.detect_sentinels(series, min_spike_rate)
+
+        elif series.dtype.kind == "M":
+            date_values: list[str] = [value for value in sentinel_values if isinstance(value, str)]
+
+            values: cudf.Series = cudf.to_datetime(
+                cudf.Series(date_values, dtype="str"),
+                errors="coerce"
+            ).dropna().astype(series.dtype)
+
+        elif str(series.dtype) in CudfSupportedDtypes.str_types:
+            values: list[str] = [str(value) for value in sentinel_values]
+
+        else:
+            values: list[Any] = []
+
+        if len(values) == 0:
+            return cudf.Series(False, index=series.index)
+
+        return series.isin(values).fillna(False)
+
+
+    @staticmethod
+    def detect_sentinels(
+        series: cudf.Series,
+        min_spike_rate: float=0.01,
+        min_distinct: int=5,
+        gap_ratio: float=3.0
+    ) -> list[Any]:
+        """
+        Detecta sentinelas numéricas pelos picos de frequência nos extremos.
+
+        O mínimo ou o máximo é uma sentinela quando ocupa ao menos
+        `min_spike_rate` das linhas não nulas e está separado dos demais
+        valores por uma distância maior que `gap_ratio` vezes a amplitude deles
+        (ex.: -999 em uma coluna de idades entre 0 e 100).
+
+        Colunas com menos de `min_distinct` valores distintos entre os extremos
+        (flags 0/1/2, escalas ordinais 1..5) não têm amplitude confiável e
+        nunca retornam sentinelas.
+        """
+        values: cudf.Series = series.dropna()
+
+        if len(values) == 0:
+            return []
+
+        min_value: Any = values.min()
+        max_value: Any = values.max()
+
+        inner_values: cudf.Series = values[(values != min_value) & (values != max_value)]
+
+        if len(inner_values) == 0 or inner_values.nunique() < min_distinct:
+            return []
+
+        inner_min: Any = inner_values.min()
+        inner_max: Any = inner_values.max()
+        inner_range: Any = inner_max - inner_min
+
+        sentinels: list[Any] = []
+
+        for extreme, gap in ((min_value, inner_min - min_value), (max_value, max_value - inner_max)):
+            spike_rate: float = int((values == extreme).sum()) / len(values)
+
+            if spike_rate >= min_spike_rate and gap > gap_ratio * inner_range:
+                sentinels.append(extreme.item() if hasattr(extreme, "item") else extreme)
+
+        return sentinels
@@ -1,5 +1,4 @@
 RAW_INVALID_LOWERCASE_VALUES: list[str] = [
-    '',
     '',
     ' ',
     '-',
@@ -14,9 +13,7 @@ RAW_INVALID_LOWERCASE_VALUES: list[str] = [
     'null',
     '(null)',
     'none',
-    'nan',
     'undefined',
-    'none',
     'n.d',
     'n.a'
 ]
@@ -1,18 +1,31 @@
+from ..null.null_utils import NullUtils
 from ..utils.log_utils import print_log
+from ..utils.metadata_utils import set_column_metadata
+from ..utils.profile_utils import record_scan
 from ..string.string_utils import StringUtils
-from ..utils.str_utils import combine_regex
+from ..utils.str_utils import (
+    combine_regex,
+    combine_regex_groups
+)
+from ..utils.translate_utils import build_translate_table
 from ..utils.validation_utils import (
     CudfSupportedDtypes,
     is_valid_to_normalize
 )
 from .regex_pattern import (
+    decimal_max_precision,
     regex_pattern_bad_formatted_number,
+    regex_pattern_br_only_formatted_number,
+    regex_pattern_fixed_point_number,
+    regex_pattern_unit_number,
+    regex_pattern_us_formatted_number,
+    regex_unit_number,
     regex_pattern_valid_number,
-    regex_pattern_list
+    regex_pattern_list,
+    translate_table_decimal_comma
 )
 import cudf
 import cupy as cp
-import warnings
 
 
 # TODO: implement normalization in chunks
@@ -22,6 +35,11 @@ class NumberUtils:
         dataframe: cudf.DataFrame,
         column_name: str,
         match_min_rate: None|int=50,
+        decimal: bool=False,
+        as_scaled_int: bool=False,
+        percent_to_fraction: bool=False,
+        sentinel_values: None|list[int|float]=None,
+        detect_sentinels: bool=False,
         inplace: None|bool=False,
         chunk_size: int = 500000,
         show_log: None|bool=True
@@ -32,6 +50,10 @@ class NumberUtils:
         - Se a coluna for string/object, tenta convertê-la para numérica.
         - Se a coluna for float, verifica se pode ser representada como inteiro sem perda de dados.
         - Realiza o downcast para o menor tipo de dado possível.
+        - Com `decimal=True`, colunas de strings em ponto fixo com casas decimais
+          são convertidas para o menor tipo decimal exato (ver `to_decimal`).
+        - Valores com moeda, percentual ou negativos entre parênteses são
+          convertidos por `normalize_unit`.
 
         Args:
             df: O DataFrame cuDF a ser modificado.
@@ -39,6 +61,13 @@ class NumberUtils:
             match_min_rate:
                 A proporção mínima de valores não nulos que devem ser inteiro de 0 a 100
                 numéricos para que uma coluna de string seja convertida (padrão: 0.7).
+            decimal: Se True, converte colunas em ponto fixo para tipo decimal em vez de float.
+            as_scaled_int: Se True (com decimal=True), usa inteiros escalados em vez do tipo decimal.
+            percent_to_fraction: Se True, percentuais são divididos por 100 ("12,5%" -> 0.125).
+            sentinel_values: Valores sentinela (ex.: [-999, 9999]) convertidos em nulos
+                antes da escolha do tipo, permitindo tipos mais estreitos.
+            detect_sentinels: Se True, também detecta sentinelas pelos picos de
+                frequência nos extremos (ver `NullUtils.detect_sentinels`).
             inplace: Se True, modifica o DataFrame original. Se False, retorna uma cópia.
             print_info: Se True, mostra a coluna convertida e o tipo convertido.
 
@@ -68,61 +97,462 @@ class NumberUtils:
         )
 
         if not is_number:
-            return False
+            # Ex.: "R$ 1.234,56", "12,5%", "(1.234,00)"
+            return NumberUtils.normalize_unit(
+                dataframe=dataframe,
+                column_name=column_name,
+                match_min_rate=match_min_rate,
+                percent_to_fraction=percent_to_fraction,
+                decimal=decimal,
+                as_scaled_int=as_scaled_int,
+                inplace=inplace,
+                chunk_size=chunk_size,
+                show_log=show_log
+            )
+
+        is_str_column: bool = original_dtype in CudfSupportedDtypes.str_types
+
+        col: cudf.Series = dataframe[column_name]
+
+        if is_str_column:
+            thousands_sep, decimal_sep = NumberUtils.infer_separators(
+                series=col,
+                chunk_size=chunk_size
+            )
+
+            # Valores e máscara de validade saem da mesma conversão
+            numeric_col, valid_mask = NumberUtils.parse_number(
+                series=col,
+                thousands_sep=thousands_sep,
+                decimal_sep=decimal_sep
+            )
+
+            non_null_before: int = len(col) - col.null_count
+            non_null_after: int = int(valid_mask.sum())
+
+            if not (round((non_null_after / non_null_before)*100) >= match_min_rate):
+                return False
+
+            text_col: cudf.Series = col
+            col: cudf.Series = numeric_col
 
         if not inplace:
             dataframe: cudf.DataFrame = dataframe.copy()
 
-        original_dtype: cp.dtypes = dataframe[column_name].dtype
+        # Sentinelas viram nulos antes da escolha do tipo (ex.: -999 impede uint8)
+        if sentinel_values or detect_sentinels:
+            sentinel_mask: cudf.Series = NullUtils.sentinel_mask(
+                series=col,
+                sentinel_values=sentinel_values,
+                detect=detect_sentinels
+            )
+
+            col = col.where(~sentinel_mask, None)
+
+            if is_str_column:
+                valid_mask = valid_mask & ~sentinel_mask
+
+        narrow_dtype: str = NumberUtils.get_narrow_dtype(series=col)
+
+        is_decimal: bool = False
+
+        if decimal and is_str_column and narrow_dtype in CudfSupportedDtypes.float_types:
+            # Valores que não são números viram nulos, como no to_numeric
+            dataframe[column_name] = NumberUtils.normalize_separators(
+                series=text_col,
+                thousands_sep=thousands_sep,
+                decimal_sep=decimal_sep
+            ).where(valid_mask, None)
 
-        if original_dtype in CudfSupportedDtypes.str_types:
-            NumberUtils.fix_decimal(
+            is_decimal = NumberUtils.to_decimal(
                 dataframe=dataframe,
                 column_name=column_name,
-                inplace=True
+                as_scaled_int=as_scaled_int,
+                inplace=True,
+                show_log=show_log
             )
 
-        col: cudf.Series = dataframe[column_name]
+        if not is_decimal:
+            dataframe[column_name] = col.astype(narrow_dtype)
+            print_log(column_name=column_name, column_type=narrow_dtype, show_log=show_log)
 
-        if original_dtype in CudfSupportedDtypes.str_types and match_min_rate == 0:
-            col: cudf.Series = cudf.to_numeric(col, errors="coerce")
+        if not inplace:
+            return dataframe
 
-        if original_dtype in CudfSupportedDtypes.str_types:
-            numeric_col: cudf.Series = cudf.to_numeric(col, errors="coerce")
-            non_null_before: int = col.notna().sum()      
-            non_null_after: int = numeric_col.notna().sum()
+        return True
 
-            if not (round((non_null_after / non_null_before)*100) >= match_min_rate):
-                return False
 
-            col: cudf.Series = numeric_col
+    @staticmethod
+    def normalize_unit(
+        dataframe: cudf.DataFrame,
+        column_name: str,
+        match_min_rate: None|int=50,
+        percent_to_fraction: bool=False,
+        decimal: bool=False,
+        as_scaled_int: bool=False,
+        inplace: None|bool=False,
+        chunk_size: int = 500_000,
+        show_log: None|bool=True
+    ) -> bool|cudf.DataFrame:
+        """
+        Converte uma coluna de valores monetários e percentuais em número.
+
+        Formatos aceitos, com separadores brasileiros ou americanos:
+            - moeda antes ou depois do número: 'R$ 1.234,56', 'US$ 10.00', '10 €'
+            - percentual: '12,5%'
+            - negativo contábil entre parênteses: '(1.234,00)', '(R$ 5,00)'
+
+        A unidade encontrada ('R$', '%', ...) é registrada nos metadados da
+        coluna (`get_column_metadata`). Colunas com mais de uma unidade não
+        são convertidas.
+
+        Parâmetros
+        ----------
+        dataframe : cudf.DataFrame
+            DataFrame de entrada.
+        column_name : str
+            Nome da coluna.
+        match_min_rate : int, default=50
+            Percentual mínimo (0–100) de valores válidos para converter a coluna.
+        percent_to_fraction : bool, default=False
+            Se True, percentuais são divididos por 100 ('12,5%' -> 0.125).
+            Não se aplica à saída decimal, que mantém os pontos percentuais.
+        decimal : bool, default=False
+            Se True, usa o menor tipo decimal exato (ver `to_decimal`).
+        as_scaled_int : bool, default=False
+            Se True (com decimal=True), usa inteiros escalados.
+        inplace : bool, default=False
+            Se True, altera o DataFrame original. Caso contrário, retorna uma cópia.
+        chunk_size : int, default=500_000
+            Número máximo de linhas por chunk na verificação.
+        show_log : bool, default=True
+            Se True, imprime o tipo convertido.
+        """
+        is_valid: bool = is_valid_to_normalize(
+            series=dataframe[column_name],
+            valid_types=CudfSupportedDtypes.str_types,
+        )
 
-        if cp.issubdtype(col.dtype, cp.floating):
-            is_integer_column: bool = ((col.round(0) == col) | col.isna()).all()
-            
-            if is_integer_column:
-                warnings.filterwarnings("ignore", category=UserWarning)
+        if not is_valid:
+            return False
 
-                dataframe[column_name] = cudf.to_numeric(col, downcast="integer")
+        has_unit_number: bool = StringUtils.match(
+            series=dataframe[column_name],
+            regex=combine_regex(regex_pattern_unit_number),
+            match_min_rate=match_min_rate,
+            chunk_size=chunk_size
+        )
 
-                warnings.resetwarnings()
+        if not has_unit_number:
+            return False
 
-                print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
-            else:
-                # Usar downcast=float faz percer precisão ao converter em float32
-                dataframe[column_name] = cudf.to_numeric(col, downcast=None)
-                print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
+        values, text_values, units, has_parentheses = NumberUtils.parse_unit_number(
+            series=dataframe[column_name],
+            percent_to_fraction=(percent_to_fraction and not decimal)
+        )
+
+        # Sem unidade nem parênteses a coluna é numérica simples (ver `normalize`)
+        if len(units) > 1 or (not units and not has_parentheses):
+            return False
+
+        non_null_before: int = len(values) - dataframe[column_name].null_count
+        non_null_after: int = len(values) - values.null_count
+
+        if not (round((non_null_after / non_null_before)*100) >= match_min_rate):
+            return False
+
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
+
+        is_decimal: bool = False
+
+        if decimal:
+            dataframe[column_name] = text_values.where(values.notna(), None)
+
+            is_decimal = NumberUtils.to_decimal(
+                dataframe=dataframe,
+                column_name=column_name,
+                as_scaled_int=as_scaled_int,
+                inplace=True,
+                show_log=show_log
+            )
+
+        if not is_decimal:
+            narrow_dtype: str = NumberUtils.get_narrow_dtype(series=values)
+
+            dataframe[column_name] = values.astype(narrow_dtype)
+
+            print_log(column_name=column_name, column_type=narrow_dtype, show_log=show_log)
+
+        set_column_metadata(
+            dataframe=dataframe,
+            column_name=column_name,
+            unit=(units[0] if units else None),
+            percent_to_fraction=(percent_to_fraction and not decimal and units == ["%"])
+        )
 
-        elif cp.issubdtype(col.dtype, cp.integer):
-            dataframe[column_name] = cudf.to_numeric(col, downcast="integer")
-            print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
-        
         if not inplace:
             return dataframe
 
         return True
 
 
+    @staticmethod
+    def parse_unit_number(
+        series: cudf.Series,
+        percent_to_fraction: bool=False
+    ) -> tuple[cudf.Series, cudf.Series, list[str], bool]:
+        """
+        Separa, em uma única busca por regex, a moeda/percentual, o sinal, os
+        parênteses e o número de cada valor, e converte o número.
+
+        Returns:
+            tuple: Os valores (float64, nulos onde o texto não é válido), o
+                número em texto com "." decimal e sinal (para `to_decimal`), as
+                unidades distintas encontradas e se há negativos entre parênteses.
+        """
+        groups: cudf.DataFrame = series.str.extract(regex_unit_number)
+
+        open_parenthesis: cudf.Series = groups[0].notna()
+        close_parenthesis: cudf.Series = groups[5].notna()
+        unit: cudf.Series = groups[2].fillna(groups[4])
+
+        thousands_sep, decimal_sep = NumberUtils.infer_separators(series=groups[3])
+
+        values, _ = NumberUtils.parse_number(
+            series=groups[3],
+            thousands_sep=thousands_sep,
+            decimal_sep=decimal_sep
+        )
+
+        is_negative: cudf.Series = (open_parenthesis & close_parenthesis) | (groups[1] == "-").fillna(False)
+
+        values = values.where(~is_negative, -values)
+
+        # Parênteses sem par invalidam o valor
+        values = values.where(open_parenthesis == close_parenthesis, None)
+
+        units: list[str] = unit.dropna().unique().to_arrow().to_pylist()
+
+        if percent_to_fraction and units == ["%"]:
+            values = values / 100
+
+        text_values: cudf.Series = NumberUtils.normalize_separators(
+            series=groups[3],
+            thousands_sep=thousands_sep,
+            decimal_sep=decimal_sep
+        )
+        text_values = text_values.where(~is_negative, text_values.str.insert(0, "-"))
+
+        has_parentheses: bool = bool((open_parenthesis & close_parenthesis).any())
+
+        return values, text_values, units, has_parentheses
+
+
+    @staticmethod
+    def get_narrow_dtype(series: cudf.Series) -> str:
+        """
+        Retorna o menor tipo numérico que representa todos os valores da série
+        sem perda.
+
+        - Valores inteiros (inclusive floats como 1.0): o menor entre int8–int64
+          e uint8–uint64 que comporta o mínimo e o máximo. Para o mesmo tamanho,
+          o tipo com sinal é preferido.
+        - Valores com casas decimais: float32 somente se todos os valores voltam
+          idênticos após a conversão float64 -> float32 -> float64; senão float64.
+        """
+        if type(series.dtype).__name__ in CudfSupportedDtypes.decimal_types:
+            return str(series.dtype)
+
+        number_stats: dict[str, float|bool] = NumberUtils.get_number_stats(series)
+
+        if number_stats["is_empty"]:
+            return str(series.dtype)
+
+        if number_stats["is_integral"]:
+            min_value: float = number_stats["min"]
+            max_value: float = number_stats["max"]
+
+            for int_dtype, uint_dtype in (
+                ("int8", "uint8"),
+                ("int16", "uint16"),
+                ("int32", "uint32"),
+                ("int64", "uint64"),
+            ):
+                if cp.iinfo(int_dtype).min <= min_value and max_value <= cp.iinfo(int_dtype).max:
+                    return int_dtype
+
+                if min_value >= 0 and max_value <= cp.iinfo(uint_dtype).max:
+                    return uint_dtype
+
+        if not cp.issubdtype(series.dtype, cp.floating):
+            return str(series.dtype)
+
+        if number_stats["is_float32"]:
+            return "float32"
+
+        return "float64"
+
+
+    @staticmethod
+    def get_number_stats(series: cudf.Series) -> dict[str, float|bool]:
+        """
+        Calcula, em reduções sobre a coluna, o mínimo, o máximo e se todos os
+        valores não nulos são inteiros e exatos em float32.
+        """
+        total_valid: int = len(series) - series.null_count
+
+        if total_valid == 0:
+            return {"is_empty": True}
+
+        min_value = series.min()
+        max_value = series.max()
+
+        if not cp.issubdtype(series.dtype, cp.floating):
+            return {
+                "is_empty": False,
+                "min": min_value,
+                "max": max_value,
+                "is_integral": True,
+                "is_float32": False,
+            }
+
+        is_integral: bool = bool(((series.round(0) == series) | series.isna()).all())
+
+        is_float32: bool = bool(
+            ((series.astype("float32").astype("float64") == series) | series.isna()).all()
+        )
+
+        return {
+            "is_empty": False,
+            "min": float(min_value),
+            "max": float(max_value),
+            "is_integral": is_integral,
+            "is_float32": is_float32,
+        }
+
+
+    @staticmethod
+    def parse_number(
+        series: cudf.Series,
+        thousands_sep: None|str=None,
+        decimal_sep: None|str=None
+    ) -> tuple[cudf.Series, cudf.Series]:
+        """
+        Converte uma série de strings numéricas em float64 em uma única
+        conversão, retornando também a máscara de validade.
+
+        Os separadores podem ser informados ou inferidos pela coluna
+        (`infer_separators`). Formatos aceitos, além dos números simples e
+        notação científica:
+            - brasileiro: '1.234,56', '0,99' (thousands_sep=".", decimal_sep=",")
+            - americano: '1,234.56', '1,234,567' (thousands_sep=",", decimal_sep=".")
+
+        Args:
+            series (cudf.Series): Série de strings.
+            thousands_sep (str | None): Separador de milhar.
+            decimal_sep (str | None): Separador decimal.
+
+        Returns:
+            tuple[cudf.Series, cudf.Series]: Os valores (nulos onde a string não
+                é um número) e a máscara booleana das linhas convertidas.
+        """
+        if thousands_sep is None or decimal_sep is None:
+            inferred_thousands_sep, inferred_decimal_sep = NumberUtils.infer_separators(series)
+
+            thousands_sep = thousands_sep or inferred_thousands_sep
+            decimal_sep = decimal_sep or inferred_decimal_sep
+
+        normalized_series: cudf.Series = NumberUtils.normalize_separators(
+            series=series,
+            thousands_sep=thousands_sep,
+            decimal_sep=decimal_sep
+        )
+
+        values: cudf.Series = cudf.to_numeric(normalized_series, errors="coerce")
+
+        record_scan(rows=len(series), passes=1)
+
+        valid_mask: cudf.Series = values.notna()
+
+        return values, valid_mask
+
+
+    @staticmethod
+    def infer_separators(
+        series: cudf.Series,
+        chunk_size: int = 500_000
+    ) -> tuple[str, str]:
+        """
+        Infere os separadores de milhar e decimal de uma coluna.
+
+        Retorna (",", ".") quando há valores no formato americano ('1,234.56')
+        e nenhum valor que só pode ser brasileiro ('1.234,56', '0,99').
+        Caso contrário retorna (".", ","), pois '1,234' é lido como decimal.
+
+        Os dois formatos são buscados em uma única avaliação de regex por
+        chunk, e a busca termina no primeiro chunk com um valor brasileiro.
+        """
+        labeled_regex, group_indexes = combine_regex_groups(
+            regex_pattern_br_only_formatted_number + regex_pattern_us_formatted_number
+        )
+
+        br_group_indexes: list[int] = group_indexes[:len(regex_pattern_br_only_formatted_number)]
+        us_group_indexes: list[int] = group_indexes[len(regex_pattern_br_only_formatted_number):]
+
+        has_us_number: bool = False
+
+        total_rows: int = len(series)
+
+        record_scan(passes=1)
+
+        for start_index in range(0, total_rows, chunk_size):
+            end_index: int = min(start_index + chunk_size, total_rows)
+
+            extracted: cudf.DataFrame = series.iloc[start_index:end_index].str.extract(labeled_regex)
+
+            record_scan(rows=end_index - start_index)
+
+            if any(bool(extracted[group_index].notna().any()) for group_index in br_group_indexes):
+                return ".", ","
+
+            if not has_us_number:
+                has_us_number = any(
+                    bool(extracted[group_index].notna().any()) for group_index in us_group_indexes
+                )
+
+        if has_us_number:
+            return ",", "."
+
+        return ".", ","
+
+
+    @staticmethod
+    def normalize_separators(
+        series: cudf.Series,
+        thousands_sep: str,
+        decimal_sep: str
+    ) -> cudf.Series:
+        """
+        Remove o separador de milhar e troca o separador decimal por "." em
+        uma única tradução de caracteres.
+
+        Com decimal_sep="," apenas as linhas que contêm "," são traduzidas,
+        pois nas demais o "." já é o separador decimal ('10.5', '1e-3').
+        """
+        translate_table: dict[int, str] = build_translate_table({
+            thousands_sep: None,
+            decimal_sep: ".",
+        })
+
+        if decimal_sep == ".":
+            return series.str.translate(translate_table)
+
+        has_decimal_sep: cudf.Series = series.str.contains(decimal_sep, regex=False)
+
+        return series.str.translate(translate_table).where(has_decimal_sep, series)
+
+
     @staticmethod
     def fix_decimal(
         dataframe: cudf.DataFrame,
@@ -184,11 +614,7 @@ class NumberUtils:
 
             mask: cudf.Series = series_chunk.str.match(pattern)
 
-            series_chunk.loc[mask] = (
-                series_chunk.loc[mask]
-                .str.replace(".", "", regex=False)
-                .str.replace(",", ".", regex=False)
-            )
+            series_chunk.loc[mask] = series_chunk.loc[mask].str.translate(translate_table_decimal_comma)
 
             dataframe.iloc[start_index:end_index, column_index] = series_chunk
 
@@ -201,6 +627,155 @@ class NumberUtils:
         return True
 
 
+    @staticmethod
+    def to_decimal(
+        dataframe: cudf.DataFrame,
+        column_name: str,
+        as_scaled_int: bool=False,
+        inplace: None|bool=False,
+        show_log: None|bool=True
+    ) -> bool|cudf.DataFrame:
+        """
+        Converte uma coluna de strings em ponto fixo ('1234.56', '0.99', '-10')
+        para o menor tipo decimal que representa todos os valores sem perda
+        (Decimal32, Decimal64 ou Decimal128).
+
+        A escala é o maior número de casas decimais da coluna e a precisão é o
+        maior número de dígitos inteiros somado à escala, de modo que nenhum
+        valor é arredondado e as somas ficam exatas.
+
+        Com `as_scaled_int=True`, ou se o tipo decimal não existir na versão do
+        cuDF, a coluna é convertida para int64 com o valor multiplicado por
+        10 ** escala (ex.: '12.5' com escala 2 -> 1250). A escala é registrada
+        nos metadados da coluna (`get_column_metadata`).
+
+        Parâmetros
+        ----------
+        dataframe : cudf.DataFrame
+            DataFrame de entrada.
+        column_name : str
+            Nome da coluna, com "." como separador decimal (ver `fix_decimal`).
+        as_scaled_int : bool, default=False
+            Se True, usa inteiros escalados em vez do tipo decimal.
+        inplace : bool, default=False
+            Se True, altera o DataFrame original. Caso contrário, retorna uma cópia.
+        show_log : bool, default=True
+            Se True, imprime o tipo convertido.
+
+        Retorna False se algum valor não nulo não for um número em ponto fixo,
+        se a coluna não tiver casas decimais ou se a precisão exceder o tipo.
+        """
+        is_valid: bool = is_valid_to_normalize(
+            series=dataframe[column_name],
+            valid_types=CudfSupportedDtypes.str_types,
+        )
+
+        if not is_valid:
+            return False
+
+        fixed_point: None|tuple[int, int] = NumberUtils.get_fixed_point_scale(
+            series=dataframe[column_name]
+        )
+
+        if fixed_point is None:
+            return False
+
+        precision, scale = fixed_point
+
+        if scale == 0:
+            return False
+
+        decimal_dtype_name: None|str = next(
+            (
+                dtype_name for dtype_name, max_precision in decimal_max_precision.items()
+                if precision <= max_precision
+            ),
+            None
+        )
+
+        if decimal_dtype_name is None:
+            return False
+
+        is_scaled_int: bool = as_scaled_int or not hasattr(cudf, decimal_dtype_name)
+
+        if is_scaled_int and precision > decimal_max_precision["Decimal64Dtype"]:
+            return False
+
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
+
+        series: cudf.Series = dataframe[column_name]
+
+        if is_scaled_int:
+            fraction_digits: cudf.Series = NumberUtils.get_fraction_digits(series).fillna(0)
+
+            int_values: cudf.Series = series.str.translate({ord("."): ""}).astype("int64")
+
+            scale_factor: cp.ndarray = cp.power(
+                10,
+                scale - fraction_digits.values,
+                dtype=cp.int64
+            )
+
+            dataframe[column_name] = int_values * scale_factor
+
+            set_column_metadata(
+                dataframe=dataframe,
+                column_name=column_name,
+                scale=scale
+            )
+        else:
+            decimal_dtype = getattr(cudf, decimal_dtype_name)(precision=precision, scale=scale)
+
+            dataframe[column_name] = series.astype(decimal_dtype)
+
+        print_log(column_name=column_name, column_type=str(dataframe[column_name].dtype), show_log=show_log)
+
+        if not inplace:
+            return dataframe
+
+        return True
+
+
+    @staticmethod
+    def get_fixed_point_scale(series: cudf.Series) -> None|tuple[int, int]:
+        """
+        Retorna a precisão (total de dígitos) e a escala (casas decimais)
+        necessárias para representar todos os valores da série sem perda,
+        ou None se algum valor não nulo não for um número em ponto fixo.
+        """
+        combined_regex: str = combine_regex(regex_pattern_fixed_point_number)
+
+        total_fixed_point: int = int(series.str.match(combined_regex).sum())
+
+        if total_fixed_point != (len(series) - series.null_count):
+            return None
+
+        # Zeros à esquerda não contam na precisão: '007.50' -> '7.50'
+        digits: cudf.Series = series.str.lstrip("+-").str.lstrip("0")
+
+        dot_index: cudf.Series = digits.str.find(".")
+
+        integer_digits: cudf.Series = dot_index.where(dot_index >= 0, digits.str.len())
+
+        scale: int = int(NumberUtils.get_fraction_digits(series).max())
+        precision: int = max(int(integer_digits.max()) + scale, 1)
+
+        return precision, scale
+
+
+    @staticmethod
+    def get_fraction_digits(series: cudf.Series) -> cudf.Series:
+        """
+        Retorna o número de casas decimais de cada valor ('12.50' -> 2, '3' -> 0).
+        """
+        dot_index: cudf.Series = series.str.find(".")
+
+        fraction_digits: cudf.Series = series.str.len() - dot_index - 1
+
+        return fraction_digits.where(dot_index >= 0, 0)
+
+
     @staticmethod
     def is_number_in_str(
         series: cudf.Series,
@@ -214,7 +789,11 @@ class NumberUtils:
         if not is_valid:
             return False
 
-        all_regex_valid_number: list[dict[str, str]] = regex_pattern_valid_number + regex_pattern_bad_formatted_number
+        all_regex_valid_number: list[dict[str, str]] = (
+            regex_pattern_valid_number
+            + regex_pattern_bad_formatted_number
+            + regex_pattern_us_formatted_number
+        )
 
         combined_regex: str = combine_regex(all_regex_valid_number)
 
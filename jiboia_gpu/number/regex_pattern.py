@@ -1,8 +1,23 @@
+from ..utils.translate_utils import build_translate_table
+
+
 regex_pattern_bad_formatted_number: list[dict[str, str]] = [
     {"regex": r'^[-+]?\d+(?:\.\d{3})*,\d+$', "pattern": "d.ddd,dddd"},
     {"regex": r'^[-+]?\d*,\d+$', "pattern": "dddd,dddd"},
 ]
 
+# Formato americano: "," separador de milhar e "." separador decimal
+regex_pattern_us_formatted_number: list[dict[str, str]] = [
+    {"regex": r'^[-+]?\d{1,3}(?:,\d{3})+\.\d+$', "pattern": "d,ddd.dddd"},
+    {"regex": r'^[-+]?\d{1,3}(?:,\d{3}){2,}$', "pattern": "d,ddd,ddd"},
+]
+
+# Formato brasileiro que não pode ser lido como americano ("1,234" é ambíguo)
+regex_pattern_br_only_formatted_number: list[dict[str, str]] = [
+    {"regex": r'^[-+]?\d{1,3}(?:\.\d{3})+,\d+$', "pattern": "d.ddd,dddd"},
+    {"regex": r'^[-+]?\d*,(?:\d{1,2}|\d{4,})$', "pattern": "dddd,dd"},
+]
+
 regex_pattern_valid_number: list[dict[str, str]] = [
     {"regex": r'^\d+$', "pattern": "d"},
     {"regex": r'^\d+\.\d+$', "pattern": "d.d"},
@@ -10,6 +25,39 @@ regex_pattern_valid_number: list[dict[str, str]] = [
     {"regex": r'^[+-]?(?:\d+|\d+\.\d+|\.\d+)[eE][+-]?\d+$', "pattern": "scientific"},
 ]
 
+# Números em ponto fixo, já com "." como separador decimal (sem notação científica)
+regex_pattern_fixed_point_number: list[dict[str, str]] = [
+    {"regex": r'^[-+]?\d+$', "pattern": "d"},
+    {"regex": r'^[-+]?\d*\.\d+$', "pattern": "d.d"},
+]
+
+# Maior precisão (total de dígitos) suportada por cada tipo decimal
+decimal_max_precision: dict[str, int] = {
+    "Decimal32Dtype": 9,
+    "Decimal64Dtype": 18,
+    "Decimal128Dtype": 38,
+}
+
+# Moeda antes ou depois do número, percentual e negativo entre parênteses.
+# Grupos: "(", sinal, unidade prefixo, número, unidade sufixo, ")"
+# Ex.: "R$ 1.234,56", "-US$ 10.00", "12,5%", "(1.234,00)", "10 €"
+regex_unit_number: str = (
+    r'^(\()?\s*([-+])?\s*(R\$|US\$|U\$|\$|€|£|¥)?\s*'
+    r'(\d[\d.,]*|[.,]\d+)'
+    r'\s*(%|R\$|US\$|U\$|\$|€|£|¥)?\s*(\))?$'
+)
+
+regex_pattern_unit_number: list[dict[str, str]] = [
+    {"regex": regex_unit_number, "pattern": "(R$ d.ddd,dd)"},
+]
+
 regex_pattern_list: list[dict[str, str]] = [
     {"regex": r'[\[\]]', "pattern": "[...]"},
 ]
+
+
+# "1.234,56" -> "1234.56": remove o separador de milhar e troca o decimal
+translate_table_decimal_comma: dict[int, str] = build_translate_table({
+    ".": None,
+    ",": ".",
+})
@@ -2,33 +2,46 @@ from ..boolean.regex_pattern import (
     regex_pattern_boolean_raw,
     regex_pattern_boolean_numeric_raw
 )
+from ..utils.cardinality_utils import is_high_cardinality
 from ..utils.chunk_utils import chunk_iterate
 from ..datetime.regex_pattern import (
     regex_pattern_date,
-    regex_pattern_datetime_all
+    regex_pattern_datetime_all,
+    regex_pattern_month_name
 )
+from ..utils.profile_utils import record_scan
 from ..utils.log_utils import (
     print_normalize_space_log,
     print_normalize_string_log,
+    print_normalize_type_log,
     print_to_category_log
 )
+from ..null.null_utils import NullUtils
 from ..number.regex_pattern import (
     regex_pattern_bad_formatted_number,
     regex_pattern_valid_number
 )
-from ..time.regex_pattern import (
-    regex_pattern_time_utc,
-    regex_pattern_time_hh_mm,
-    regex_pattern_time_hh_mm_ss,
-    regex_pattern_time_hh_mm_ss_n
+from ..time.regex_pattern import regex_pattern_time_fields
+from ..utils.str_utils import (
+    combine_regex,
+    combine_regex_groups
 )
-from ..utils.str_utils import combine_regex
+from ..utils.translate_utils import ACCENT_FOLDING_TABLE
 from ..utils.validation_utils import (
     CudfSupportedDtypes,
     is_valid_to_normalize
 )
-from typing import Literal
+from typing import Literal, NamedTuple
 import cudf
+import cupy as cp
+import pandas as pd
+
+
+class MatchResult(NamedTuple):
+    matched: bool
+    scanned: int
+    decided_early: bool
+    match_count: int
 
 
 class StringUtils:
@@ -38,11 +51,43 @@ class StringUtils:
         column_name: str,
         to_case: None|Literal['lower', 'upper']=None,
         to_ASCII: bool=False,
+        null_values: None|list[str]=None,
         inplace: bool=False,
         chunk_size: int=500_000,
         show_log: bool=True,
     ) -> bool|cudf.DataFrame:
+        """
+        Normaliza uma coluna de strings em uma única passada por chunk, aplicando
+        em sequência, sobre o mesmo chunk:
+
+        1. remoção de espaços duplicados e nas bordas;
+        2. conversão para minúsculo ou maiúsculo (`to_case`);
+        3. remoção de acentos (`to_ASCII`);
+        4. substituição dos valores nulos por <NA> (`null_values`).
 
+        O resultado de cada chunk é gravado uma única vez na coluna.
+
+        Parâmetros
+        ----------
+        dataframe : cudf.DataFrame
+            DataFrame de entrada.
+        column_name : str
+            Nome da coluna.
+        to_case : {'lower', 'upper'} | None, default=None
+            Se definido, converte todos os textos para minúsculo ou maiúsculo.
+        to_ASCII : bool, default=False
+            Se True, converte caracteres acentuados para ASCII puro.
+        null_values : list[str] | None, default=None
+            Se definido, os valores nulos padrão (`NullUtils.get_default_nulls`)
+            e os desta lista são convertidos para <NA>. Se None, os nulos não
+            são tratados.
+        inplace : bool, default=False
+            Se True, altera o DataFrame original. Caso contrário, retorna uma cópia.
+        chunk_size : int, default=500_000
+            Número máximo de linhas processadas por vez.
+        show_log : bool, default=True
+            Se True, imprime os logs de normalização.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=dataframe[column_name],
             valid_types=CudfSupportedDtypes.str_types,
@@ -54,24 +99,64 @@ class StringUtils:
         if not inplace:
             dataframe: cudf.DataFrame = dataframe.copy()
 
-        StringUtils.normalize_spaces(
-            dataframe=dataframe,
+        all_null_values: None|list[str] = None
+
+        if null_values is not None:
+            all_null_values = NullUtils.get_null_values(null_values)
+
+        total_rows: int = len(dataframe)
+        column_index: int = dataframe.columns.get_loc(column_name)
+
+        for start_index in range(0, total_rows, chunk_size):
+            end_index: int = min(start_index + chunk_size, total_rows)
+
+            series_chunk = dataframe.iloc[start_index:end_index, column_index]
+
+            # normaliza espaços, já removendo os espaços do início/fim
+            series_chunk = series_chunk.str.normalize_spaces()
+
+            if to_case == "lower":
+                series_chunk = series_chunk.str.lower()
+
+            if to_case == "upper":
+                series_chunk = series_chunk.str.upper()
+
+            if to_ASCII:
+                series_chunk = series_chunk.str.translate(ACCENT_FOLDING_TABLE)
+
+            if all_null_values is not None:
+                mask: cudf.Series = NullUtils.null_mask(
+                    series=series_chunk,
+                    null_values=all_null_values,
+                    is_lowercase=(to_case == "lower")
+                )
+                series_chunk = series_chunk.where(~mask, None)
+
+            dataframe.iloc[start_index:end_index, column_index] = series_chunk
+
+        del column_index
+        del total_rows
+
+        print_normalize_space_log(
             column_name=column_name,
-            inplace=True,
-            chunk_size=chunk_size,
             show_log=show_log
         )
 
-        StringUtils.normalize_str(
-            dataframe=dataframe,
+        print_normalize_string_log(
             column_name=column_name,
+            show_log=show_log,
             to_case=to_case,
-            to_ASCII=to_ASCII,
-            inplace=True,
-            chunk_size=chunk_size,
-            show_log=show_log
+            to_ASCII=to_ASCII
         )
 
+        if all_null_values is not None:
+            print_normalize_type_log(
+                column_name=column_name,
+                value_original="null",
+                value_final="<NA>",
+                show_log=show_log
+            )
+
         if not inplace:
             return dataframe
         return True
@@ -156,8 +241,7 @@ class StringUtils:
                 return dataframe
             return True
 
-        if to_ASCII and to_case == "lower":
-
+        if to_ASCII:
             total_rows: int = len(dataframe)
             column_index: int = dataframe.columns.get_loc(column_name)
 
@@ -166,15 +250,14 @@ class StringUtils:
 
                 series_chunk = dataframe.iloc[start_index:end_index, column_index]
 
-                series_chunk = (
-                    series_chunk.str.lower()
-                    .str.replace(r"[áàâãä]", "a", regex=True)
-                    .str.replace(r"[éèêë]", "e", regex=True)
-                    .str.replace(r"[íìîï]", "i", regex=True)
-                    .str.replace(r"[óòôõö]", "o", regex=True)
-                    .str.replace(r"[úùûü]", "u", regex=True)
-                    .str.replace(r"[ç]", "c", regex=True)
-                )
+                if to_case == "lower":
+                    series_chunk = series_chunk.str.lower()
+
+                if to_case == "upper":
+                    series_chunk = series_chunk.str.upper()
+
+                # substituição de todos os acentos e cedilhas em uma única passada
+                series_chunk = series_chunk.str.translate(ACCENT_FOLDING_TABLE)
 
                 dataframe.iloc[start_index:end_index, column_index] = series_chunk
 
@@ -187,138 +270,169 @@ class StringUtils:
                 to_case=to_case,
                 to_ASCII=to_ASCII
             )
-
+            
             if not inplace:
                 return dataframe
             return True
 
-        if to_ASCII and to_case == "upper":
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
-
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
-
-                series_chunk = dataframe.iloc[start_index:end_index, column_index]
-
-                # normalização para uppercase e remoção de acentos maiúsculos
-                series_chunk = (
-                    series_chunk.str.upper()
-                    .str.replace(r"[ÁÀÂÃÄ]", "A", regex=True)
-                    .str.replace(r"[ÉÈÊË]", "E", regex=True)
-                    .str.replace(r"[ÍÌÎÏ]", "I", regex=True)
-                    .str.replace(r"[ÓÒÔÕÖ]", "O", regex=True)
-                    .str.replace(r"[ÚÙÛÜ]", "U", regex=True)
-                    .str.replace(r"[Ç]", "C", regex=True)
-                )
-
-                dataframe.iloc[start_index:end_index, column_index] = series_chunk
+        return False
 
-            del column_index
-            del total_rows
 
-            print_normalize_string_log(
-                column_name=column_name,
-                show_log=show_log,
-                to_case=to_case,
-                to_ASCII=to_ASCII
-            )
+    @staticmethod
+    def translate(
+        dataframe: cudf.DataFrame,
+        column_name: str,
+        translate_table: dict[int, str],
+        inplace: bool=False,
+        chunk_size: int=500_000,
+    ) -> bool|cudf.DataFrame:
+        """
+        Traduz os caracteres de uma coluna de strings em uma única passada
+        por chunk, mapeando cada caractere para outro ou removendo-o.
 
-            if not inplace:
-                return dataframe
-            return True
-        
+        Parâmetros
+        ----------
+        dataframe : cudf.DataFrame
+            DataFrame de entrada.
+        column_name : str
+            Nome da coluna.
+        translate_table : dict[int, str]
+            Tabela criada com `build_translate_table` (ex.: ACCENT_FOLDING_TABLE).
+        inplace : bool, default=False
+            Se True, altera o DataFrame original. Caso contrário, retorna uma cópia.
+        chunk_size : int, default=500_000
+            Número máximo de linhas processadas por vez.
+        """
+        is_valid: bool = is_valid_to_normalize(
+            series=dataframe[column_name],
+            valid_types=CudfSupportedDtypes.str_types,
+        )
 
-        if to_ASCII and not to_case:
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
+        if not is_valid:
+            return False
 
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
 
-                series_chunk = dataframe.iloc[start_index:end_index, column_index]
+        total_rows: int = len(dataframe)
+        column_index: int = dataframe.columns.get_loc(column_name)
 
-                # substituição de todos os acentos e cedilhas
-                series_chunk = (
-                    series_chunk
-                    .str.replace(r"[áàâãä]", "a", regex=True)
-                    .str.replace(r"[ÁÀÂÃÄ]", "A", regex=True)
-                    .str.replace(r"[éèêë]", "e", regex=True)
-                    .str.replace(r"[ÉÈÊË]", "E", regex=True)
-                    .str.replace(r"[íìîï]", "i", regex=True)
-                    .str.replace(r"[ÍÌÎÏ]", "I", regex=True)
-                    .str.replace(r"[óòôõö]", "o", regex=True)
-                    .str.replace(r"[ÓÒÔÕÖ]", "O", regex=True)
-                    .str.replace(r"[úùûü]", "u", regex=True)
-                    .str.replace(r"[ÚÙÛÜ]", "U", regex=True)
-                    .str.replace(r"[ç]", "c", regex=True)
-                    .str.replace(r"[Ç]", "C", regex=True)
-                )
+        for start_index in range(0, total_rows, chunk_size):
+            end_index: int = min(start_index + chunk_size, total_rows)
 
-                dataframe.iloc[start_index:end_index, column_index] = series_chunk
+            series_chunk = dataframe.iloc[start_index:end_index, column_index]
 
-            del column_index
-            del total_rows
+            dataframe.iloc[start_index:end_index, column_index] = series_chunk.str.translate(translate_table)
 
-            print_normalize_string_log(
-                column_name=column_name,
-                show_log=show_log,
-                to_case=to_case,
-                to_ASCII=to_ASCII
-            )
-            
-            if not inplace:
-                return dataframe
-            return True
+        del column_index
+        del total_rows
 
-        return False
+        if not inplace:
+            return dataframe
+        return True
 
     @staticmethod
     def to_category(
         dataframe: cudf.DataFrame,
         column_name: None|str=None,
+        ordered: bool=False,
         inplace: bool=False,
         chunk_size: int = 500_000,
         show_log: bool=True,
     ) -> bool|cudf.DataFrame:
+        """
+        Converte uma coluna de strings em categoria quando a representação
+        categórica (códigos + dicionário de valores únicos) ocupa menos memória
+        que a coluna de strings.
 
+        Os códigos vêm de uma única passada de `factorize` e usam o menor tipo
+        inteiro possível (int8, int16 ou int32).
+
+        Parâmetros
+        ----------
+        dataframe : cudf.DataFrame
+            DataFrame de entrada.
+        column_name : str
+            Nome da coluna.
+        ordered : bool, default=False
+            Se True, as categorias são ordenadas e a categoria é ordenada.
+            Ordenar muitos valores únicos é custoso; use apenas se necessário.
+        inplace : bool, default=False
+            Se True, altera o DataFrame original. Caso contrário, retorna uma cópia.
+        chunk_size : int, default=500_000
+            Número máximo de linhas por chunk nas verificações.
+        show_log : bool, default=True
+            Se True, imprime o log de conversão.
+        """
         is_valid: bool = is_valid_to_normalize(
             series=dataframe[column_name],
             valid_types=CudfSupportedDtypes.str_types,
         )
         if not is_valid:
             return False
-        
+
+        total_rows: int = len(dataframe[column_name])
+        str_bytes: int = int(dataframe[column_name].memory_usage(deep=True))
+        row_bytes: float = str_bytes / total_rows
+
+        # Com códigos int8, o dicionário precisa caber no que sobra da coluna
+        # de strings. Rejeita antes das buscas por regex e do factorize as
+        # colunas que certamente excedem esse limite (IDs, texto livre). A
+        # estimativa usa apenas o primeiro chunk, para que o custo não cresça
+        # com a coluna: os valores distintos da amostra nunca superam os da
+        # coluna, então o limite da coluna inteira continua válido.
+        if is_high_cardinality(
+            series=dataframe[column_name].iloc[:chunk_size],
+            max_unique=int((str_bytes - total_rows) / row_bytes),
+            chunk_size=chunk_size
+        ):
+            return False
+
         is_str: bool = StringUtils.is_str(
             series=dataframe[column_name],
             chunk_size=chunk_size
-
         )
 
         if not is_str:
             return False
 
-        if not inplace:
-            dataframe: cudf.DataFrame = dataframe.copy()
+        # Nulos recebem o código -1
+        codes, categories = dataframe[column_name].factorize(
+            sort=ordered,
+            use_na_sentinel=True
+        )
 
-        unique_values = dataframe[column_name].unique()
+        code_dtype: str = StringUtils.get_category_code_dtype(len(categories))
 
-        non_null_values: int = dataframe[column_name].notna().sum()
+        category_bytes: int = (
+            total_rows * cp.dtype(code_dtype).itemsize
+            + int(categories.memory_usage(deep=True))
+        )
 
-        # Os valores únicos precisam ser até 50% dos dados válidos
-        can_be_category: bool = ((non_null_values // 2) >= len(unique_values))
+        if dataframe[column_name].null_count > 0:
+            category_bytes = category_bytes + (total_rows + 7) // 8
 
-        if not can_be_category:
+        if category_bytes >= str_bytes:
             return False
 
-        unique_values = unique_values.sort_values()
-        unique_values = unique_values.reset_index(drop=True)
-        
-        categorical_dtype = cudf.CategoricalDtype(
-            categories=unique_values,
-            ordered=True
+        if not inplace:
+            dataframe: cudf.DataFrame = dataframe.copy()
+
+        # O dicionário vai ao host apenas para montar o tipo categórico;
+        # os códigos permanecem na GPU e não há nova passada de hash.
+        categorical = pd.Categorical.from_codes(
+            codes=[],
+            categories=categories.to_pandas(),
+            ordered=ordered
+        )
+
+        category_series: cudf.Series = cudf.Series.from_categorical(
+            categorical,
+            codes=codes.astype(code_dtype)
         )
-        dataframe[column_name] = dataframe[column_name].astype(categorical_dtype)
+        category_series.index = dataframe.index
+
+        dataframe[column_name] = category_series
 
         print_to_category_log(
             column_name=column_name,
@@ -330,6 +444,21 @@ class StringUtils:
         return True
 
 
+    @staticmethod
+    def get_category_code_dtype(total_categories: int) -> str:
+        """
+        Retorna o menor tipo inteiro capaz de representar os códigos de
+        `total_categories` categorias (o código -1 é reservado para nulos).
+        """
+        if total_categories <= 127:
+            return "int8"
+
+        if total_categories <= 32_767:
+            return "int16"
+
+        return "int32"
+
+
     @staticmethod
     def is_str(
         series: cudf.Series,
@@ -347,18 +476,18 @@ class StringUtils:
         is_bool: bool = StringUtils.match(
             series=series,
             regex=bool_pattern,
-            chunk_size=chunk_size,
+            chunk_size=chunk_size
         )
 
         if is_bool:
             return False
         
-        date_pattern: str = combine_regex(regex_pattern_date + regex_pattern_datetime_all)
+        date_pattern: str = combine_regex(regex_pattern_date + regex_pattern_datetime_all + regex_pattern_month_name)
 
         is_date: bool = StringUtils.match(
             series=series,
             regex=date_pattern,
-            chunk_size=chunk_size,
+            chunk_size=chunk_size
         )
 
         if is_date:
@@ -369,13 +498,13 @@ class StringUtils:
         is_number: bool = StringUtils.match(
             series=series,
             regex=number_pattern,
-            chunk_size=chunk_size,
+            chunk_size=chunk_size
         )
 
         if is_number:
             return False
 
-        time_pattern: str = combine_regex(regex_pattern_time_utc + regex_pattern_time_hh_mm + regex_pattern_time_hh_mm_ss + regex_pattern_time_hh_mm_ss_n)
+        time_pattern: str = combine_regex(regex_pattern_time_fields)
 
         is_time: bool = StringUtils.match(
             series=series,
@@ -445,8 +574,33 @@ class StringUtils:
         Verifica se uma coluna de strings (`cudf.Series`) satisfaz uma correspondência
         baseada em expressão regular, considerando limites de percentual mínimo de acerto.
 
-        A função processa os dados em chunks para evitar sobrecarga de memória em
-        séries muito grandes.
+        Atalho para `StringUtils.match_eval(...).matched`.
+        """
+        return StringUtils.match_eval(
+            series=series,
+            regex=regex,
+            match_min_rate=match_min_rate,
+            chunk_size=chunk_size
+        ).matched
+
+
+    @staticmethod
+    def match_eval(
+        series: cudf.Series,
+        regex: str,
+        match_min_rate: int = 0,
+        chunk_size: int = 500_000
+    ) -> MatchResult:
+        """
+        Avalia se uma coluna de strings (`cudf.Series`) satisfaz uma correspondência
+        baseada em expressão regular, considerando limites de percentual mínimo de acerto.
+
+        A função processa os dados em chunks, avaliando a regex uma única vez por
+        chunk, e encerra a busca assim que o resultado está decidido:
+
+        - aceite antecipado: as correspondências já atingiram o mínimo exigido;
+        - rejeição antecipada: mesmo que todas as linhas não nulas restantes
+          correspondam, o mínimo exigido não pode mais ser atingido.
 
         Parâmetros
         ----------
@@ -457,11 +611,12 @@ class StringUtils:
         match_min_rate : int, padrão=0
             Percentual mínimo (0–100) de linhas **não nulas** que devem corresponder ao padrão:
             
-            - 0   → retorna `True` se pelo menos **uma** linha corresponder ao padrão
+            - 0   → `matched=True` se pelo menos **uma** linha corresponder ao padrão
                      (equivalente a `any()`).
-            - 1–99 → retorna `True` se pelo menos `match_min_rate%` das linhas não nulas
+            - 1–99 → `matched=True` se pelo menos `match_min_rate%` das linhas não nulas
                       corresponderem ao padrão.
-            - 100 → retorna `True` apenas se **todas** as linhas não nulas corresponderem ao padrão.
+            - 100 → `matched=True` apenas se **todas** as linhas não nulas corresponderem
+                    ao padrão. Encerra no primeiro chunk com alguma linha sem correspondência.
             
             O valor é automaticamente limitado ao intervalo [0, 100].
         chunk_size : int, padrão=500_000
@@ -469,44 +624,47 @@ class StringUtils:
 
         Retorno
         -------
-        bool
-            `True` se a condição definida por `match_min_rate` for satisfeita,
-            caso contrário `False`.
+        MatchResult
+            - matched: `True` se a condição definida por `match_min_rate` for satisfeita.
+            - scanned: número de linhas avaliadas.
+            - decided_early: `True` se a decisão ocorreu antes de avaliar todas as linhas.
+            - match_count: número de correspondências encontradas nas linhas avaliadas.
         """
         match_min_rate: int = max(0, min(100, int(match_min_rate)))
 
-        total_not_null_rows: int = series.notna().sum()
-
-        if match_min_rate == 0:
-            for chunk in chunk_iterate(series, chunk_size):
-                if chunk.str.match(regex).any():
-                    return True
+        total_rows: int = len(series)
 
-            return False
+        # A contagem de nulos é compartilhada entre o limite e os chunks
+        total_not_null_rows: int = total_rows - series.null_count
 
-        if match_min_rate > 0 and match_min_rate < 100:
+        if match_min_rate == 0:
+            match_min: int = 1
+        elif match_min_rate == 100:
+            match_min: int = total_not_null_rows
+        else:
             match_min: int = ((total_not_null_rows * match_min_rate) // 100)
-            total_match: int = 0
 
-            for chunk in chunk_iterate(series, chunk_size):
-                total_match = total_match + chunk.str.match(regex).sum()
+        total_match: int = 0
+        scanned_rows: int = 0
+        scanned_not_null_rows: int = 0
 
-                if total_match >= match_min:
-                    return True
+        record_scan(passes=1)
 
-            return False    
+        for chunk in chunk_iterate(series, chunk_size):
+            total_match = total_match + int(chunk.str.match(regex).sum())
+            record_scan(rows=len(chunk))
+            scanned_rows = scanned_rows + len(chunk)
+            scanned_not_null_rows = scanned_not_null_rows + (len(chunk) - chunk.null_count)
 
-        if match_min_rate == 100:
-            total_match: int = 0
-            for chunk in chunk_iterate(series, chunk_size):
+            remaining_not_null_rows: int = total_not_null_rows - scanned_not_null_rows
 
-                if chunk.str.match(regex).any():
-                    total_match = total_match + chunk.str.match(regex).sum()
+            if total_match >= match_min:
+                return MatchResult(True, scanned_rows, scanned_rows < total_rows, total_match)
 
-            if total_match == total_not_null_rows:
-                return True
+            if (total_match + remaining_not_null_rows) < match_min:
+                return MatchResult(False, scanned_rows, scanned_rows < total_rows, total_match)
 
-            return False
+        return MatchResult(False, scanned_rows, False, total_match)
 
 
     @staticmethod
@@ -542,6 +700,78 @@ class StringUtils:
         return total_match
 
 
+    @staticmethod
+    def match_classify(
+        series: cudf.Series,
+        regex_patterns: list[dict[str, str]],
+        chunk_size: int = 500_000,
+    ) -> cudf.Series:
+        """
+        Classifica cada linha pelo índice do primeiro padrão da lista que
+        corresponde ao valor, ou -1 quando nenhum corresponde (ou o valor é nulo).
+
+        Todos os padrões são avaliados em uma única passada de regex por chunk.
+
+        Parâmetros
+        ----------
+        series : cudf.Series
+            Série contendo os valores de texto a serem classificados.
+        regex_patterns : list[dict[str, str]]
+            Lista de padrões com a chave "regex". A ordem define a prioridade.
+        chunk_size : int, padrão=500_000
+            Quantidade de linhas processadas por vez.
+
+        Retorno
+        -------
+        cudf.Series
+            Série de rótulos (int8, ou int16 para mais de 127 padrões) com o
+            mesmo índice de `series`.
+        """
+        labeled_regex, group_indexes = combine_regex_groups(regex_patterns)
+
+        label_dtype: str = "int8" if len(regex_patterns) <= cp.iinfo(cp.int8).max else "int16"
+
+        labels: cp.ndarray = cp.full(len(series), -1, dtype=label_dtype)
+
+        start_index: int = 0
+
+        record_scan(passes=1)
+
+        for chunk in chunk_iterate(series, chunk_size):
+            end_index: int = start_index + len(chunk)
+
+            extracted: cudf.DataFrame = chunk.str.extract(labeled_regex)
+            record_scan(rows=len(chunk))
+
+            chunk_labels: cp.ndarray = labels[start_index:end_index]
+
+            # Em ordem reversa, para que o primeiro padrão prevaleça
+            for label in range(len(regex_patterns) - 1, -1, -1):
+                is_label: cp.ndarray = extracted[group_indexes[label]].notna().values
+                chunk_labels[is_label] = label
+
+            start_index = end_index
+
+        return cudf.Series(labels, index=series.index)
+
+
+    @staticmethod
+    def match_frequency(
+        labels: cudf.Series,
+        total_patterns: int
+    ) -> list[int]:
+        """
+        Retorna, a partir dos rótulos de `match_classify`, o número de linhas
+        de cada padrão em um único histograma.
+        """
+        histogram: cp.ndarray = cp.bincount(
+            labels.values.astype(cp.int32) + 1,
+            minlength=total_patterns + 1
+        )
+
+        return [int(frequency) for frequency in histogram[1:].get()]
+
+
     @staticmethod
     def match_infer(
         series: cudf.Series,
@@ -550,17 +780,26 @@ class StringUtils:
     ) -> list[dict[str, str]]:
         """
         Retorna o número de ocorrências para uma lista de padrões.
+
+        Cada linha é contada apenas para o primeiro padrão que corresponde.
+        Retorna cópias dos padrões com a chave "frequency"; a lista original
+        não é alterada.
         """
-        for pattern in regex_patterns:
-            pattern["frequency"] = 0
+        labels: cudf.Series = StringUtils.match_classify(
+            series=series,
+            regex_patterns=regex_patterns,
+            chunk_size=chunk_size
+        )
 
-        # Itera sobre os chunks
-        for chunk in chunk_iterate(series, chunk_size):
-            # Para cada chunk, testa todos os padrões
-            for pattern in regex_patterns:
-                pattern["frequency"] += chunk.str.match(pattern["regex"]).sum()
-                
-        return regex_patterns
+        frequencies: list[int] = StringUtils.match_frequency(
+            labels=labels,
+            total_patterns=len(regex_patterns)
+        )
+
+        return [
+            {**pattern, "frequency": frequency}
+            for pattern, frequency in zip(regex_patterns, frequencies)
+        ]
 
 
     @staticmethod
@@ -77,3 +77,34 @@ regex_pattern_timedelta: list[dict[str, str]] = [
         "format": "%d days %H:%M:%S"
     },
 ]
+
+
+# Layouts convertidos por TimeUtils.normalize, com um grupo de captura por
+# campo: "D" dias, "H" hora, "M" minuto, "S" segundo, "f" fração de segundos
+# e "p" marcador AM/PM ("a" ou "p")
+regex_pattern_time_fields: list[dict[str, str]] = [
+    # "0130UTC", "0540 UTC"
+    {
+        "regex": r'^(\d{2})(\d{2})\s*UTC$',
+        "pattern": "HHMM UTC",
+        "groups": "HM"
+    },
+    # "20:23", "10:12:12", "07:32:12.1247"
+    {
+        "regex": r'^([01]\d|2[0-3]):([0-5]\d)(?::([0-5]\d)(?:\.(\d{1,9}))?)?$',
+        "pattern": "HH:MM(:SS(.s+)?)?",
+        "groups": "HMSf"
+    },
+    # "9 PM", "10:30 a.m.", "12:00:01.5PM"
+    {
+        "regex": r'^(0?[1-9]|1[0-2])(?::([0-5]\d))?(?::([0-5]\d)(?:\.(\d{1,9}))?)?\s*([AaPp])\.?[Mm]\.?$',
+        "pattern": "h(:MM(:SS(.s+)?)?)? AM/PM",
+        "groups": "HMSfp"
+    },
+    # "3 days 04:05:06", "1 day 00:00:00.25"
+    {
+        "regex": r'^(\d+) days? ([01]\d|2[0-3]):([0-5]\d):([0-5]\d)(?:\.(\d{1,9}))?$',
+        "pattern": "D days HH:MM:SS(.s+)?",
+        "groups": "DHMSf"
+    },
+]
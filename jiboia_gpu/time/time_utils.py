@@ -1,20 +1,25 @@
-import cudf
 from .regex_pattern import (
-    regex_pattern_time_utc,
     regex_pattern_time_amp_pm,
-    regex_pattern_time_hh_mm,
-    regex_pattern_time_hh_mm_ss,
-    regex_pattern_time_hh_mm_ss_n,
+    regex_pattern_time_fields,
     regex_pattern_timedelta
 )
+from ..utils.date_layout_utils import (
+    fields_to_seconds,
+    get_minimal_resolution
+)
 from ..utils.log_utils import print_log
+from ..utils.metadata_utils import set_column_metadata
 from ..string.string_utils import StringUtils
-from ..utils.str_utils import combine_regex
+from ..utils.str_utils import (
+    combine_regex,
+    combine_regex_groups
+)
 from ..utils.validation_utils import (
     CudfSupportedDtypes,
     is_valid_to_normalize
 )
 import cudf
+import cupy as cp
 
 
 class TimeUtils:
@@ -46,130 +51,21 @@ class TimeUtils:
         if not is_time:
             return False       
 
-        pattern_time_utc: str = combine_regex(regex_pattern_time_utc)
-        has_time_utc: bool = StringUtils.match(
-            dataframe[column_name],
-            regex=pattern_time_utc,
-            match_min_rate=0,
-            chunk_size=chunk_size
-        )
-        if has_time_utc:
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
-
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
-
-                # pega fatia pelo índice absoluto
-                mask: cudf.Series = dataframe.iloc[start_index:end_index, column_index].str.match(
-                    pattern_time_utc
-                )
-
-                # aplica transformação direto no dataframe
-                dataframe.iloc[start_index:end_index, column_index] = (
-                    dataframe.iloc[start_index:end_index, column_index].where(~mask, 
-                        dataframe.iloc[start_index:end_index, column_index].str.replace(" ", "")
-                        .str.replace("UTC", "")
-                        .str.slice(0, 2) + ":" + dataframe.iloc[start_index:end_index, column_index].str.slice(2, 4) + ":00"
-                    )
-                )
-            del column_index
-            del total_rows
-
-        # hh:mm -> hh:mm:00
-        pattern_time_hh_mm: str = combine_regex(regex_pattern_time_hh_mm)
-        has_time_hh_mm: bool = StringUtils.match(
-            dataframe[column_name],
-            regex=pattern_time_hh_mm,
-            match_min_rate=0,
-            chunk_size=chunk_size
-        )
-
-        if has_time_hh_mm:
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
-
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
-
-                # pega fatia pelo índice absoluto
-                mask: cudf.Series = dataframe.iloc[start_index:end_index, column_index].str.match(
-                    pattern_time_hh_mm
-                )
-
-                # aplica transformação direto no dataframe
-                dataframe.iloc[start_index:end_index, column_index] = (
-                    dataframe.iloc[start_index:end_index, column_index].where(~mask, 
-                        dataframe.iloc[start_index:end_index, column_index] + ":00"
-                    )
-                )
-            del column_index
-            del total_rows
-
-
-        # hh:mm:ss.s -> hh:mm:00
-        pattern_time_hh_mm_ss_n: str = combine_regex(regex_pattern_time_hh_mm_ss_n)
-        has_time_hh_mm: bool = StringUtils.match(
-            dataframe[column_name],
-            regex=pattern_time_hh_mm_ss_n,
-            match_min_rate=0,
-            chunk_size=chunk_size
-        )
-
-        if has_time_hh_mm:
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
-
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
-
-                # pega fatia pelo índice absoluto
-                mask: cudf.Series = dataframe.iloc[start_index:end_index, column_index].str.match(
-                    pattern_time_hh_mm_ss_n
-                )
-
-                # aplica transformação direto no dataframe
-                dataframe.iloc[start_index:end_index, column_index] = (
-                    dataframe.iloc[start_index:end_index, column_index].where(~mask, 
-                        dataframe.iloc[start_index:end_index, column_index].str.slice(0, 8)
-                    )
-                )
-            del column_index
-            del total_rows
-
-
-        # Valores inválidos são convertidos em nulos
-        pattern_time_hh_mm_ss: str = combine_regex(regex_pattern_time_hh_mm_ss)
-        has_time_hh_mm_ss: bool = StringUtils.match(
-            dataframe[column_name],
-            regex=pattern_time_hh_mm_ss,
-            match_min_rate=0,
+        # Duração em nanossegundos, lida dos campos inteiros de cada layout
+        nanoseconds: cudf.Series = TimeUtils.parse_time(
+            series=dataframe[column_name],
             chunk_size=chunk_size
         )
 
-        if has_time_hh_mm_ss:
-            total_rows: int = len(dataframe)
-            column_index: int = dataframe.columns.get_loc(column_name)
-
-            for start_index in range(0, total_rows, chunk_size):
-                end_index: int = min(start_index + chunk_size, total_rows)
+        timedelta_series: cudf.Series = nanoseconds.astype("timedelta64[ns]")
 
-                # pega fatia pelo índice absoluto
-                mask: cudf.Series = dataframe.iloc[start_index:end_index, column_index].str.match(
-                    pattern_time_hh_mm_ss
-                )
+        # Resolução mínima sem perda das frações ("D" não existe para timedelta)
+        resolution: str = get_minimal_resolution(timedelta_series)
+        resolution = "s" if resolution == "D" else resolution
 
-                # aplica transformação direto no dataframe
-                dataframe.iloc[start_index:end_index, column_index] = (
-                    dataframe.iloc[start_index:end_index, column_index].where(mask, None)
-                )
-            del column_index
-            del total_rows
+        dataframe[column_name] = timedelta_series.astype(f"timedelta64[{resolution}]")
 
-        dataframe[column_name] = cudf.to_datetime(dataframe[column_name], format="%H:%M:%S")
-
-        ref_dt = cudf.to_datetime('1970-01-01')
-        dataframe[column_name] = dataframe[column_name] - ref_dt
+        set_column_metadata(dataframe, column_name, resolution=resolution)
 
         print_log(
             column_name=column_name,
@@ -183,6 +79,90 @@ class TimeUtils:
         return True
 
 
+    @staticmethod
+    def parse_time(
+        series: cudf.Series,
+        chunk_size: int = 500_000
+    ) -> cudf.Series:
+        """
+        Converte horários em nanossegundos (int64) em uma única busca por
+        regex por chunk, sem montar strings intermediárias.
+
+        Todos os layouts de `regex_pattern_time_fields` são avaliados juntos;
+        como apenas um layout corresponde a cada linha, os grupos de cada
+        campo são combinados com `fillna`. As frações de segundo são mantidas
+        (até 9 dígitos), horários AM/PM são convertidos para 24 horas e os
+        dias de durações ("3 days 04:05:06") são somados. Valores fora dos
+        layouts ou com hora, minuto ou segundo fora do intervalo viram nulos.
+
+        Args:
+            series (cudf.Series): Série de strings.
+            chunk_size (int): Número máximo de linhas por chunk.
+
+        Returns:
+            cudf.Series: Série int64 com o mesmo índice de `series`.
+        """
+        labeled_regex, group_indexes = combine_regex_groups(regex_pattern_time_fields)
+
+        total_rows: int = len(series)
+
+        nanoseconds: cp.ndarray = cp.zeros(total_rows, dtype=cp.int64)
+        valid: cp.ndarray = cp.zeros(total_rows, dtype=cp.bool_)
+
+        for start_index in range(0, total_rows, chunk_size):
+            end_index: int = min(start_index + chunk_size, total_rows)
+
+            extracted: cudf.DataFrame = series.iloc[start_index:end_index].str.extract(labeled_regex)
+
+            is_match: cudf.Series = extracted[group_indexes].notna().any(axis=1)
+            fields: dict[str, cudf.Series] = {}
+
+            for pattern, group_index in zip(regex_pattern_time_fields, group_indexes):
+                for position, field in enumerate(pattern["groups"]):
+                    field_series: cudf.Series = extracted[group_index + 1 + position]
+
+                    if field in fields:
+                        field_series = fields[field].fillna(field_series)
+
+                    fields[field] = field_series
+
+            def to_int(field: str) -> cp.ndarray:
+                return fields[field].fillna("0").astype("int64").values
+
+            hour: cp.ndarray = to_int("H")
+
+            # "12 AM" -> 0, "12 PM" -> 12, "1 PM" -> 13
+            is_am_pm: cp.ndarray = fields["p"].notna().values
+            is_pm: cp.ndarray = (fields["p"].str.lower() == "p").fillna(False).values
+            hour = cp.where(is_am_pm, hour % 12 + 12 * is_pm, hour)
+
+            seconds, is_valid = fields_to_seconds(
+                year=None,
+                month=None,
+                day=None,
+                hour=hour,
+                minute=to_int("M"),
+                second=to_int("S")
+            )
+
+            seconds = seconds + to_int("D") * 86_400
+
+            # ".1247" -> 124700000 ns
+            fraction: cp.ndarray = fields["f"].fillna("").str.pad(
+                9,
+                side="right",
+                fillchar="0"
+            ).astype("int64").values
+
+            nanoseconds[start_index:end_index] = seconds * 1_000_000_000 + fraction
+            valid[start_index:end_index] = is_valid & is_match.values
+
+        return cudf.Series(nanoseconds, index=series.index).where(
+            cudf.Series(valid, index=series.index),
+            None
+        )
+
+
     @staticmethod
     def is_time(
         series: cudf.Series,
@@ -196,7 +176,7 @@ class TimeUtils:
         if not is_valid:
             return False
 
-        combined_regex: str = combine_regex(regex_pattern_time_utc + regex_pattern_time_hh_mm + regex_pattern_time_hh_mm_ss + regex_pattern_time_hh_mm_ss_n)
+        combined_regex: str = combine_regex(regex_pattern_time_fields)
 
         has_match: bool = StringUtils.match(
             series=series,
@@ -0,0 +1,174 @@
+import cudf
+import cupy as cp
+import cupyx
+import math
+
+
+class HyperLogLog:
+    """
+    Estimador de valores distintos (HyperLogLog) calculado na GPU.
+
+    Cada valor é convertido em um hash de 64 bits (xxhash64). Os primeiros
+    `precision` bits escolhem um registrador e o restante define o número de
+    zeros à esquerda; cada registrador guarda o maior valor visto. Os
+    registradores ocupam `2 ** precision` inteiros, independente do tamanho
+    da coluna.
+
+    O estimador pode ser alimentado chunk a chunk (`add`) e combinado com
+    outros estimadores de mesma precisão (`merge`), por exemplo um por
+    arquivo.
+
+    Parâmetros
+    ----------
+    precision : int, default=12
+        Número de bits do índice do registrador (4–18). O erro relativo
+        padrão é aproximadamente 1.04 / sqrt(2 ** precision), ~1.6% para 12.
+    """
+    def __init__(self, precision: int=12) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError(
+                f"Invalid precision {precision}: expected a value between 4 and 18."
+            )
+
+        self.precision: int = precision
+        self.total_registers: int = 2 ** precision
+        self.registers: cp.ndarray = cp.zeros(self.total_registers, dtype=cp.int32)
+
+
+    def add(self, series: cudf.Series) -> None:
+        """
+        Adiciona os valores não nulos de uma série ao estimador.
+        """
+        series = series.dropna()
+
+        if len(series) == 0:
+            return
+
+        hashes: cp.ndarray = series.hash_values(method="xxhash64").values
+
+        self.add_hashes(hashes)
+
+
+    def add_hashes(self, hashes: cp.ndarray) -> None:
+        """
+        Adiciona hashes de 64 bits (uint64) ao estimador.
+        """
+        hashes = hashes.astype(cp.uint64, copy=False)
+
+        suffix_bits: int = 64 - self.precision
+
+        register_index: cp.ndarray = (hashes >> cp.uint64(suffix_bits)).astype(cp.int64)
+        suffix: cp.ndarray = hashes & cp.uint64((1 << suffix_bits) - 1)
+
+        # Posição do primeiro bit 1 no sufixo (zeros à esquerda + 1)
+        rank: cp.ndarray = (suffix_bits + 1 - HyperLogLog.bit_length(suffix)).astype(cp.int32)
+
+        cupyx.scatter_max(self.registers, register_index, rank)
+
+
+    @staticmethod
+    def bit_length(values: cp.ndarray) -> cp.ndarray:
+        """
+        Retorna o número de bits significativos de cada inteiro uint64
+        (0 para o valor 0), por busca binária sobre os deslocamentos.
+        """
+        values = values.copy()
+        length: cp.ndarray = cp.zeros(values.shape, dtype=cp.int64)
+
+        for shift in (32, 16, 8, 4, 2, 1):
+            is_larger: cp.ndarray = values >= cp.uint64(1 << shift)
+            values = cp.where(is_larger, values >> cp.uint64(shift), values)
+            length = length + is_larger * shift
+
+        return length + (values > 0)
+
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Combina outro estimador neste, como se os seus valores tivessem
+        sido adicionados aqui.
+        """
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge HyperLogLog with precision {other.precision} into precision {self.precision}."
+            )
+
+        self.registers = cp.maximum(self.registers, other.registers)
+
+
+    def estimate(self) -> int:
+        """
+        Retorna o número estimado de valores distintos.
+        """
+        total_registers: int = self.total_registers
+
+        if total_registers == 16:
+            alpha: float = 0.673
+        elif total_registers == 32:
+            alpha: float = 0.697
+        elif total_registers == 64:
+            alpha: float = 0.709
+        else:
+            alpha: float = 0.7213 / (1 + 1.079 / total_registers)
+
+        harmonic_sum: float = float(cp.sum(cp.exp2(-self.registers.astype(cp.float64))))
+        raw_estimate: float = alpha * total_registers * total_registers / harmonic_sum
+
+        # Correção para cardinalidades baixas (linear counting)
+        empty_registers: int = int(cp.count_nonzero(self.registers == 0))
+
+        if raw_estimate <= 2.5 * total_registers and empty_registers > 0:
+            return round(total_registers * math.log(total_registers / empty_registers))
+
+        return round(raw_estimate)
+
+
+    def relative_error(self) -> float:
+        """
+        Retorna o erro relativo padrão do estimador.
+        """
+        return 1.04 / math.sqrt(self.total_registers)
+
+
+    @staticmethod
+    def from_series(
+        series: cudf.Series,
+        precision: int=12,
+        chunk_size: int=500_000
+    ) -> "HyperLogLog":
+        """
+        Cria um estimador a partir de uma série, processando-a em chunks.
+        """
+        hyper_log_log: HyperLogLog = HyperLogLog(precision=precision)
+
+        total_rows: int = len(series)
+
+        for start_index in range(0, total_rows, chunk_size):
+            end_index: int = min(start_index + chunk_size, total_rows)
+
+            hyper_log_log.add(series.iloc[start_index:end_index])
+
+        return hyper_log_log
+
+
+def is_high_cardinality(
+    series: cudf.Series,
+    max_unique: int,
+    precision: int=12,
+    chunk_size: int=500_000
+) -> bool:
+    """
+    Verifica, pela estimativa HyperLogLog, se a série certamente possui mais
+    de `max_unique` valores distintos. A estimativa é reduzida em três erros
+    padrão antes da comparação, de modo que colunas próximas do limite não
+    são rejeitadas e seguem para a contagem exata.
+    """
+    hyper_log_log: HyperLogLog = HyperLogLog.from_series(
+        series=series,
+        precision=precision,
+        chunk_size=chunk_size
+    )
+
+    lower_bound: float = hyper_log_log.estimate() * (1 - 3 * hyper_log_log.relative_error())
+
+    return lower_bound > max_unique
@@ -2,8 +2,10 @@ from ..dataframe.df_utils import DfUtils
 from .log_utils import (
     print_text_green,
     print_text_yellow,
-    print_warning_encode_file_log
+    print_warning_encode_file_log,
+    print_warning_vram_limit_log
 )
+from .memory_utils import MemoryManager
 from pathlib import Path
 import chardet
 import csv
@@ -179,9 +181,28 @@ class CsvUtils:
         start_part: None|int = 1,
         end_part: None|int = None,
         sep_delimiter: None|str=None,
-        skip_rows: int = 0
-    ) -> cudf.DataFrame:
-
+        skip_rows: int = 0,
+        spill: bool = False,
+        spill_dir: None|str = None,
+        host_budget_bytes: None|int = None,
+        vram_limit_rate: int = 90
+    ) -> cudf.DataFrame|MemoryManager:
+        """
+        Lê e concatena os arquivos CSV de uma pasta.
+
+        Quando o uso de VRAM atinge `vram_limit_rate`:
+        - `spill=False`: a leitura é interrompida e os arquivos restantes são ignorados.
+        - `spill=True`: cada arquivo é registrado como uma partição em um
+          `MemoryManager`, que descarrega as partições mais antigas para o host,
+          e a leitura continua. Com `spill_dir` e `host_budget_bytes`, as
+          partições que excedem o orçamento de RAM são gravadas em disco.
+
+        Retorna
+        -------
+        cudf.DataFrame | MemoryManager
+            O DataFrame concatenado, ou o `MemoryManager` com uma partição
+            por arquivo quando `spill=True`.
+        """
         files_csv = sorted(
             [file for file in os.listdir(folder_path) if file.endswith(".csv")]
         )
@@ -193,6 +214,16 @@ class CsvUtils:
         selected_files = files_csv[start_idx:end_idx]
         
         df_cudf: cudf.DataFrame = cudf.DataFrame()
+
+        memory_manager: None|MemoryManager = None
+
+        if spill:
+            memory_manager = MemoryManager(
+                vram_limit_rate=vram_limit_rate,
+                host_budget_bytes=host_budget_bytes,
+                spill_dir=spill_dir,
+                show_log=True
+            )
         
         for file_name in selected_files:
             file_path: str = f'{folder_path}{file_name}'
@@ -212,8 +243,16 @@ class CsvUtils:
                 sep: str = csv_info["delimiter"]
             else:
                 sep: str = sep_delimiter
-            
-            if DfUtils.is_vram_use_limit():
+
+            if memory_manager is not None:
+                # Libera VRAM descarregando as partições antigas antes da leitura
+                memory_manager.evict()
+
+            elif DfUtils.is_vram_use_limit(vram_limit_rate=vram_limit_rate):
+                print_warning_vram_limit_log(
+                    file_name=file_name,
+                    show_log=True
+                )
                 break
 
             df_cudf_part = cudf.read_csv(
@@ -222,10 +261,19 @@ class CsvUtils:
                 dtype=str,
                 skiprows=skip_rows
             )
+
+            if memory_manager is not None:
+                DfUtils.cudf_size_info(df_cudf_part, print_info=True)
+                memory_manager.put(file_name, df_cudf_part)
+                del df_cudf_part
+                continue
         
             df_cudf = cudf.concat([df_cudf, df_cudf_part], ignore_index=True)
             
             DfUtils.cudf_size_info(df_cudf, print_info=True)
             del df_cudf_part
 
+        if memory_manager is not None:
+            return memory_manager
+
         return df_cudf
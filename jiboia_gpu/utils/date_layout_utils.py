@@ -0,0 +1,236 @@
+import cudf
+import cupy as cp
+import numpy as np
+
+
+# Campos aceitos em um layout; os demais caracteres são delimitadores literais
+LAYOUT_FIELDS: str = "ymdHMS"
+
+DAYS_IN_MONTH: list[int] = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+# Resoluções em ordem decrescente e a sua duração em nanossegundos
+RESOLUTION_NANOSECONDS: dict[str, int] = {
+    "D": 86_400 * 10**9,
+    "s": 10**9,
+    "ms": 10**6,
+    "us": 10**3,
+    "ns": 1,
+}
+
+
+def get_layout_fields(layout: str) -> dict[str, tuple[int, int]]:
+    """
+    Retorna a posição inicial e final de cada campo do layout.
+
+    Ex.: "dd-mm-yyyy" -> {"d": (0, 2), "m": (3, 5), "y": (6, 10)}
+    """
+    fields: dict[str, tuple[int, int]] = {}
+
+    for position, char in enumerate(layout):
+        if char not in LAYOUT_FIELDS:
+            continue
+
+        if char in fields and fields[char][1] != position:
+            raise ValueError(f"Invalid layout {layout!r}: field {char!r} must be contiguous.")
+
+        start: int = fields[char][0] if char in fields else position
+        fields[char] = (start, position + 1)
+
+    return fields
+
+
+def days_from_civil(
+    year: cp.ndarray,
+    month: cp.ndarray,
+    day: cp.ndarray
+) -> cp.ndarray:
+    """
+    Converte ano, mês e dia (calendário gregoriano) em dias desde 1970-01-01,
+    apenas com aritmética inteira (algoritmo de Howard Hinnant).
+    """
+    year = year - (month <= 2)
+    era: cp.ndarray = year // 400
+    year_of_era: cp.ndarray = year - era * 400
+    day_of_year: cp.ndarray = (153 * (month + cp.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era: cp.ndarray = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+
+    return era * 146097 + day_of_era - 719468
+
+
+def get_days_in_month(year: cp.ndarray, month: cp.ndarray) -> cp.ndarray:
+    """
+    Retorna o número de dias do mês, considerando anos bissextos.
+    Meses fora de 1–12 retornam 0.
+    """
+    is_valid_month: cp.ndarray = (month >= 1) & (month <= 12)
+
+    days_table: cp.ndarray = cp.asarray(DAYS_IN_MONTH, dtype=cp.int64)
+    days: cp.ndarray = days_table[cp.clip(month, 1, 12) - 1]
+
+    is_leap_year: cp.ndarray = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    days = days + ((month == 2) & is_leap_year)
+
+    return cp.where(is_valid_month, days, 0)
+
+
+def fields_to_seconds(
+    year: None|cp.ndarray,
+    month: None|cp.ndarray,
+    day: None|cp.ndarray,
+    hour: cp.ndarray,
+    minute: cp.ndarray,
+    second: cp.ndarray
+) -> tuple[cp.ndarray, cp.ndarray]:
+    """
+    Converte campos inteiros de data e hora em segundos, validando os
+    intervalos (dia conforme o mês e o ano bissexto, hora < 24, minuto e
+    segundo < 60).
+
+    Sem data (`year`, `month` e `day` None), retorna segundos desde a
+    meia-noite; com data, segundos desde 1970-01-01 00:00:00.
+
+    Returns:
+        tuple[cp.ndarray, cp.ndarray]: Os segundos (int64) e a máscara de validade.
+    """
+    is_valid: cp.ndarray = (
+        (hour >= 0) & (hour < 24)
+        & (minute >= 0) & (minute < 60)
+        & (second >= 0) & (second < 60)
+    )
+
+    seconds: cp.ndarray = hour * 3600 + minute * 60 + second
+
+    if year is None:
+        return seconds, is_valid
+
+    is_valid &= (day >= 1) & (day <= get_days_in_month(year, month))
+
+    seconds = seconds + days_from_civil(year, month, day) * 86400
+
+    return seconds, is_valid
+
+
+def parse_fixed_layout(
+    series: cudf.Series,
+    layout: str,
+    chunk_size: int = 500_000
+) -> cudf.Series:
+    """
+    Converte strings de layout fixo em segundos (int64), lendo os dígitos
+    diretamente das posições do layout, sem regex e sem strptime.
+
+    Campos do layout: "y" ano (4 ou 2 dígitos), "m" mês, "d" dia, "H" hora,
+    "M" minuto e "S" segundo. Os demais caracteres devem aparecer literalmente.
+    Anos com 2 dígitos seguem o padrão POSIX: 69–99 -> 1969–1999, 00–68 -> 2000–2068.
+
+    Com data, o resultado é o número de segundos desde 1970-01-01 00:00:00;
+    sem data (ex.: "HH:MM:SS"), é o número de segundos desde a meia-noite.
+
+    Linhas com tamanho diferente do layout, caracteres inválidos ou dia, mês,
+    hora, minuto ou segundo fora do intervalo viram nulos.
+
+    Args:
+        series (cudf.Series): Série de strings.
+        layout (str): Layout, ex.: "dd-mm-yyyy", "yyyy-mm-dd HH:MM:SS".
+        chunk_size (int): Número máximo de linhas por chunk.
+
+    Returns:
+        cudf.Series: Série int64 com o mesmo índice de `series`.
+    """
+    fields: dict[str, tuple[int, int]] = get_layout_fields(layout)
+    width: int = len(layout)
+    placeholder: str = "0" * width
+
+    total_rows: int = len(series)
+
+    seconds: cp.ndarray = cp.zeros(total_rows, dtype=cp.int64)
+    valid: cp.ndarray = cp.zeros(total_rows, dtype=cp.bool_)
+
+    for start_index in range(0, total_rows, chunk_size):
+        end_index: int = min(start_index + chunk_size, total_rows)
+
+        series_chunk: cudf.Series = series.iloc[start_index:end_index]
+        total_chunk_rows: int = len(series_chunk)
+
+        # Todas as linhas com o mesmo tamanho, para ler a matriz de caracteres
+        is_width: cp.ndarray = (series_chunk.str.len() == width).fillna(False).values
+        series_chunk = series_chunk.where(is_width, placeholder).fillna(placeholder)
+
+        chars: cp.ndarray = series_chunk.str.code_points().values.reshape(total_chunk_rows, width)
+        digits: cp.ndarray = chars.astype(cp.int64) - ord("0")
+
+        is_valid: cp.ndarray = is_width.copy()
+
+        for position, char in enumerate(layout):
+            if char in LAYOUT_FIELDS:
+                is_valid &= (digits[:, position] >= 0) & (digits[:, position] <= 9)
+            else:
+                is_valid &= chars[:, position] == ord(char)
+
+        values: dict[str, cp.ndarray] = {}
+
+        for field, (field_start, field_end) in fields.items():
+            value: cp.ndarray = cp.zeros(total_chunk_rows, dtype=cp.int64)
+
+            for position in range(field_start, field_end):
+                value = value * 10 + digits[:, position]
+
+            values[field] = value
+
+        zeros: cp.ndarray = cp.zeros(total_chunk_rows, dtype=cp.int64)
+
+        year: None|cp.ndarray = None
+        month: None|cp.ndarray = None
+        day: None|cp.ndarray = None
+
+        if "y" in fields or "m" in fields or "d" in fields:
+            year = values.get("y", cp.full(total_chunk_rows, 1970, dtype=cp.int64))
+            month = values.get("m", cp.ones(total_chunk_rows, dtype=cp.int64))
+            day = values.get("d", cp.ones(total_chunk_rows, dtype=cp.int64))
+
+            if "y" in fields and fields["y"][1] - fields["y"][0] == 2:
+                year = cp.where(year >= 69, year + 1900, year + 2000)
+
+        chunk_seconds, is_valid_fields = fields_to_seconds(
+            year=year,
+            month=month,
+            day=day,
+            hour=values.get("H", zeros),
+            minute=values.get("M", zeros),
+            second=values.get("S", zeros)
+        )
+
+        is_valid &= is_valid_fields
+
+        seconds[start_index:end_index] = chunk_seconds
+        valid[start_index:end_index] = is_valid
+
+    return cudf.Series(seconds, index=series.index).where(
+        cudf.Series(valid, index=series.index),
+        None
+    )
+
+
+def get_minimal_resolution(series: cudf.Series) -> str:
+    """
+    Retorna a menor resolução que representa todos os valores de uma série
+    datetime ou timedelta sem perda: "D" (todos os valores em dias inteiros,
+    ou seja, à meia-noite), "s", "ms", "us" ou "ns".
+
+    A verificação é feita sobre os inteiros da unidade atual da série, sem
+    conversão para nanossegundos. Resoluções mais finas que a unidade atual
+    não são consideradas.
+    """
+    unit: str = np.datetime_data(np.dtype(series.dtype))[0]
+    unit_nanoseconds: int = RESOLUTION_NANOSECONDS[unit]
+
+    values: cp.ndarray = series.dropna().astype("int64").values
+
+    for resolution, nanoseconds in RESOLUTION_NANOSECONDS.items():
+        if nanoseconds <= unit_nanoseconds:
+            return resolution
+
+        if bool(cp.all(values % (nanoseconds // unit_nanoseconds) == 0)):
+            return resolution
+
+    return unit
@@ -214,3 +214,33 @@ def print_normalize_df_string_log(
                 "were converted to",
                 print_text_yellow(msg)
             )
+
+
+def print_spill_log(
+    key: str,
+    location: str,
+    show_log: bool=True
+) -> None:
+    if show_log:
+        print(
+            print_text_green("Done!"),
+            "partition",
+            print_text_yellow(key),
+            "moved to",
+            print_text_yellow(location)
+        )
+
+
+def print_warning_vram_limit_log(
+    file_name: str,
+    show_log: bool=True
+) -> None:
+    if show_log:
+        print(
+            print_text_red("Warning!"),
+            "VRAM limit reached, reading stopped before",
+            print_text_yellow(file_name),
+            "use",
+            print_text_yellow("spill=True"),
+            "to keep reading"
+        )
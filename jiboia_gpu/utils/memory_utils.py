@@ -0,0 +1,288 @@
+from .log_utils import print_spill_log
+from collections import OrderedDict
+from typing import Any, Callable, Literal
+import cudf
+import cupy as cp
+import os
+import pickle
+
+
+def get_vram_use_rate(device_id: int = 0) -> float:
+    """
+    Retorna o percentual (0–100) de VRAM em uso no dispositivo.
+    """
+    with cp.cuda.Device(device_id):
+        free_bytes, total_bytes = cp.cuda.runtime.memGetInfo()
+
+    return round(((total_bytes - free_bytes) / total_bytes) * 100, 1)
+
+
+def get_vram_total_bytes(device_id: int = 0) -> int:
+    """
+    Retorna o total de VRAM do dispositivo, em bytes.
+    """
+    with cp.cuda.Device(device_id):
+        _, total_bytes = cp.cuda.runtime.memGetInfo()
+
+    return int(total_bytes)
+
+
+def cudf_size_of(data: cudf.DataFrame|cudf.Series) -> int:
+    """
+    Retorna o tamanho em bytes de um DataFrame ou Series (cuDF ou pandas).
+    """
+    memory_usage: int|cudf.Series = data.memory_usage(index=True, deep=True)
+
+    if isinstance(memory_usage, (int, float)):
+        return int(memory_usage)
+
+    return int(memory_usage.sum())
+
+
+def cudf_to_host(data: cudf.DataFrame|cudf.Series) -> Any:
+    return data.to_pandas()
+
+
+def cudf_to_device(data: Any) -> cudf.DataFrame|cudf.Series:
+    return cudf.from_pandas(data)
+
+
+class MemoryManager:
+    """
+    Gerencia partições (DataFrames) ou colunas (Series) mantidas na VRAM,
+    descarregando as menos usadas recentemente (LRU) para a memória do host
+    e, opcionalmente, para o disco quando o orçamento é excedido.
+
+    As partições descarregadas são trazidas de volta à VRAM com `get`.
+
+    Parâmetros
+    ----------
+    device_budget_bytes : int | None, default=None
+        Orçamento de VRAM em bytes para as partições registradas.
+        Se None, o orçamento é `vram_limit_rate` da VRAM total do dispositivo.
+    vram_limit_rate : int, default=90
+        Percentual (0–100) da VRAM total do dispositivo que as partições
+        registradas podem ocupar. Usado apenas quando `device_budget_bytes`
+        é None. O uso é medido pelo tamanho das partições, e não pela VRAM
+        livre informada pelo driver: com um pool do RMM a memória liberada
+        não volta ao driver e o descarregamento nunca pararia.
+    device_id : int, default=0
+        Dispositivo cuja VRAM total define o orçamento por `vram_limit_rate`.
+    host_budget_bytes : int | None, default=None
+        Orçamento de RAM em bytes. Quando excedido e `spill_dir` estiver
+        definido, as partições mais antigas do host são gravadas em disco.
+    spill_dir : str | None, default=None
+        Diretório para gravar as partições quando o host excede o orçamento.
+    size_of, to_host, to_device : Callable | None, default=None
+        Funções de tamanho e transferência. Por padrão usam cuDF/pandas;
+        podem ser substituídas para simular um orçamento na CPU.
+    show_log : bool, default=False
+        Se True, imprime um log a cada partição movida.
+    """
+    def __init__(
+        self,
+        device_budget_bytes: None|int=None,
+        vram_limit_rate: int=90,
+        device_id: int=0,
+        host_budget_bytes: None|int=None,
+        spill_dir: None|str=None,
+        size_of: None|Callable[[Any], int]=None,
+        to_host: None|Callable[[Any], Any]=None,
+        to_device: None|Callable[[Any], Any]=None,
+        show_log: bool=False
+    ) -> None:
+        self.device_budget_bytes: None|int = device_budget_bytes
+        self.vram_limit_rate: int = vram_limit_rate
+        self.device_id: int = device_id
+        self.host_budget_bytes: None|int = host_budget_bytes
+        self.spill_dir: None|str = spill_dir
+        self.size_of: Callable[[Any], int] = size_of or cudf_size_of
+        self.to_host: Callable[[Any], Any] = to_host or cudf_to_host
+        self.to_device: Callable[[Any], Any] = to_device or cudf_to_device
+        self.show_log: bool = show_log
+        self.entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.spill_count: int = 0
+
+        if device_budget_bytes is not None:
+            self.device_limit_bytes: int = device_budget_bytes
+        else:
+            self.device_limit_bytes: int = (
+                get_vram_total_bytes(device_id=device_id) * vram_limit_rate
+            ) // 100
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+    def keys(self) -> list[str]:
+        return list(self.entries.keys())
+
+
+    def locations(self) -> dict[str, Literal["device", "host", "disk"]]:
+        return {key: entry["location"] for key, entry in self.entries.items()}
+
+
+    def device_bytes(self) -> int:
+        return self.location_bytes("device")
+
+
+    def host_bytes(self) -> int:
+        return self.location_bytes("host")
+
+
+    def location_bytes(self, location: Literal["device", "host", "disk"]) -> int:
+        return sum(
+            entry["nbytes"] for entry in self.entries.values()
+            if entry["location"] == location
+        )
+
+
+    def is_over_budget(self, incoming_bytes: int = 0) -> bool:
+        """
+        Verifica se o orçamento de VRAM foi excedido pelas partições
+        registradas, considerando `incoming_bytes` que ainda serão trazidos
+        para a VRAM.
+        """
+        return (self.device_bytes() + incoming_bytes) > self.device_limit_bytes
+
+
+    def put(self, key: str, data: Any) -> None:
+        """
+        Registra uma partição residente na VRAM e descarrega as partições
+        menos usadas até caber no orçamento.
+        """
+        if key in self.entries:
+            self.remove(key)
+
+        self.entries[key] = {
+            "location": "device",
+            "data": data,
+            "nbytes": self.size_of(data),
+            "path": None
+        }
+
+        self.evict(keep=[key])
+
+
+    def get(self, key: str) -> Any:
+        """
+        Retorna a partição na VRAM, trazendo-a do host ou do disco se necessário.
+        """
+        entry: dict[str, Any] = self.entries[key]
+
+        if entry["location"] != "device":
+            # Libera espaço antes de trazer a partição de volta
+            self.evict(keep=[key], incoming_bytes=entry["nbytes"])
+
+        if entry["location"] == "disk":
+            with open(entry["path"], "rb") as file:
+                entry["data"] = pickle.load(file)
+
+            os.remove(entry["path"])
+            entry["path"] = None
+            entry["location"] = "host"
+
+        if entry["location"] == "host":
+            entry["data"] = self.to_device(entry["data"])
+            entry["location"] = "device"
+
+            print_spill_log(key=key, location="device", show_log=self.show_log)
+
+        self.entries.move_to_end(key)
+
+        return entry["data"]
+
+
+    def remove(self, key: str) -> None:
+        entry: dict[str, Any] = self.entries.pop(key)
+
+        if entry["path"] and os.path.exists(entry["path"]):
+            os.remove(entry["path"])
+
+
+    def clear(self) -> None:
+        for key in self.keys():
+            self.remove(key)
+
+
+    def evict(
+        self,
+        keep: None|list[str] = None,
+        incoming_bytes: int = 0
+    ) -> int:
+        """
+        Descarrega as partições da VRAM para o host, das menos usadas
+        recentemente para as mais usadas, até respeitar o orçamento.
+
+        Retorna o número de partições descarregadas.
+        """
+        keep = keep or []
+        evicted: int = 0
+
+        while self.is_over_budget(incoming_bytes):
+            candidates: list[str] = [
+                key for key, entry in self.entries.items()
+                if entry["location"] == "device" and key not in keep
+            ]
+
+            if not candidates:
+                break
+
+            self.spill(candidates[0])
+            evicted = evicted + 1
+
+        return evicted
+
+
+    def spill(self, key: str) -> None:
+        """
+        Move uma partição da VRAM para a memória do host.
+        """
+        entry: dict[str, Any] = self.entries[key]
+
+        if entry["location"] != "device":
+            return
+
+        entry["data"] = self.to_host(entry["data"])
+        entry["location"] = "host"
+
+        print_spill_log(key=key, location="host", show_log=self.show_log)
+
+        self.spill_host()
+
+
+    def spill_host(self) -> None:
+        """
+        Grava em disco as partições mais antigas do host quando
+        `host_budget_bytes` é excedido e `spill_dir` está definido.
+        """
+        if not self.spill_dir or self.host_budget_bytes is None:
+            return
+
+        for key, entry in self.entries.items():
+            if self.host_bytes() <= self.host_budget_bytes:
+                break
+
+            if entry["location"] != "host":
+                continue
+
+            self.spill_count = self.spill_count + 1
+            path: str = os.path.join(self.spill_dir, f"jiboia_spill_{self.spill_count}.pkl")
+
+            with open(path, "wb") as file:
+                pickle.dump(entry["data"], file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            entry["data"] = None
+            entry["path"] = path
+            entry["location"] = "disk"
+
+            print_spill_log(key=key, location="disk", show_log=self.show_log)
+
@@ -0,0 +1,41 @@
+from typing import Any
+import cudf
+
+
+METADATA_ATTRIBUTE: str = "_jiboia_metadata"
+
+
+def set_column_metadata(
+    dataframe: cudf.DataFrame,
+    column_name: str,
+    **metadata: Any
+) -> None:
+    """
+    Registra informações sobre a conversão de uma coluna no próprio DataFrame
+    (ex.: escala de um inteiro escalado, unidade de uma coluna monetária).
+
+    As informações são somadas às já registradas para a coluna. Elas não são
+    copiadas por `DataFrame.copy()`.
+
+    Args:
+        dataframe (cudf.DataFrame): DataFrame da coluna.
+        column_name (str): Nome da coluna.
+        **metadata: Pares chave/valor a registrar.
+    """
+    all_metadata: dict[str, dict[str, Any]] = getattr(dataframe, METADATA_ATTRIBUTE, None) or {}
+
+    all_metadata[column_name] = {**all_metadata.get(column_name, {}), **metadata}
+
+    object.__setattr__(dataframe, METADATA_ATTRIBUTE, all_metadata)
+
+
+def get_column_metadata(
+    dataframe: cudf.DataFrame,
+    column_name: str
+) -> dict[str, Any]:
+    """
+    Retorna uma cópia das informações registradas para a coluna, ou {}.
+    """
+    all_metadata: dict[str, dict[str, Any]] = getattr(dataframe, METADATA_ATTRIBUTE, None) or {}
+
+    return dict(all_metadata.get(column_name, {}))
@@ -0,0 +1,198 @@
+from .memory_utils import cudf_size_of
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Generator, Literal
+import cudf
+import json
+import pandas as pd
+import rmm.statistics
+import time
+import tracemalloc
+
+
+# Contadores da etapa em medição (linhas lidas e passadas sobre a coluna),
+# alimentados pelas funções que percorrem a coluna em chunks
+stage_scan_counter: ContextVar[None|dict[str, int]] = ContextVar("stage_scan_counter", default=None)
+
+
+def record_scan(rows: int=0, passes: int=0) -> None:
+    """
+    Soma as linhas lidas e as passadas sobre a coluna à etapa em medição
+    pelo `NormalizeProfiler`. Sem etapa em medição, não faz nada.
+    """
+    scan_counter: None|dict[str, int] = stage_scan_counter.get()
+
+    if scan_counter is None:
+        return
+
+    scan_counter["rows_scanned"] = scan_counter["rows_scanned"] + rows
+    scan_counter["passes"] = scan_counter["passes"] + passes
+
+
+class NormalizeProfiler:
+    """
+    Registra o custo de cada etapa da normalização, por coluna: tempo de
+    execução, linhas lidas, número de passadas sobre a coluna, bytes da coluna
+    antes e depois da etapa e o pico de memória.
+
+    As linhas lidas e as passadas são medidas pelas funções que percorrem a
+    coluna (`match_eval`, `match_classify`, `lookup_bool`, `parse_number`),
+    por `record_scan`: uma rejeição antecipada conta apenas os chunks lidos.
+
+    O pico de memória vem das estatísticas do RMM (`memory="gpu"`, memória
+    alocada pelo cuDF na GPU) ou do tracemalloc (`memory="cpu"`, memória
+    alocada pelo Python no host). A medição fica restrita a cada etapa: as
+    estatísticas do RMM e o tracemalloc ativados pelo profiler são
+    desativados ao final da etapa, restaurando o estado anterior.
+
+    O relatório pode ser exportado como lista de dicionários, DataFrame
+    pandas, JSON ou trace do Chrome (chrome://tracing, Perfetto).
+
+    Parâmetros
+    ----------
+    memory : {'gpu', 'cpu'}, default='gpu'
+        Origem do pico de memória de cada etapa.
+    """
+    def __init__(self, memory: Literal["gpu", "cpu"]="gpu") -> None:
+        if memory not in ("gpu", "cpu"):
+            raise ValueError(f"Invalid memory {memory!r}: expected 'gpu' or 'cpu'.")
+
+        self.memory: Literal["gpu", "cpu"] = memory
+        self.records: list[dict[str, Any]] = []
+        self.start_time: float = time.perf_counter()
+
+
+    @contextmanager
+    def stage(
+        self,
+        column_name: str,
+        stage_name: str,
+        dataframe: cudf.DataFrame
+    ) -> Generator[None, None, None]:
+        """
+        Mede uma etapa aplicada (inplace) a uma coluna do DataFrame.
+        """
+        bytes_in: int = cudf_size_of(dataframe[column_name])
+
+        scan_counter: dict[str, int] = {"rows_scanned": 0, "passes": 0}
+        scan_counter_token = stage_scan_counter.set(scan_counter)
+
+        started_tracemalloc: bool = False
+
+        if self.memory == "gpu":
+            # Empilha um contador se as estatísticas já estiverem ativas; caso
+            # contrário, ativa e restaura o recurso de memória ao sair
+            memory_statistics: ContextManager[None] = rmm.statistics.statistics()
+        else:
+            memory_statistics: ContextManager[None] = nullcontext()
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracemalloc = True
+
+            tracemalloc.reset_peak()
+
+        with memory_statistics:
+            stage_start: float = time.perf_counter()
+
+            try:
+                yield
+            finally:
+                wall_time: float = time.perf_counter() - stage_start
+
+                stage_scan_counter.reset(scan_counter_token)
+
+                if self.memory == "gpu":
+                    peak_memory: int = int(rmm.statistics.get_statistics().peak_bytes)
+                else:
+                    peak_memory: int = tracemalloc.get_traced_memory()[1]
+
+                    if started_tracemalloc:
+                        tracemalloc.stop()
+
+                self.records.append({
+                    "column": column_name,
+                    "stage": stage_name,
+                    "start": stage_start - self.start_time,
+                    "wall_time": wall_time,
+                    "rows_scanned": scan_counter["rows_scanned"],
+                    "passes": scan_counter["passes"],
+                    "bytes_in": bytes_in,
+                    "bytes_out": cudf_size_of(dataframe[column_name]),
+                    "peak_memory": peak_memory,
+                })
+
+
+    def report(self) -> list[dict[str, Any]]:
+        """
+        Retorna uma cópia dos registros, na ordem de execução.
+        """
+        return [dict(record) for record in self.records]
+
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(self.report())
+
+
+    def to_json(self, path: None|str=None) -> str:
+        """
+        Retorna o relatório em JSON e, se `path` for definido, grava o arquivo.
+        """
+        report_json: str = json.dumps(self.report(), indent=2)
+
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(report_json)
+
+        return report_json
+
+
+    def to_chrome_trace(self, path: None|str=None) -> str:
+        """
+        Retorna o relatório no formato de trace do Chrome (eventos "X", em
+        microssegundos, um por etapa) e, se `path` for definido, grava o arquivo.
+        """
+        trace_events: list[dict[str, Any]] = [
+            {
+                "name": f'{record["column"]}:{record["stage"]}',
+                "cat": record["stage"],
+                "ph": "X",
+                "ts": round(record["start"] * 1_000_000),
+                "dur": round(record["wall_time"] * 1_000_000),
+                "pid": 0,
+                "tid": 0,
+                "args": {
+                    key: record[key]
+                    for key in ("column", "rows_scanned", "passes", "bytes_in", "bytes_out", "peak_memory")
+                },
+            }
+            for record in self.records
+        ]
+
+        trace_json: str = json.dumps({"traceEvents": trace_events})
+
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(trace_json)
+
+        return trace_json
+
+
+def profile_stage(
+    profiler: None|NormalizeProfiler,
+    column_name: str,
+    stage_name: str,
+    dataframe: cudf.DataFrame
+) -> ContextManager[None]:
+    """
+    Retorna o contexto de medição da etapa, ou um contexto vazio quando o
+    profiler não está ativo (sem custo de medição).
+    """
+    if profiler is None:
+        return nullcontext()
+
+    return profiler.stage(
+        column_name=column_name,
+        stage_name=stage_name,
+        dataframe=dataframe
+    )
@@ -1,3 +1,6 @@
+import re
+
+
 def combine_regex(regex_patterns: list[dict[str, str]]) -> str:
     """
     Combina uma lista de padrões de expressão regular em uma única string.
@@ -15,3 +18,32 @@ def combine_regex(regex_patterns: list[dict[str, str]]) -> str:
     """
     regex_pattern: str = [pattern["regex"] for pattern in regex_patterns]
     return '|'.join(regex_pattern)
+
+
+def combine_regex_groups(regex_patterns: list[dict[str, str]]) -> tuple[str, list[int]]:
+    """
+    Combina uma lista de padrões em uma única regex onde cada padrão é
+    envolvido por um grupo de captura, na mesma ordem da lista.
+
+    A alternância é ancorada no início da string, reproduzindo a semântica de
+    `str.match`. Em uma única avaliação (ex.: `str.extract`), o grupo não nulo
+    indica o primeiro padrão que corresponde ao valor.
+
+    Args:
+        regex_patterns (list[dict[str, str]]): Lista de dicionários com a chave "regex".
+
+    Returns:
+        tuple[str, list[int]]: A regex combinada e, para cada padrão, o índice
+            do seu grupo de captura externo (os grupos internos dos padrões
+            deslocam os índices seguintes).
+    """
+    grouped_regex: list[str] = []
+    group_indexes: list[int] = []
+    group_index: int = 0
+
+    for pattern in regex_patterns:
+        grouped_regex.append(f'({pattern["regex"]})')
+        group_indexes.append(group_index)
+        group_index = group_index + 1 + re.compile(pattern["regex"]).groups
+
+    return '^(?:' + '|'.join(grouped_regex) + ')', group_indexes
@@ -0,0 +1,59 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generator
+
+
+def stream_map(
+    items: list[Any],
+    load: Callable[[Any], Any],
+    process: Callable[[Any, Any], Any],
+    unload: Callable[[Any], Any],
+    prefetch: bool = True
+) -> Generator[tuple[Any, Any], None, None]:
+    """
+    Processa uma lista de itens em fluxo: carrega, processa e descarrega
+    um item por vez, em ordem.
+
+    Com `prefetch=True` usa buffer duplo: enquanto o item atual é processado,
+    uma thread auxiliar carrega o próximo item (host -> device) e descarrega
+    o resultado anterior (device -> host). No máximo dois itens carregados e
+    um resultado pendente coexistem no dispositivo.
+
+    Args:
+        items (list): Itens a processar (ex.: nomes de colunas).
+        load (Callable): Recebe o item e retorna o dado carregado.
+        process (Callable): Recebe o item e o dado carregado e retorna o resultado.
+        unload (Callable): Recebe o resultado e retorna a cópia descarregada.
+        prefetch (bool): Se True, sobrepõe as transferências ao processamento.
+
+    Yields:
+        tuple: O item e o seu resultado descarregado, na ordem de `items`.
+    """
+    if not prefetch:
+        for item in items:
+            yield item, unload(process(item, load(item)))
+        return
+
+    if not items:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_load: Future = executor.submit(load, items[0])
+        pending_unload: None|tuple[Any, Future] = None
+
+        for index, item in enumerate(items):
+            loaded: Any = next_load.result()
+
+            # Carrega o próximo item enquanto o atual é processado
+            if index + 1 < len(items):
+                next_load = executor.submit(load, items[index + 1])
+
+            result: Any = process(item, loaded)
+            del loaded
+
+            if pending_unload is not None:
+                yield pending_unload[0], pending_unload[1].result()
+
+            pending_unload = (item, executor.submit(unload, result))
+            del result
+
+        yield pending_unload[0], pending_unload[1].result()
@@ -0,0 +1,144 @@
+import unicodedata
+
+
+def build_translate_table(mapping: dict[str, None|str]) -> dict[int, str]:
+    """
+    Cria uma tabela de tradução de caracteres para `str.translate` (cuDF).
+
+    Cada caractere é mapeado para outro caractere, ou removido quando o valor
+    é None ou "". Todos os caracteres são traduzidos em uma única passada
+    sobre o buffer de caracteres, de forma simultânea (o resultado de uma
+    tradução não é traduzido novamente).
+
+    Args:
+        mapping (dict[str, None|str]): Dicionário {caractere: substituto}.
+            Exemplo: {".": None, ",": "."} converte "1.234,56" em "1234.56".
+
+    Returns:
+        dict[int, str]: Tabela {code point: substituto}, onde "" indica remoção.
+    """
+    translate_table: dict[int, str] = {}
+
+    for char, replacement in mapping.items():
+        replacement: str = replacement or ""
+
+        if len(char) != 1 or len(replacement) > 1:
+            raise ValueError(
+                f"Invalid translation {char!r} -> {replacement!r}: only single characters are supported."
+            )
+
+        # A libcudf remove o caractere quando o substituto é 0 ("")
+        translate_table[ord(char)] = replacement
+
+    return translate_table
+
+
+# Letras sem decomposição Unicode para a letra base
+ACCENT_FOLDING_EXTRA: dict[str, str] = {
+    "Ð": "D",
+    "ð": "d",
+    "Đ": "D",
+    "đ": "d",
+    "Ħ": "H",
+    "ħ": "h",
+    "ı": "i",
+    "Ŀ": "L",
+    "ŀ": "l",
+    "Ł": "L",
+    "ł": "l",
+    "Ø": "O",
+    "ø": "o",
+    "Ŧ": "T",
+    "ŧ": "t",
+    "ƀ": "b",
+    "Ɓ": "B",
+    "Ƈ": "C",
+    "ƈ": "c",
+    "Ɖ": "D",
+    "Ɗ": "D",
+    "Ƒ": "F",
+    "ƒ": "f",
+    "Ɠ": "G",
+    "Ɨ": "I",
+    "Ƙ": "K",
+    "ƙ": "k",
+    "ƚ": "l",
+    "Ɲ": "N",
+    "ƞ": "n",
+    "Ƥ": "P",
+    "ƥ": "p",
+    "ƫ": "t",
+    "Ƭ": "T",
+    "ƭ": "t",
+    "Ʈ": "T",
+    "Ʋ": "V",
+    "Ƴ": "Y",
+    "ƴ": "y",
+    "Ƶ": "Z",
+    "ƶ": "z",
+    "Ǥ": "G",
+    "ǥ": "g",
+    "ȡ": "d",
+    "Ȥ": "Z",
+    "ȥ": "z",
+    "ȴ": "l",
+    "ȵ": "n",
+    "ȶ": "t",
+    "ȷ": "j",
+    "Ⱥ": "A",
+    "Ȼ": "C",
+    "ȼ": "c",
+    "Ƚ": "L",
+    "Ⱦ": "T",
+    "ȿ": "s",
+    "ɀ": "z",
+    "Ƀ": "B",
+    "Ʉ": "U",
+    "Ɇ": "E",
+    "ɇ": "e",
+    "Ɉ": "J",
+    "ɉ": "j",
+    "Ɋ": "Q",
+    "ɋ": "q",
+    "Ɍ": "R",
+    "ɍ": "r",
+    "Ɏ": "Y",
+    "ɏ": "y",
+}
+
+
+def build_accent_folding_table() -> dict[int, str]:
+    """
+    Cria a tabela de remoção de acentos para os blocos Latin-1 Supplement,
+    Latin Extended-A e Latin Extended-B (U+00C0–U+024F).
+
+    Cada letra acentuada é mapeada para a sua letra base ASCII (ex.: "ã" -> "a",
+    "Ç" -> "C", "ő" -> "o"). Ligaduras que exigiriam mais de um caractere
+    (ex.: "ß", "Æ", "Œ") não são alteradas.
+    """
+    accent_folding_table: dict[int, str] = {}
+
+    for code_point in range(0x00C0, 0x0250):
+        char: str = chr(code_point)
+
+        if char in ACCENT_FOLDING_EXTRA:
+            accent_folding_table[code_point] = ACCENT_FOLDING_EXTRA[char]
+            continue
+
+        decomposed: str = unicodedata.normalize("NFKD", char)
+
+        base_char: str = "".join(
+            decomposed_char for decomposed_char in decomposed
+            if not unicodedata.combining(decomposed_char)
+        )
+
+        # Ex.: "ǿ" se decompõe em "ø" + acento agudo
+        base_char = ACCENT_FOLDING_EXTRA.get(base_char, base_char)
+
+        if len(base_char) == 1 and base_char.isascii() and base_char.isalpha():
+            accent_folding_table[code_point] = base_char
+
+    return accent_folding_table
+
+
+ACCENT_FOLDING_TABLE: dict[int, str] = build_accent_folding_table()
@@ -5,7 +5,7 @@ import cudf
 class CudfSupportedDtypes:  
     str_types: ClassVar[list[str]] = ["object", "string"]
     int_types: ClassVar[list[str]] = ["int8", "int16", "int32", "int64"]
-    uint_types: ClassVar[list[str]] = ["uint32", "uint64"]
+    uint_types: ClassVar[list[str]] = ["uint8", "uint16", "uint32", "uint64"]
     float_types: ClassVar[list[str]] = ["float32", "float64"]
     decimal_types: ClassVar[list[str]] = ["Decimal32Dtype", "Decimal64Dtype", "Decimal128Dtype"]
     numeric_types: ClassVar[list[str]] = int_types + uint_types + float_types + decimal_types
@@ -0,0 +1,107 @@
+from jiboia_gpu.boolean.boolean_utils import BooleanUtils
+import cudf
+import pytest
+
+
+COLUMN_NAME: str = "col_name"
+
+
+# ---- TESTS ---- #
+def test_from_bool_str_english_case_variants() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["True", "FALSE", "yes", "No", "on", "T", "maybe", None]
+    })
+
+    BooleanUtils.from_bool_str(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (str(df[COLUMN_NAME].dtype) == "bool")
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [True, False, True, False, True, True, None, None])
+
+
+def test_from_bool_str_portuguese_locale() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["Sim", "NÃO", "verdadeiro", "Falso", "s", "n"]
+    })
+
+    assert (BooleanUtils.from_bool_str(dataframe=df, column_name=COLUMN_NAME, show_log=False) == False)
+
+    result: cudf.DataFrame = BooleanUtils.from_bool_str(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        locales=["pt"],
+        show_log=False
+    )
+
+    assert (result[COLUMN_NAME].to_arrow().to_pylist() == [True, False, True, False, True, False])
+
+
+def test_from_bool_str_requires_one_match_with_min_rate_zero() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["Jiboia", "Naja", None, "Taipan"]
+    })
+
+    result: bool = BooleanUtils.from_bool_str(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        match_min_rate=0,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (result == False)
+    assert (str(df[COLUMN_NAME].dtype) == "object")
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == ["Jiboia", "Naja", None, "Taipan"])
+
+
+def test_get_vocabulary_custom_terms_and_conflicts() -> None:
+    vocabulary: dict[str, bool] = BooleanUtils.get_vocabulary(["pt"], {"ativo": True})
+
+    assert (vocabulary["ativo"] == True)
+    assert (vocabulary["nao"] == False)
+
+    with pytest.raises(ValueError):
+        BooleanUtils.get_vocabulary(["en"], {"yes": False})
+
+
+def test_from_binary_num_direct_cast() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: cudf.Series([1, 0, None, 1], dtype="int8")
+    })
+
+    BooleanUtils.from_binary_num(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (str(df[COLUMN_NAME].dtype) == "bool")
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [True, False, None, True])
+
+
+def test_is_binary_num_rejects_fractions_and_ranges() -> None:
+    assert (BooleanUtils.is_binary_num(cudf.Series([0.0, 1.0, None])) == True)
+    assert (BooleanUtils.is_binary_num(cudf.Series([0.0, 0.5, 1.0])) == False)
+    assert (BooleanUtils.is_binary_num(cudf.Series([0, 1, 2])) == False)
+    assert (BooleanUtils.is_binary_num(cudf.Series([None, None], dtype="int8")) == False)
+
+
+def test_lookup_bool_stops_when_rate_cannot_be_reached() -> None:
+    series: cudf.Series = cudf.Series(["Jiboia"] * 6 + ["yes"] * 4)
+    vocabulary: dict[str, bool] = BooleanUtils.get_vocabulary()
+
+    # Após 6 linhas sem correspondência, no máximo 40% das linhas seriam booleanas
+    assert (BooleanUtils.lookup_bool(series, vocabulary, match_min_rate=50, chunk_size=2) is None)
+    assert (BooleanUtils.is_bool(series, match_min_rate=50, chunk_size=2) == False)
+
+    late_series: cudf.Series = cudf.Series(["Jiboia"] * 2 + ["yes", "no"] * 4)
+
+    values: cudf.Series = BooleanUtils.lookup_bool(late_series, vocabulary, match_min_rate=50, chunk_size=2)
+
+    assert (values.to_arrow().to_pylist()[:4] == [None, None, True, False])
+    assert (BooleanUtils.is_bool(late_series, match_min_rate=50, chunk_size=2) == True)
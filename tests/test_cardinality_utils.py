@@ -0,0 +1,48 @@
+from jiboia_gpu.utils.cardinality_utils import (
+    HyperLogLog,
+    is_high_cardinality
+)
+import cudf
+
+
+def generate_series(total_unique: int, repeat: int = 1) -> cudf.Series:
+    return cudf.Series([f"id_{index}" for index in range(total_unique)] * repeat)
+
+
+# ---- TESTS ---- #
+def test_estimate_is_close_to_exact_unique_count() -> None:
+    series: cudf.Series = generate_series(total_unique=20_000, repeat=2)
+
+    hyper_log_log: HyperLogLog = HyperLogLog.from_series(series=series, chunk_size=7_000)
+
+    estimate: int = hyper_log_log.estimate()
+
+    assert (abs(estimate - 20_000) <= 20_000 * 0.05)
+
+
+def test_estimate_is_exact_for_small_cardinality() -> None:
+    series: cudf.Series = cudf.Series(["car", "bus", "bike", "bike", None])
+
+    hyper_log_log: HyperLogLog = HyperLogLog.from_series(series=series)
+
+    assert (hyper_log_log.estimate() == 3)
+
+
+def test_merge_combines_chunks_and_files() -> None:
+    first: HyperLogLog = HyperLogLog.from_series(generate_series(total_unique=10_000))
+    second: HyperLogLog = HyperLogLog.from_series(cudf.Series(
+        [f"id_{index}" for index in range(5_000, 15_000)]
+    ))
+
+    first.merge(second)
+
+    assert (abs(first.estimate() - 15_000) <= 15_000 * 0.05)
+
+
+def test_is_high_cardinality_rejects_only_clear_cases() -> None:
+    ids: cudf.Series = generate_series(total_unique=10_000)
+    categories: cudf.Series = cudf.Series(["car", "bus", "bike"] * 1_000)
+
+    assert (is_high_cardinality(series=ids, max_unique=5_000) == True)
+    assert (is_high_cardinality(series=ids, max_unique=10_000) == False)
+    assert (is_high_cardinality(series=categories, max_unique=3) == False)
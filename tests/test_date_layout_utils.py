@@ -0,0 +1,60 @@
+from jiboia_gpu.utils.date_layout_utils import (
+    days_from_civil,
+    get_minimal_resolution,
+    parse_fixed_layout
+)
+import cudf
+import cupy as cp
+
+
+# ---- TESTS ---- #
+def test_days_from_civil_matches_epoch_days() -> None:
+    year: cp.ndarray = cp.asarray([1970, 2000, 2024, 1969, 1600])
+    month: cp.ndarray = cp.asarray([1, 3, 2, 12, 1])
+    day: cp.ndarray = cp.asarray([1, 1, 29, 31, 1])
+
+    expected: list[int] = [0, 11017, 19782, -1, -135140]
+
+    assert (days_from_civil(year, month, day).tolist() == expected)
+
+
+def test_parse_fixed_layout_datetime_and_invalid_rows() -> None:
+    series: cudf.Series = cudf.Series([
+        "2024-02-29 23:59:59",
+        "2023-02-29 10:00:00",  # 2023 não é bissexto
+        "2024-13-01 10:00:00",
+        "2024-01-01 24:00:00",
+        "2024-01-01",
+        None,
+    ])
+
+    seconds: cudf.Series = parse_fixed_layout(series=series, layout="yyyy-mm-dd HH:MM:SS", chunk_size=4)
+
+    assert (seconds.to_arrow().to_pylist() == [1709251199, None, None, None, None, None])
+
+
+def test_parse_fixed_layout_two_digit_year_and_time() -> None:
+    dates: cudf.Series = parse_fixed_layout(
+        series=cudf.Series(["31-12-68", "01-01-69"]),
+        layout="dd-mm-yy"
+    ).astype("datetime64[s]")
+
+    times: cudf.Series = parse_fixed_layout(
+        series=cudf.Series(["00:00:01", "12:30:00", "1:30:00"]),
+        layout="HH:MM:SS"
+    )
+
+    assert (dates.astype("str").to_arrow().to_pylist() == ["2068-12-31T00:00:00", "1969-01-01T00:00:00"])
+    assert (times.to_arrow().to_pylist() == [1, 45000, None])
+
+
+def test_get_minimal_resolution() -> None:
+    dates: cudf.Series = cudf.Series([0, 86_400, None]).astype("datetime64[s]")
+    seconds: cudf.Series = cudf.Series([1, 86_400]).astype("datetime64[s]")
+    milliseconds: cudf.Series = cudf.Series([1_500_000_000, 0]).astype("datetime64[ns]")
+    timedeltas: cudf.Series = cudf.Series([1_000, 2_001]).astype("timedelta64[us]")
+
+    assert (get_minimal_resolution(dates) == "D")
+    assert (get_minimal_resolution(seconds) == "s")
+    assert (get_minimal_resolution(milliseconds) == "ms")
+    assert (get_minimal_resolution(timedeltas) == "us")
@@ -0,0 +1,236 @@
+from jiboia_gpu.datetime.datetime_utils import DateTimeUtils
+from jiboia_gpu.utils.metadata_utils import get_column_metadata
+import cudf
+
+
+COLUMN_NAME: str = "col_name"
+
+
+# ---- TESTS ---- #
+def test_to_datetime_single_format_column() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["2024-01-15", "2023-12-31", "abc", None]
+    })
+
+    labels: cudf.Series = DateTimeUtils.classify_date_formats(df[COLUMN_NAME])
+
+    DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (labels.to_arrow().to_pylist()[2:] == [-1, -1])
+    assert (str(df[COLUMN_NAME].dtype) == "datetime64[s]")
+    assert (df[COLUMN_NAME].astype("str").to_arrow().to_pylist() == ["2024-01-15T00:00:00", "2023-12-31T00:00:00", None, None])
+
+
+def test_to_datetime_mixed_formats_one_conversion_per_group() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["15/01/2024", "2024-01-16", "1/2/2024", "20240117", "2024-01-18 10:30:00"]
+    })
+
+    result: cudf.DataFrame = DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        show_log=False
+    )
+
+    expected: list[str] = [
+        "2024-01-15T00:00:00",
+        "2024-01-16T00:00:00",
+        "2024-02-01T00:00:00",
+        "2024-01-17T00:00:00",
+        "2024-01-18T10:30:00",
+    ]
+
+    assert (str(result[COLUMN_NAME].dtype) == "datetime64[s]")
+    assert (result[COLUMN_NAME].astype("str").to_arrow().to_pylist() == expected)
+    assert (df[COLUMN_NAME].dtype == "object")
+
+
+def test_to_datetime_rejects_text_column() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["Jiboia", "Naja", "Taipan"]})
+
+    assert (DateTimeUtils.to_datetime(dataframe=df, column_name=COLUMN_NAME, show_log=False) == False)
+
+
+def test_to_datetime_month_names_english_and_portuguese() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: [
+            "12-Jan-2024",
+            "March 3, 2021",
+            "3 de março de 2021",
+            "5 fev 2020",
+            "31-Fev-2020",
+            "12-Foo-2024",
+        ]
+    })
+
+    DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    expected: list = [
+        "2024-01-12T00:00:00",
+        "2021-03-03T00:00:00",
+        "2021-03-03T00:00:00",
+        "2020-02-05T00:00:00",
+        None,
+        None,
+    ]
+
+    assert (str(df[COLUMN_NAME].dtype) == "datetime64[s]")
+    assert (df[COLUMN_NAME].astype("str").to_arrow().to_pylist() == expected)
+
+
+def test_to_datetime_converts_offsets_to_utc() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: [
+            "2024-01-15T10:00:00-03:00",
+            "2024-01-15 10:00:00+05:30",
+            "2024-01-15T01:00:00+02:00",
+            "2024-01-15T10:00:00",
+        ]
+    })
+
+    DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        offset_column_name="offset",
+        inplace=True,
+        show_log=False
+    )
+
+    expected: list[str] = [
+        "2024-01-15T13:00:00",
+        "2024-01-15T04:30:00",
+        "2024-01-14T23:00:00",
+        "2024-01-15T10:00:00",
+    ]
+
+    assert (df[COLUMN_NAME].astype("str").to_arrow().to_pylist() == expected)
+    assert (str(df["offset"].dtype) == "int16")
+    assert (df["offset"].to_arrow().to_pylist() == [-180, 330, 120, None])
+
+
+def test_to_datetime_resolution_from_fractions() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["2024-01-15 10:00:00.250", "2024-01-15 10:00:01.5", None]
+    })
+
+    DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (str(df[COLUMN_NAME].dtype) == "datetime64[ms]")
+    assert (get_column_metadata(df, COLUMN_NAME)["resolution"] == "ms")
+
+
+def test_to_datetime_date_as_days() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["1970-01-02", "2024-01-15", None]
+    })
+
+    DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        date_as_days=True,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (str(df[COLUMN_NAME].dtype) == "int32")
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [1, 19737, None])
+    metadata: dict = get_column_metadata(df, COLUMN_NAME)
+
+    assert (metadata["resolution"] == "D")
+    assert (metadata["as_days"] == True)
+
+
+def test_infer_day_first_month_first_column() -> None:
+    series: cudf.Series = cudf.Series(["12/25/2024", "01/02/2024", "3/15/2023", "2024-01-15"])
+
+    labels: cudf.Series = DateTimeUtils.classify_date_formats(series)
+
+    day_first, confidence = DateTimeUtils.infer_day_first(series, labels)
+
+    assert (day_first == False)
+    assert (confidence == 1.0)
+
+
+def test_to_datetime_month_first_single_parse() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["12/25/2024", "01/02/2024", "3/15/2023", "25/12/2024"]
+    })
+
+    DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    expected: list = [
+        "2024-12-25T00:00:00",
+        "2024-01-02T00:00:00",
+        "2023-03-15T00:00:00",
+        None,
+    ]
+
+    metadata: dict = get_column_metadata(df, COLUMN_NAME)
+
+    assert (df[COLUMN_NAME].astype("str").to_arrow().to_pylist() == expected)
+    assert (metadata["day_first"] == False)
+    assert (round(metadata["day_first_confidence"], 2) == 0.67)
+
+
+def test_unique_pattern_and_mixed_dates_wrappers() -> None:
+    unique_df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["2024-01-15 10:30:00", "2023-12-31 23:59:59", "abc", None]
+    })
+    mixed_df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["2024-01-15", "31/12/2023", "abc", None]
+    })
+
+    assert (DateTimeUtils.is_unique_datetime_pattern(unique_df[COLUMN_NAME]) == True)
+    assert (DateTimeUtils.is_unique_datetime_pattern(mixed_df[COLUMN_NAME]) == False)
+    assert (DateTimeUtils.normalize_unique_pattern(dataframe=mixed_df, column_name=COLUMN_NAME) == False)
+
+    unique_result: cudf.DataFrame = DateTimeUtils.normalize_unique_pattern(
+        dataframe=unique_df,
+        column_name=COLUMN_NAME
+    )
+    mixed_result: cudf.DataFrame = DateTimeUtils.normalize_mixed_dates(
+        dataframe=mixed_df,
+        column_name=COLUMN_NAME
+    )
+
+    assert (unique_result[COLUMN_NAME].null_count == 2)
+    assert (str(unique_result[COLUMN_NAME].dtype).startswith("datetime64"))
+    assert (mixed_result[COLUMN_NAME].astype("str").to_arrow().to_pylist()[:2] == ["2024-01-15T00:00:00", "2023-12-31T00:00:00"])
+    assert (str(mixed_df[COLUMN_NAME].dtype) == "object")
+
+
+def test_to_datetime_dates_after_first_chunk() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: [None] * 3 + ["abc"] * 2 + ["2024-01-15", "2023-12-31", "2022-06-30"]
+    })
+
+    result: cudf.DataFrame = DateTimeUtils.to_datetime(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        chunk_size=2,
+        show_log=False
+    )
+
+    assert (str(result[COLUMN_NAME].dtype) == "datetime64[s]")
+    assert (result[COLUMN_NAME].astype("str").to_arrow().to_pylist()[5:] == ["2024-01-15T00:00:00", "2023-12-31T00:00:00", "2022-06-30T00:00:00"])
+    assert (result[COLUMN_NAME].null_count == 5)
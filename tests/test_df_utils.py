@@ -0,0 +1,64 @@
+from jiboia_gpu.dataframe.df_utils import DfUtils
+from jiboia_gpu.utils.metadata_utils import get_column_metadata
+import cudf
+import pandas as pd
+
+
+COLUMN_NAME: str = "col_name"
+
+
+# ---- TESTS ---- #
+def test_normalize_host_keeps_column_metadata() -> None:
+    df: pd.DataFrame = pd.DataFrame({
+        COLUMN_NAME: ["2024-01-15", "2023-12-31", None],
+        "col_text": ["Jiboia", "Naja", "Taipan"],
+    })
+
+    result: pd.DataFrame = DfUtils.normalize_host(
+        dataframe=df,
+        show_log=False,
+        prefetch=False
+    )
+
+    assert (get_column_metadata(result, COLUMN_NAME)["resolution"] == "D")
+    assert (get_column_metadata(result, "col_text") == {})
+
+
+def test_normalize_and_normalize_host_pass_date_as_days() -> None:
+    df: pd.DataFrame = pd.DataFrame({
+        COLUMN_NAME: ["2024-01-15", "1970-01-02", None],
+    })
+
+    result: cudf.DataFrame = DfUtils.normalize(
+        dataframe=cudf.DataFrame.from_pandas(df),
+        date_as_days=True,
+        show_log=False
+    )
+    host_result: pd.DataFrame = DfUtils.normalize_host(
+        dataframe=df,
+        date_as_days=True,
+        show_log=False,
+        prefetch=False
+    )
+
+    assert (str(result[COLUMN_NAME].dtype) == "int32")
+    assert (result[COLUMN_NAME].to_arrow().to_pylist() == [19737, 1, None])
+    assert (get_column_metadata(result, COLUMN_NAME)["as_days"] == True)
+    assert (host_result[COLUMN_NAME].tolist()[:2] == [19737, 1])
+    assert (get_column_metadata(host_result, COLUMN_NAME)["as_days"] == True)
+
+
+def test_normalize_nulls_sentinels_in_typed_datetime_column() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: cudf.Series(["2024-01-15", "1900-01-01", None, "2023-05-01"]).astype("datetime64[s]"),
+    })
+
+    result: cudf.DataFrame = DfUtils.normalize(
+        dataframe=df,
+        sentinel_values=["1900-01-01"],
+        show_log=False
+    )
+
+    assert (str(result[COLUMN_NAME].dtype) == "datetime64[s]")
+    assert (result[COLUMN_NAME].isna().to_arrow().to_pylist() == [False, True, True, False])
+    assert (df[COLUMN_NAME].null_count == 1)
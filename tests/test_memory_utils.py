@@ -0,0 +1,124 @@
+from jiboia_gpu.utils.memory_utils import MemoryManager, get_vram_total_bytes
+import pickle
+
+
+PARTITION_SIZE: int = 100
+
+
+def generate_manager(
+    device_budget_bytes: int = PARTITION_SIZE * 2,
+    host_budget_bytes: None|int = None,
+    spill_dir: None|str = None
+) -> MemoryManager:
+    # Orçamento simulado na CPU: partições são bytes e o tamanho é o len
+    return MemoryManager(
+        device_budget_bytes=device_budget_bytes,
+        host_budget_bytes=host_budget_bytes,
+        spill_dir=spill_dir,
+        size_of=len,
+        to_host=bytes,
+        to_device=bytes
+    )
+
+
+def generate_partition(value: int) -> bytes:
+    return bytes([value]) * PARTITION_SIZE
+
+
+# ---- TESTS ---- #
+def test_put_evicts_least_recently_used_partition() -> None:
+    manager: MemoryManager = generate_manager()
+
+    for index in range(4):
+        manager.put(f"part_{index}", generate_partition(index))
+
+    assert (len(manager) == 4)
+    assert (manager.device_bytes() <= PARTITION_SIZE * 2)
+    assert (manager.locations() == {
+        "part_0": "host",
+        "part_1": "host",
+        "part_2": "device",
+        "part_3": "device",
+    })
+
+
+def test_get_brings_partition_back_to_device() -> None:
+    manager: MemoryManager = generate_manager()
+
+    for index in range(3):
+        manager.put(f"part_{index}", generate_partition(index))
+
+    data: bytes = manager.get("part_0")
+
+    assert (data == generate_partition(0))
+    assert (manager.locations()["part_0"] == "device")
+    assert (manager.locations()["part_1"] == "host")
+    assert (manager.device_bytes() <= PARTITION_SIZE * 2)
+
+
+def test_spill_to_disk_when_host_budget_is_exceeded(tmp_path) -> None:
+    manager: MemoryManager = generate_manager(
+        device_budget_bytes=PARTITION_SIZE,
+        host_budget_bytes=PARTITION_SIZE,
+        spill_dir=str(tmp_path)
+    )
+
+    for index in range(3):
+        manager.put(f"part_{index}", generate_partition(index))
+
+    assert (manager.locations() == {
+        "part_0": "disk",
+        "part_1": "host",
+        "part_2": "device",
+    })
+
+    spill_files: list = list(tmp_path.iterdir())
+
+    assert (len(spill_files) == 1)
+    assert (pickle.loads(spill_files[0].read_bytes()) == generate_partition(0))
+
+    assert (manager.get("part_0") == generate_partition(0))
+    assert (manager.locations() == {
+        "part_0": "device",
+        "part_1": "disk",
+        "part_2": "host",
+    })
+    assert (len(list(tmp_path.iterdir())) == 1)
+
+
+def test_vram_rate_budget_uses_partition_sizes() -> None:
+    total_bytes: int = get_vram_total_bytes(device_id=0)
+
+    # Com 100% da VRAM, partições pequenas nunca são descarregadas, mesmo
+    # que o driver informe pouca memória livre (ex.: pool do RMM)
+    manager: MemoryManager = MemoryManager(
+        vram_limit_rate=100,
+        device_id=0,
+        size_of=len,
+        to_host=bytes,
+        to_device=bytes
+    )
+
+    for index in range(3):
+        manager.put(f"part_{index}", generate_partition(index))
+
+    assert (manager.device_limit_bytes == total_bytes)
+    assert (set(manager.locations().values()) == {"device"})
+
+    # Com 0%, apenas a partição recém-registrada permanece na VRAM
+    zero_manager: MemoryManager = MemoryManager(
+        vram_limit_rate=0,
+        device_id=0,
+        size_of=len,
+        to_host=bytes,
+        to_device=bytes
+    )
+
+    for index in range(3):
+        zero_manager.put(f"part_{index}", generate_partition(index))
+
+    assert (zero_manager.locations() == {
+        "part_0": "host",
+        "part_1": "host",
+        "part_2": "device",
+    })
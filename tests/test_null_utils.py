@@ -0,0 +1,80 @@
+from jiboia_gpu.null.null_utils import NullUtils
+import cudf
+
+
+COLUMN_NAME: str = "col_name"
+
+
+# ---- TESTS ---- #
+def test_null_mask_short_tokens_only() -> None:
+    series: cudf.Series = cudf.Series(["NaN", "Jiboia", "", "N/A", "undefined value", None, "NULL"])
+
+    mask: cudf.Series = NullUtils.null_mask(
+        series=series,
+        null_values=NullUtils.get_null_values(["desconhecido"])
+    )
+
+    assert (mask.to_arrow().to_pylist() == [True, False, True, True, False, False, True])
+
+
+def test_get_null_values_without_duplicates() -> None:
+    null_values: list[str] = NullUtils.get_null_values(["NaN", "Vazio"])
+
+    assert (len(null_values) == len(set(null_values)))
+    assert ("vazio" in null_values)
+
+
+def test_normalize_sentinels_numeric_and_datetime() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: cudf.Series([10, -999, 30, 0]),
+        "col_date": cudf.Series(["2024-01-15", "1900-01-01", None, "2023-05-01"]).astype("datetime64[s]"),
+    })
+
+    NullUtils.normalize_sentinels(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        sentinel_values=[-999, "1900-01-01"],
+        inplace=True,
+        show_log=False
+    )
+
+    NullUtils.normalize_sentinels(
+        dataframe=df,
+        column_name="col_date",
+        sentinel_values=[-999, "1900-01-01", "0000-00-00"],
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [10, None, 30, 0])
+    assert (df["col_date"].isna().to_arrow().to_pylist() == [False, True, True, False])
+
+
+def test_detect_sentinels_frequency_spikes_at_extremes() -> None:
+    ages: cudf.Series = cudf.Series([20, 35, 41, 60, 28, -999, -999, 33, 52, 9999])
+
+    assert (NullUtils.detect_sentinels(ages, min_spike_rate=0.05) == [-999, 9999])
+    assert (NullUtils.detect_sentinels(ages, min_spike_rate=0.15) == [-999])
+    assert (NullUtils.detect_sentinels(cudf.Series([1, 2, 3, 4, 5])) == [])
+
+
+def test_detect_sentinels_ignores_flags_and_ordinal_scales() -> None:
+    three_values: cudf.Series = cudf.Series([1, 2, 3] * 10)
+    flags: cudf.Series = cudf.Series([0] * 50 + [1] * 30 + [2] * 20)
+    ratings: cudf.Series = cudf.Series([1] * 40 + [2] * 5 + [3] * 5 + [4] * 10 + [5] * 40)
+    scores: cudf.Series = cudf.Series([0] * 30 + list(range(1, 10)) * 3 + [10] * 30)
+
+    assert (NullUtils.detect_sentinels(three_values) == [])
+    assert (NullUtils.detect_sentinels(flags) == [])
+    assert (NullUtils.detect_sentinels(ratings) == [])
+    assert (NullUtils.detect_sentinels(scores) == [])
+
+
+def test_get_sentinel_values_global_and_per_column() -> None:
+    values: list = NullUtils.get_sentinel_values(
+        column_name=COLUMN_NAME,
+        sentinel_values=[-999],
+        column_sentinel_values={COLUMN_NAME: [0], "other": [1]}
+    )
+
+    assert (values == [-999, 0])
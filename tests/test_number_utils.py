@@ -3,6 +3,7 @@ import cupy as cp
 import cupy.typing as npt
 import string
 from jiboia_gpu.number.number_utils import NumberUtils
+from jiboia_gpu.utils.metadata_utils import get_column_metadata
 
 
 DF_SIZE: int = 10
@@ -211,7 +212,7 @@ def test_normalize_downcast_float64_to_float32() -> None:
     assert (df[COLUMN_NAME].dtype == cp.float64)
 
 
-def test_normalize_convert_scientific_float_to_int32() -> None:
+def test_normalize_convert_scientific_float_to_uint16() -> None:
     df: cudf.DataFrame = generate_df_scientific_numbers(df_size=DF_SIZE, column_name=COLUMN_NAME)
 
     NumberUtils.normalize(
@@ -221,7 +222,8 @@ def test_normalize_convert_scientific_float_to_int32() -> None:
         show_log=False
     )
 
-    assert (df[COLUMN_NAME].dtype == cp.int32)
+    # 32767 a 32776 não cabem em int16, mas cabem em uint16
+    assert (df[COLUMN_NAME].dtype == cp.uint16)
 
 
 def test_normalize_convert_mixed_numeric_to_int32() -> None:
@@ -399,3 +401,180 @@ def test_normalize_do_not_convert_when_string_mix_is_greater_than_numeric_thresh
 
     assert (not_null_before == not_null_after)
     assert (df[COLUMN_NAME].dtype == "object")
+
+
+def test_normalize_decimal_parses_fixed_point_to_smallest_decimal() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["1.234,56", "0,99", "10", "-7,5", None]})
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        decimal=True,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cudf.Decimal32Dtype(precision=6, scale=2))
+    assert (str(df[COLUMN_NAME].sum()) == "1238.05")
+    assert (df[COLUMN_NAME].isna().sum() == 1)
+
+
+def test_normalize_decimal_keeps_float_for_scientific_numbers() -> None:
+    df: cudf.DataFrame = generate_df_float_numbers(df_size=DF_SIZE, column_name=COLUMN_NAME).astype(str)
+    df_scitific_num_str: cudf.DataFrame = generate_df_scientific_numbers(df_size=DF_SIZE, column_name=COLUMN_NAME)
+
+    df = cudf.concat([df, df_scitific_num_str], ignore_index=True)
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        decimal=True,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.float64)
+
+
+def test_to_decimal_as_scaled_int_records_scale() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["12.5", "-0.25", "3", None]})
+
+    NumberUtils.to_decimal(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        as_scaled_int=True,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.int64)
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [1250, -25, 300, None])
+    assert (get_column_metadata(df, COLUMN_NAME) == {"scale": 2})
+
+
+def test_parse_number_returns_values_and_valid_mask() -> None:
+    series: cudf.Series = cudf.Series(["1.234,56", "10.5", "abc", "0,99", None])
+
+    values, valid_mask = NumberUtils.parse_number(series=series)
+
+    assert (values.to_arrow().to_pylist() == [1234.56, 10.5, None, 0.99, None])
+    assert (valid_mask.to_arrow().to_pylist() == [True, True, False, True, False])
+
+
+def test_parse_number_with_explicit_separators() -> None:
+    series: cudf.Series = cudf.Series(["1 234,5", "12,25"])
+
+    values, _ = NumberUtils.parse_number(series=series, thousands_sep=" ", decimal_sep=",")
+
+    assert (values.to_arrow().to_pylist() == [1234.5, 12.25])
+
+
+def test_normalize_convert_us_formatted_number_to_float64() -> None:
+    df: cudf.DataFrame = generate_df_float_formatted(
+        df_size=DF_SIZE,
+        column_name=COLUMN_NAME,
+        decimal_sep=".",
+        thousand_sep=","
+    )
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.float64)
+    assert (df[COLUMN_NAME].iloc[0] == 32767.1)
+    assert (NumberUtils.infer_separators(cudf.Series(["1,234.5", "1,234"])) == (",", "."))
+    assert (NumberUtils.infer_separators(cudf.Series(["1,234.5", "0,99"])) == (".", ","))
+    assert (NumberUtils.infer_separators(cudf.Series(["1,234.5", "10", "7", "0,99"]), chunk_size=1) == (".", ","))
+    assert (NumberUtils.infer_separators(cudf.Series(["10", "7", "1,234,567"]), chunk_size=2) == (",", "."))
+    assert (NumberUtils.infer_separators(cudf.Series(["10", None, "7"]), chunk_size=2) == (".", ","))
+
+
+def test_normalize_downcast_positive_int_to_uint8() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: cp.arange(0, 256, dtype=cp.int64)})
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.uint8)
+
+
+def test_normalize_downcast_exact_float64_to_float32() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["0.5", "1.25", "-3.75", None]})
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.float32)
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [0.5, 1.25, -3.75, None])
+
+
+def test_normalize_currency_and_accounting_negative() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["R$ 1.234,56", "R$ 0,99", "(R$ 10,00)", "-R$ 5,50", None]
+    })
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.float64)
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [1234.56, 0.99, -10.0, -5.5, None])
+    assert (get_column_metadata(df, COLUMN_NAME)["unit"] == "R$")
+
+
+def test_normalize_percent_to_fraction() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["12,5%", "50%", "(25%)"]})
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        percent_to_fraction=True,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (df[COLUMN_NAME].dtype == cp.float32)
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [0.125, 0.5, -0.25])
+    assert (get_column_metadata(df, COLUMN_NAME) == {"unit": "%", "percent_to_fraction": True})
+
+
+def test_normalize_unit_rejects_mixed_currencies() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["R$ 10,00", "US$ 10.00", "R$ 5,00"]})
+
+    result = NumberUtils.normalize_unit(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        show_log=False
+    )
+
+    assert (result == False)
+
+
+def test_normalize_sentinels_before_downcast() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["12", "-999", "200", "9999", "7"]})
+
+    NumberUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        sentinel_values=[-999, 9999],
+        inplace=True,
+        show_log=False
+    )
+
+    assert (str(df[COLUMN_NAME].dtype) == "uint8")
+    assert (df[COLUMN_NAME].to_arrow().to_pylist() == [12, None, 200, None, 7])
@@ -0,0 +1,101 @@
+from jiboia_gpu.dataframe.df_utils import DfUtils
+from jiboia_gpu.string.string_utils import StringUtils
+from jiboia_gpu.utils.profile_utils import NormalizeProfiler, record_scan
+import cudf
+import json
+import tracemalloc
+
+
+COLUMN_NAME: str = "col_name"
+
+
+# ---- TESTS ---- #
+def test_profiler_records_every_stage_per_column() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["1", "2", "3", None],
+        "col_text": ["a", "b", "a", "b"],
+    })
+
+    profiler: NormalizeProfiler = NormalizeProfiler(memory="cpu")
+
+    DfUtils.normalize(
+        dataframe=df,
+        create_category=True,
+        show_log=False,
+        chunk_size=3,
+        profiler=profiler
+    )
+
+    report: list[dict] = profiler.report()
+    stages: list[str] = [record["stage"] for record in report if record["column"] == COLUMN_NAME]
+
+    assert (stages == ["string", "number", "boolean", "time", "datetime", "category"])
+    number_record: dict = [
+        record for record in report
+        if record["column"] == COLUMN_NAME and record["stage"] == "number"
+    ][0]
+
+    assert (all(record["peak_memory"] >= 0 for record in report))
+    assert (number_record["passes"] >= 2)
+    assert (number_record["rows_scanned"] >= 8)
+    assert (len(profiler.to_dataframe()) == 12)
+
+
+def test_profiler_chrome_trace_events() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["10", "20"]})
+
+    profiler: NormalizeProfiler = NormalizeProfiler(memory="cpu")
+
+    with profiler.stage(COLUMN_NAME, "number", df):
+        df[COLUMN_NAME] = df[COLUMN_NAME].astype("int8")
+
+    trace: dict = json.loads(profiler.to_chrome_trace())
+    event: dict = trace["traceEvents"][0]
+
+    assert (event["name"] == f"{COLUMN_NAME}:number")
+    assert (event["ph"] == "X")
+    assert (event["args"]["bytes_out"] < event["args"]["bytes_in"])
+    assert (json.loads(profiler.to_json())[0]["stage"] == "number")
+
+
+def test_profiler_stops_tracemalloc_it_started() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["10", "20"]})
+
+    profiler: NormalizeProfiler = NormalizeProfiler(memory="cpu")
+
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+    with profiler.stage(COLUMN_NAME, "number", df):
+        assert (tracemalloc.is_tracing() == True)
+
+    assert (tracemalloc.is_tracing() == False)
+
+    tracemalloc.start()
+
+    with profiler.stage(COLUMN_NAME, "number", df):
+        pass
+
+    assert (tracemalloc.is_tracing() == True)
+
+    tracemalloc.stop()
+
+
+def test_profiler_measures_rows_scanned_and_passes() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({COLUMN_NAME: ["10"] * 6 + ["a"] * 4})
+
+    profiler: NormalizeProfiler = NormalizeProfiler(memory="cpu")
+
+    with profiler.stage(COLUMN_NAME, "number", df):
+        # Aceite antecipado após 3 chunks de 2 linhas
+        StringUtils.match_eval(series=df[COLUMN_NAME], regex=r'^\d+$', match_min_rate=50, chunk_size=2)
+        StringUtils.match_classify(series=df[COLUMN_NAME], regex_patterns=[{"regex": r'^\d+$'}], chunk_size=4)
+
+    # Fora de uma etapa, a contagem é ignorada
+    record_scan(rows=100, passes=1)
+
+    record: dict = profiler.report()[0]
+
+    assert (record["rows_scanned"] == 16)
+    assert (record["passes"] == 2)
+    assert (json.loads(profiler.to_chrome_trace())["traceEvents"][0]["args"]["passes"] == 2)
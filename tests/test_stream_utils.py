@@ -0,0 +1,92 @@
+from jiboia_gpu.utils.stream_utils import stream_map
+import threading
+
+
+ITEMS: list[str] = ["col_a", "col_b", "col_c", "col_d"]
+
+
+class TransferCounter:
+    # Simula as transferências na CPU contando os itens residentes no "device"
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.resident: int = 0
+        self.max_resident: int = 0
+        self.events: list[tuple[str, str]] = []
+
+    def load(self, item: str) -> str:
+        with self.lock:
+            self.resident = self.resident + 1
+            self.max_resident = max(self.max_resident, self.resident)
+            self.events.append(("load", item))
+        return item
+
+    def process(self, item: str, loaded: str) -> str:
+        with self.lock:
+            self.events.append(("process", item))
+        return loaded.upper()
+
+    def unload(self, result: str) -> str:
+        with self.lock:
+            self.resident = self.resident - 1
+            self.events.append(("unload", result.lower()))
+        return result
+
+
+# ---- TESTS ---- #
+def test_stream_map_keeps_order_and_results() -> None:
+    counter: TransferCounter = TransferCounter()
+
+    results: list[tuple[str, str]] = list(stream_map(
+        items=ITEMS,
+        load=counter.load,
+        process=counter.process,
+        unload=counter.unload
+    ))
+
+    assert (results == [(item, item.upper()) for item in ITEMS])
+    assert (counter.resident == 0)
+
+
+def test_stream_map_prefetch_limits_resident_items() -> None:
+    counter: TransferCounter = TransferCounter()
+
+    list(stream_map(
+        items=ITEMS,
+        load=counter.load,
+        process=counter.process,
+        unload=counter.unload,
+        prefetch=True
+    ))
+
+    # Buffer duplo: item atual + próximo + resultado pendente
+    assert (counter.max_resident <= 3)
+
+    for index, item in enumerate(ITEMS[:-1]):
+        # O próximo item é carregado antes do atual ser descarregado
+        assert (counter.events.index(("load", ITEMS[index + 1])) < counter.events.index(("unload", item)))
+
+
+def test_stream_map_without_prefetch_is_sequential() -> None:
+    counter: TransferCounter = TransferCounter()
+
+    list(stream_map(
+        items=ITEMS,
+        load=counter.load,
+        process=counter.process,
+        unload=counter.unload,
+        prefetch=False
+    ))
+
+    expected_events: list[tuple[str, str]] = []
+
+    for item in ITEMS:
+        expected_events += [("load", item), ("process", item), ("unload", item)]
+
+    assert (counter.max_resident == 1)
+    assert (counter.events == expected_events)
+
+
+def test_stream_map_empty_items() -> None:
+    counter: TransferCounter = TransferCounter()
+
+    assert (list(stream_map([], counter.load, counter.process, counter.unload)) == [])
@@ -1,5 +1,9 @@
 import cudf
-from jiboia_gpu.string.string_utils import StringUtils
+from jiboia_gpu.string.string_utils import (
+    MatchResult,
+    StringUtils
+)
+from jiboia_gpu.utils.translate_utils import build_translate_table
 
 
 str_normal: list = [
@@ -87,3 +91,229 @@ def test_normalize() -> None:
     assert (multiple_spaces_before > 0)
     assert (multiple_spaces_after == 0)
     assert (test_df[column_name].to_arrow().to_pylist() == expected)
+
+
+def test_match_eval_rejects_on_first_mismatch_with_min_rate_100() -> None:
+    series: cudf.Series = cudf.Series(["a1"] + ["10"] * 9)
+
+    result: MatchResult = StringUtils.match_eval(
+        series=series,
+        regex=r'^\d+$',
+        match_min_rate=100,
+        chunk_size=2
+    )
+
+    assert (result.matched is False)
+    assert (result.scanned == 2)
+    assert (result.decided_early is True)
+
+
+def test_match_eval_rejects_when_remaining_rows_cannot_reach_rate() -> None:
+    series: cudf.Series = cudf.Series(["a"] * 6 + ["10"] * 4 + [None] * 2)
+
+    result: MatchResult = StringUtils.match_eval(
+        series=series,
+        regex=r'^\d+$',
+        match_min_rate=50,
+        chunk_size=2
+    )
+
+    # 10 linhas não nulas: após 6 sem correspondência restam 4 < 5
+    assert (result.matched is False)
+    assert (result.scanned == 6)
+    assert (result.decided_early is True)
+
+
+def test_match_eval_accepts_early() -> None:
+    series: cudf.Series = cudf.Series(["10"] * 6 + ["a"] * 4)
+
+    result: MatchResult = StringUtils.match_eval(
+        series=series,
+        regex=r'^\d+$',
+        match_min_rate=50,
+        chunk_size=2
+    )
+
+    assert (result.matched is True)
+    assert (result.scanned == 6)
+    assert (result.match_count == 6)
+    assert (StringUtils.match(series=series, regex=r'^\d+$', match_min_rate=50, chunk_size=2))
+
+
+def test_match_eval_does_not_reject_when_matches_come_after_first_chunk() -> None:
+    series: cudf.Series = cudf.Series(["x", "x"] + ["2024"] * 4)
+
+    result: MatchResult = StringUtils.match_eval(
+        series=series,
+        regex=r'^\d+$',
+        match_min_rate=50,
+        chunk_size=2
+    )
+
+    assert (result.matched is True)
+    assert (result.scanned == 6)
+    assert (result.match_count == 4)
+
+
+def test_match_eval_any_scans_until_first_match() -> None:
+    series: cudf.Series = cudf.Series(str_normal + ["10"])
+
+    result: MatchResult = StringUtils.match_eval(
+        series=series,
+        regex=r'^\d+$',
+        chunk_size=5
+    )
+
+    assert (result.matched is True)
+    assert (result.scanned == 11)
+    assert (result.match_count == 1)
+
+
+def test_match_classify_labels_first_matching_pattern() -> None:
+    regex_patterns: list[dict[str, str]] = [
+        {"regex": r'^\d+$', "pattern": "d"},
+        {"regex": r'^\d+(\.\d+)?$', "pattern": "d.d"},
+        {"regex": r'^[a-z]+$', "pattern": "a"},
+    ]
+    series: cudf.Series = cudf.Series(["10", "1.5", "abc", "A-1", None, "7"])
+
+    labels: cudf.Series = StringUtils.match_classify(
+        series=series,
+        regex_patterns=regex_patterns,
+        chunk_size=4
+    )
+
+    assert (labels.to_arrow().to_pylist() == [0, 1, 2, -1, -1, 0])
+
+
+def test_match_infer_does_not_mutate_patterns() -> None:
+    regex_patterns: list[dict[str, str]] = [
+        {"regex": r'^\d+$', "pattern": "d"},
+        {"regex": r'^[a-z]+$', "pattern": "a"},
+    ]
+    series: cudf.Series = cudf.Series(["10", "20", "abc", "A-1"])
+
+    result: list[dict[str, str]] = StringUtils.match_infer(
+        series=series,
+        regex_patterns=regex_patterns
+    )
+
+    assert ([pattern["frequency"] for pattern in result] == [2, 1])
+    assert ("frequency" not in regex_patterns[0])
+
+
+def test_normalize_str_to_ascii_folds_latin_extended_accents() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        "col_name": ["Surucuçu", "São Paulo", "Łódź", "Ærø", "Ñandú", None]
+    })
+
+    StringUtils.normalize_str(
+        dataframe=df,
+        column_name="col_name",
+        to_ASCII=True,
+        inplace=True,
+        show_log=False
+    )
+
+    expected: list = ["Surucucu", "Sao Paulo", "Lodz", "Æro", "Nandu", None]
+
+    assert (df["col_name"].to_arrow().to_pylist() == expected)
+
+
+def test_translate_maps_and_removes_characters() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({"col_name": ["1.234,56", "0,99", "10"]})
+
+    StringUtils.translate(
+        dataframe=df,
+        column_name="col_name",
+        translate_table=build_translate_table({".": None, ",": "."}),
+        inplace=True
+    )
+
+    assert (df["col_name"].to_arrow().to_pylist() == ["1234.56", "0.99", "10"])
+
+
+def test_normalize_fuses_spaces_case_ascii_and_nulls() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        "col_name": ["  São   Paulo ", "NULL", " n/a ", "Ñandú", "sem dado", None]
+    })
+
+    result: cudf.DataFrame = StringUtils.normalize(
+        dataframe=df,
+        column_name="col_name",
+        to_case="lower",
+        to_ASCII=True,
+        null_values=["sem dado"],
+        inplace=False,
+        chunk_size=2,
+        show_log=False
+    )
+
+    expected: list = ["sao paulo", None, None, "nandu", None, None]
+
+    assert (result["col_name"].to_arrow().to_pylist() == expected)
+    assert (df["col_name"].to_arrow().to_pylist()[0] == "  São   Paulo ")
+
+
+def test_to_category_uses_smallest_code_dtype() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        "col_name": ["car", "bus", "bike", None] * 1_000
+    })
+
+    result: cudf.DataFrame = StringUtils.to_category(
+        dataframe=df,
+        column_name="col_name",
+        show_log=False
+    )
+
+    assert (str(result["col_name"].dtype) == "category")
+    assert (str(result["col_name"].cat.codes.dtype) == "int8")
+    assert (result["col_name"].dtype.ordered == False)
+    assert (result["col_name"].astype("str").to_arrow().to_pylist()[:4] == ["car", "bus", "bike", None])
+    assert (str(df["col_name"].dtype) == "object")
+
+
+def test_to_category_orders_categories_when_requested() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({"col_name": ["car", "bus", "bike"] * 1_000})
+
+    result: cudf.DataFrame = StringUtils.to_category(
+        dataframe=df,
+        column_name="col_name",
+        ordered=True,
+        show_log=False
+    )
+
+    assert (result["col_name"].dtype.ordered == True)
+    assert (result["col_name"].cat.categories.to_arrow().to_pylist() == ["bike", "bus", "car"])
+
+
+def test_to_category_rejects_when_not_smaller_than_strings() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        "col_name": [f"id_{index}" for index in range(1_000)]
+    })
+
+    assert (StringUtils.to_category(dataframe=df, column_name="col_name", show_log=False) == False)
+
+
+def test_to_category_estimates_cardinality_on_first_chunk() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        "col_name": [f"id_{index:06d}" for index in range(20_000)] + ["car", "bus"] * 40_000
+    })
+
+    # O primeiro chunk só tem IDs únicos, mas a coluna inteira ocupa menos
+    # memória como categoria: a amostra não pode rejeitá-la
+    result: cudf.DataFrame = StringUtils.to_category(
+        dataframe=df,
+        column_name="col_name",
+        chunk_size=5_000,
+        show_log=False
+    )
+
+    assert (str(result["col_name"].dtype) == "category")
+    assert (str(result["col_name"].cat.codes.dtype) == "int16")
+
+    ids_df: cudf.DataFrame = cudf.DataFrame({
+        "col_name": [f"id_{index:06d}" for index in range(20_000)]
+    })
+
+    assert (StringUtils.to_category(dataframe=ids_df, column_name="col_name", chunk_size=5_000, show_log=False) == False)
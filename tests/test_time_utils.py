@@ -0,0 +1,74 @@
+from jiboia_gpu.time.time_utils import TimeUtils
+from jiboia_gpu.utils.metadata_utils import get_column_metadata
+import cudf
+
+
+COLUMN_NAME: str = "col_name"
+
+
+# ---- TESTS ---- #
+def test_parse_time_layouts_to_nanoseconds() -> None:
+    series: cudf.Series = cudf.Series([
+        "0130UTC",
+        "0540 UTC",
+        "20:23",
+        "10:12:12",
+        "07:32:12.1247",
+        "2560UTC",
+        "invalid",
+        None,
+    ])
+
+    expected: list = [
+        5_400_000_000_000,
+        20_400_000_000_000,
+        73_380_000_000_000,
+        36_732_000_000_000,
+        27_132_124_700_000,
+        None,
+        None,
+        None,
+    ]
+
+    assert (TimeUtils.parse_time(series, chunk_size=3).to_arrow().to_pylist() == expected)
+
+
+def test_normalize_keeps_fractions() -> None:
+    df: cudf.DataFrame = cudf.DataFrame({
+        COLUMN_NAME: ["00:00:01.5", "23:59:59", "12:00", None]
+    })
+
+    TimeUtils.normalize(
+        dataframe=df,
+        column_name=COLUMN_NAME,
+        inplace=True,
+        show_log=False
+    )
+
+    assert (str(df[COLUMN_NAME].dtype) == "timedelta64[ms]")
+    assert (df[COLUMN_NAME].astype("int64").to_arrow().to_pylist() == [1_500, 86_399_000, 43_200_000, None])
+    assert (get_column_metadata(df, COLUMN_NAME)["resolution"] == "ms")
+
+
+def test_parse_time_am_pm_and_days() -> None:
+    series: cudf.Series = cudf.Series([
+        "12 AM",
+        "9 PM",
+        "10:30 a.m.",
+        "12:00:01.5PM",
+        "13:00 PM",
+        "3 days 04:05:06",
+        "1 day 00:00:00.25",
+    ])
+
+    expected: list = [
+        0,
+        75_600_000_000_000,
+        37_800_000_000_000,
+        43_201_500_000_000,
+        None,
+        273_906_000_000_000,
+        86_400_250_000_000,
+    ]
+
+    assert (TimeUtils.parse_time(series).to_arrow().to_pylist() == expected)